@@ -0,0 +1,11 @@
+"""
+Benchmarks for the OPLang compiler.
+Each module is a standalone script run from the project root after
+`make build`, e.g. `python -m benchmarks.bench_deep_lists`.
+"""
+
+import os
+import sys
+
+# The generated lexer imports `lexererr` as a top-level module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "build"))
@@ -0,0 +1,79 @@
+"""
+Loading a saved binary AST file versus reparsing the source.
+
+For each generated program size, the program is parsed and its AST saved
+with `save_ast`. The benchmark then times:
+
+- reparse: `direct_source_to_ast` on the source text, the fastest parse path
+- load: mapping the AST file, the first and only step before scans can run
+- load+find: loading, then finding every MethodCall to `sum`
+- load+tree: loading, then building the whole object tree
+
+Each figure is the best of several runs. File sizes are reported too.
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from src.parsing import direct_source_to_ast
+from src.utils.ast_file import load_ast, save_ast
+from src.utils.nodes import MethodCall
+
+from .programs import mixed_program
+
+
+def best_time(run, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_only(path):
+    load_ast(path).close()
+
+
+def load_and_find(path):
+    with load_ast(path) as flat:
+        flat.find(MethodCall, "method_name", "sum")
+
+
+def load_and_build(path):
+    with load_ast(path) as flat:
+        flat.to_tree()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--classes", type=int, nargs="+", default=[100, 1000, 8000])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'classes':>8} {'src KiB':>8} {'ast KiB':>8} {'reparse':>8} "
+          f"{'load':>8} {'load+find':>10} {'load+tree':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "program.ast")
+        for classes in args.classes:
+            source = mixed_program(classes)
+            ast = direct_source_to_ast(source)
+            size = save_ast(ast, path)
+            with load_ast(path) as flat:
+                if str(flat.to_tree()) != str(ast):
+                    raise SystemExit(f"{classes}: the loaded AST differs from the parsed one")
+            del ast
+            reparse = best_time(lambda: direct_source_to_ast(source), args.repeat)
+            load = best_time(lambda: load_only(path), args.repeat)
+            find = best_time(lambda: load_and_find(path), args.repeat)
+            build = best_time(lambda: load_and_build(path), args.repeat)
+            print(f"{classes:>8} {len(source) / 2**10:>8.0f} {size / 2**10:>8.0f} {reparse:>8.3f} "
+                  f"{load:>8.4f} {find:>10.3f} {build:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
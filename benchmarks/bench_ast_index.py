@@ -0,0 +1,92 @@
+"""
+Memory and lookup cost of the node index on a large program.
+
+Builds the AST of a generated program of about a million nodes with the
+direct parser and indexes it with ASTIndex. Reports the time to build the
+index, its traced memory in total and per node, split into the id arrays,
+the node list and the node-to-id table, and the AST's own memory for
+comparison. Then it compares finding the enclosing method of sampled
+nodes through the index with searching for them from the Program root.
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from src.parsing import direct_source_to_ast
+from src.utils.ast_index import METHOD_CLASSES, ASTIndex
+
+from .bench_positions import NODES_PER_CLASS, all_nodes
+from .programs import mixed_program
+
+
+def search_enclosing_method(root, target):
+    """Enclosing method of `target` by walking from `root`, as without an index"""
+    stack = [(root, None)]
+    while stack:
+        node, method = stack.pop()
+        if isinstance(node, METHOD_CLASSES):
+            method = node
+        if node is target:
+            return method
+        for name in node._fields:
+            value = getattr(node, name)
+            for child in (value if type(value) is list else (value,)):
+                if hasattr(child, "_fields"):
+                    stack.append((child, method))
+    raise KeyError(target)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=1_000_000)
+    arg_parser.add_argument("--samples", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    source = mixed_program(args.nodes // NODES_PER_CLASS)
+    gc.collect()
+    tracemalloc.start()
+    ast = direct_source_to_ast(source)
+    gc.collect()
+    ast_bytes = tracemalloc.get_traced_memory()[0]
+    index = ASTIndex(ast)
+    gc.collect()
+    index_bytes = tracemalloc.get_traced_memory()[0] - ast_bytes
+    tracemalloc.stop()
+    del index
+    gc.collect()
+    start = time.perf_counter()
+    index = ASTIndex(ast)
+    build_seconds = time.perf_counter() - start
+
+    n = len(index)
+    arrays = sum(sys.getsizeof(a) for a in (index.parents, index.classes, index.methods))
+    node_list = sys.getsizeof(index.nodes)
+    id_map = index_bytes - arrays - node_list
+    print(f"nodes                 {n:>10}")
+    print(f"AST B/node            {ast_bytes / n:>10.1f}")
+    print(f"index build seconds   {build_seconds:>10.2f}")
+    print(f"index MiB             {index_bytes / 2**20:>10.1f}")
+    print(f"index B/node          {index_bytes / n:>10.1f}")
+    print(f"  id arrays B/node    {arrays / n:>10.1f}")
+    print(f"  node list B/node    {node_list / n:>10.1f}")
+    print(f"  id table B/node     {id_map / n:>10.1f}")
+
+    samples = random.Random(0).sample(all_nodes(ast), args.samples)
+    start = time.perf_counter()
+    found = [index.enclosing_method(node) for node in samples]
+    indexed = (time.perf_counter() - start) / len(samples)
+    start = time.perf_counter()
+    searched = [search_enclosing_method(ast, node) for node in samples]
+    walked = (time.perf_counter() - start) / len(samples)
+    if any(a is not b for a, b in zip(found, searched)):
+        raise SystemExit("the index and the search disagree")
+    print(f"enclosing method, indexed us   {indexed * 1e6:>10.2f}")
+    print(f"enclosing method, search ms    {walked * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Static checking of deep class hierarchies: precomputed index versus chain walks.
+
+Generates a program of `--chains` inheritance chains, each `--depth`
+classes deep. Every class declares an attribute and a method, and a method
+that reads the attribute and calls the method of its chain's root class
+and assigns `this` to a variable of the root class's type, so each class
+costs a depth-long member lookup and subtype test when walking the chain.
+
+Times `check_program` with the hierarchy index and with the old lookups,
+which walk the `parent` chain with a fresh visited set on every call, and
+the time spent building the index. Reports the best of several runs.
+"""
+
+import argparse
+import gc
+import time
+
+from src.parsing import direct_source_to_ast
+from src.semantics.static_checker import StaticChecker
+from src.utils.nodes import ClassType
+
+
+class WalkingChecker(StaticChecker):
+    """The lookups before the hierarchy index"""
+
+    def lookup_in_class_attrs(self, class_name, attr):
+        if self.currently_initializing_attr == attr and class_name == self.current_class:
+            return None
+        cur = class_name
+        visited = set()
+        while cur and cur not in visited:
+            visited.add(cur)
+            clsinfo = self.class_table.get(cur)
+            if clsinfo and attr in clsinfo.attributes:
+                return clsinfo.attributes[attr]
+            cur = clsinfo.parent if clsinfo else None
+        return None
+
+    def lookup_method(self, class_name, method_name):
+        cur = class_name
+        visited = set()
+        while cur and cur not in visited:
+            visited.add(cur)
+            clsinfo = self.class_table.get(cur)
+            if clsinfo and method_name in clsinfo.methods:
+                return clsinfo.methods[method_name]
+            cur = clsinfo.parent if clsinfo else None
+        return None
+
+    def is_subtype(self, sub, sup):
+        if isinstance(sub, ClassType) and isinstance(sup, ClassType):
+            sup_name = sup.class_name
+            cur = sub.class_name
+            visited = set()
+            while cur and cur not in visited:
+                if cur == sup_name:
+                    return True
+                visited.add(cur)
+                clsinfo = self.class_table.get(cur)
+                cur = clsinfo.parent if clsinfo else None
+            return False
+        return False
+
+
+def hierarchy_program(chains: int, depth: int) -> str:
+    lines = []
+    for k in range(chains):
+        for d in range(depth):
+            extends = f" extends C{k}_{d - 1}" if d else ""
+            lines += [
+                f"class C{k}_{d}{extends} {{",
+                f"    int a{d};",
+                f"    int m{d}() {{ return this.a{d}; }}",
+                f"    int use{d}() {{",
+                f"        C{k}_0 root := this;",
+                "        return this.a0 + this.m0() + root.a0;",
+                "    }",
+                "}",
+            ]
+    lines.append("class Main { static void main() {} }")
+    return "\n".join(lines) + "\n"
+
+
+def best_time(run, repeat: int, setup=lambda: None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def unindexed_checker(ast) -> StaticChecker:
+    checker = StaticChecker()
+    checker._build_class_table(ast)
+    checker._add_io_class()
+    return checker
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--chains", type=int, default=20)
+    arg_parser.add_argument("--depth", type=int, default=50)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    ast = direct_source_to_ast(hierarchy_program(args.chains, args.depth))
+    walking = best_time(lambda _: WalkingChecker().check_program(ast), args.repeat)
+    indexed = best_time(lambda _: StaticChecker().check_program(ast), args.repeat)
+    build = best_time(StaticChecker._index_class_hierarchy, args.repeat, lambda: unindexed_checker(ast))
+
+    print(f"classes {args.chains * args.depth}, depth {args.depth}")
+    print(f"{'check, walking lookups':<24} {walking:>8.3f} s")
+    print(f"{'check, indexed':<24} {indexed:>8.3f} s")
+    print(f"{'  of which index build':<24} {build:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Scaling of the class table build on wide and deep inheritance hierarchies.
+
+For each size, builds a Program of classes, each with one attribute and
+one method, in two shapes:
+
+- wide: every class extends the first one
+- deep: one chain, each class extending the one declared before it
+
+and times `_build_class_table`, which includes the check that each class
+extends one declared before it, and `_index_class_hierarchy`. Reports the
+best of several runs in microseconds per class. The table build should
+stay flat per class as the size grows. Indexing grows with depth, because each class's
+flattened member maps copy its parent's.
+"""
+
+import argparse
+import gc
+import time
+
+from src.semantics.static_checker import StaticChecker
+from src.utils.nodes import (
+    Attribute,
+    AttributeDecl,
+    BlockStatement,
+    ClassDecl,
+    MethodDecl,
+    PrimitiveType,
+    Program,
+)
+
+INT = PrimitiveType("int")
+
+
+def class_decl(i: int, parent) -> ClassDecl:
+    members = [
+        AttributeDecl(False, False, INT, [Attribute(f"a{i}")]),
+        MethodDecl(False, INT, f"m{i}", [], BlockStatement([], [])),
+    ]
+    return ClassDecl(f"C{i}", parent, members)
+
+
+def hierarchy(shape: str, n: int) -> Program:
+    if shape == "wide":
+        decls = [class_decl(i, "C0" if i else None) for i in range(n)]
+    else:
+        decls = [class_decl(i, f"C{i - 1}" if i else None) for i in range(n)]
+    return Program(decls)
+
+
+def build_table(ast: Program) -> StaticChecker:
+    checker = StaticChecker()
+    checker._build_class_table(ast)
+    checker._add_io_class()
+    return checker
+
+
+def best_time(run, repeat: int, setup=lambda: None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'shape':>15} {'classes':>8} {'table us/class':>15} {'index us/class':>15}")
+    for shape in ("wide", "deep"):
+        for n in args.sizes:
+            ast = hierarchy(shape, n)
+            checker = build_table(ast)
+            checker._index_class_hierarchy()
+            if checker.ancestors(f"C{n - 1}")[-1] != "C0" or "a0" not in checker.class_table[f"C{n - 1}"].all_attributes:
+                raise SystemExit(f"{shape} {n}: C{n - 1} does not inherit from C0")
+            del checker
+            table = best_time(lambda _: build_table(ast), args.repeat)
+            index = best_time(StaticChecker._index_class_hierarchy, args.repeat, lambda: build_table(ast))
+            print(f"{shape:>15} {n:>8} {table / n * 1e6:>15.1f} {index / n * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Stress benchmark for flat list rules in the grammar and ASTGeneration.
+
+Parses and generates the AST for methods with up to 100k statements while
+the recursion limit is pinned to a small constant, so any rule that still
+recursed once per list element would raise RecursionError. Reports the
+per-statement cost at each size, which stays flat when the work is linear.
+"""
+
+import argparse
+import sys
+import time
+
+from antlr4 import CommonTokenStream, InputStream
+
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+
+from .programs import statements_program
+
+RECURSION_LIMIT = 400
+
+
+def source_to_ast(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parser.program())
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[12500, 25000, 50000, 100000])
+    args = arg_parser.parse_args()
+
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(RECURSION_LIMIT)
+    try:
+        print(f"recursion limit pinned at {RECURSION_LIMIT}")
+        print(f"{'statements':>12} {'seconds':>10} {'us/stmt':>10}")
+        for n in args.sizes:
+            source = statements_program(n)
+            start = time.perf_counter()
+            ast = source_to_ast(source)
+            elapsed = time.perf_counter() - start
+            body = ast.class_decls[0].members[0].body
+            assert len(body.statements) == n
+            print(f"{n:>12} {elapsed:>10.2f} {elapsed / n * 1e6:>10.1f}")
+    finally:
+        sys.setrecursionlimit(old_limit)
+
+
+if __name__ == "__main__":
+    main()
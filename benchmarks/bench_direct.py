@@ -0,0 +1,68 @@
+"""
+Source-to-AST time and memory: parse tree plus ASTGeneration versus DirectParser.
+
+The two-phase path builds the whole ANTLR parse tree and then visits it to
+build the AST; `direct_source_to_ast` builds the AST while parsing. Both
+run on the same lexer. For each generated program this checks that the
+two ASTs print identically, then reports the best of several end-to-end
+runs and the peak traced memory of one run.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.parsing import direct_source_to_ast, source_to_ast
+
+from .programs import expressions_program, mixed_program
+
+
+PROGRAMS = {
+    "mixed": mixed_program,
+    "expressions": expressions_program,
+}
+
+
+def best_time(convert, source: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        convert(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(convert, source: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    convert(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--program", choices=sorted(PROGRAMS), nargs="+", default=sorted(PROGRAMS))
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200],
+                            help="classes for 'mixed', hundreds of statements for 'expressions'")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'program':>12} {'size':>6} {'KiB':>7} {'path':>9} {'seconds':>8} {'peak MiB':>9}")
+    for name in args.program:
+        for size in args.sizes:
+            source = PROGRAMS[name](size if name == "mixed" else size * 100)
+            if str(source_to_ast(source)) != str(direct_source_to_ast(source)):
+                raise SystemExit(f"{name} {size}: the two paths built different ASTs")
+            for path, convert in (("two-phase", source_to_ast), ("direct", direct_source_to_ast)):
+                seconds = best_time(convert, source, args.repeat)
+                peak = peak_memory(convert, source)
+                print(f"{name:>12} {size:>6} {len(source) / 2**10:>7.0f} {path:>9} "
+                      f"{seconds:>8.2f} {peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Time to find every static error: one collecting check versus fix-and-rerun.
+
+Generates a program of `mixed_class` classes and seeds a type error into
+the `sum` method of evenly spread classes. Then times:
+
+- iterative: parse and `check_program`, remove the seeded error it
+  reports, and repeat until the program checks, as when fixing errors one
+  compiler run at a time
+- collect: parse once and `collect_errors`
+
+Checks that both find exactly the seeded errors, and reports the runs
+and seconds each took.
+"""
+
+import argparse
+import re
+import time
+
+from src.parsing import direct_source_to_ast
+from src.semantics.static_checker import StaticChecker
+from src.semantics.static_error import StaticError
+
+from .programs import MAIN_CLASS, mixed_class
+
+SEED = re.compile(r"seed(\d+)")
+
+
+def seeded_program(n_classes: int, seeds: set) -> str:
+    """`n_classes` mixed classes, class `c` with a type error in `sum` if `c` is in `seeds`."""
+    parts = []
+    for c in range(n_classes):
+        text = mixed_class(c)
+        if c in seeds:
+            text = text.replace("int i, total := 0;\n",
+                                'int i, total := 0;\n        total := "seed%d";\n' % c)
+        parts.append(text)
+    return "".join(parts) + MAIN_CLASS
+
+
+def fix_and_rerun(n_classes: int, seeds: set):
+    """Seeds found one check at a time, and the number of runs taken."""
+    remaining, found, runs = set(seeds), [], 0
+    while True:
+        runs += 1
+        try:
+            StaticChecker().check_program(direct_source_to_ast(seeded_program(n_classes, remaining)))
+            return found, runs
+        except StaticError as error:
+            seed = int(SEED.search(str(error)).group(1))
+            found.append(seed)
+            remaining.discard(seed)
+
+
+def collect(n_classes: int, seeds: set):
+    errors = StaticChecker().collect_errors(direct_source_to_ast(seeded_program(n_classes, seeds)))
+    return [int(SEED.search(str(error)).group(1)) for error in errors], 1
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--classes", type=int, default=400)
+    arg_parser.add_argument("--errors", type=int, nargs="+", default=[1, 10, 50])
+    args = arg_parser.parse_args()
+
+    print(f"{'classes':>8} {'errors':>7} {'mode':>10} {'runs':>5} {'seconds':>8}")
+    for n_errors in args.errors:
+        seeds = set(range(0, args.classes, args.classes // n_errors)[:n_errors])
+        for mode, run in (("iterative", fix_and_rerun), ("collect", collect)):
+            start = time.perf_counter()
+            found, runs = run(args.classes, seeds)
+            elapsed = time.perf_counter() - start
+            if sorted(found) != sorted(seeds):
+                raise SystemExit(f"{mode}: found {sorted(found)}, seeded {sorted(seeds)}")
+            print(f"{args.classes:>8} {n_errors:>7} {mode:>10} {runs:>5} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
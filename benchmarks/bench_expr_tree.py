@@ -0,0 +1,62 @@
+"""
+Parse-tree size and memory for expression-heavy programs.
+
+Every operand used to descend through one parse-tree context per precedence
+level; with a single left-recursive operand rule a literal costs one context
+plus one per operator applied to it. Reports rule contexts per statement,
+peak traced memory while parsing, and parse plus AST generation time.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from antlr4 import ParserRuleContext
+
+from src.astgen.ast_generation import ASTGeneration
+from src.parsing import create_parser, two_stage_parse
+
+from .programs import expressions_program
+
+
+def count_contexts(tree) -> int:
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParserRuleContext):
+            count += 1
+            if node.children:
+                stack.extend(node.children)
+    return count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000])
+    args = arg_parser.parse_args()
+
+    print(f"{'statements':>12} {'contexts':>10} {'ctx/stmt':>9} {'peak MiB':>9} {'parse s':>8} {'ast s':>7}")
+    for n in args.sizes:
+        source = expressions_program(n)
+        gc.collect()
+        tracemalloc.start()
+        tree = two_stage_parse(create_parser(source))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        two_stage_parse(create_parser(source))
+        parse_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        ASTGeneration().visit(tree)
+        ast_seconds = time.perf_counter() - start
+
+        contexts = count_contexts(tree)
+        print(f"{n:>12} {contexts:>10} {contexts / n:>9.1f} {peak / 2**20:>9.1f} "
+              f"{parse_seconds:>8.2f} {ast_seconds:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Whole-program scans over the object AST versus the flat, array-backed AST.
+
+Builds the AST of a generated program with the direct parser and encodes it
+as a FlatAST. Then it runs two analyses both ways and checks that both
+ways agree:
+
+- find every MethodCall to `sum`;
+- count the nodes of each class.
+
+The object version walks the tree with an explicit stack. The flat version
+scans the kind and field arrays. Reports the best of several runs of each,
+the conversion times, and the traced memory of the two representations.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections import Counter
+
+from src.parsing import direct_source_to_ast
+from src.utils.flat import KINDS, FlatAST
+from src.utils.nodes import ASTNode, MethodCall
+
+from .bench_positions import NODES_PER_CLASS
+from .programs import mixed_program
+
+
+def tree_calls(root, name: str) -> list:
+    calls = []
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            if type(item) is MethodCall and item.method_name == name:
+                calls.append(item)
+            stack.extend(getattr(item, field) for field in item._fields)
+        elif isinstance(item, list):
+            stack.extend(item)
+    return calls
+
+
+def tree_counts(root) -> Counter:
+    counts = Counter()
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            counts[type(item)] += 1
+            stack.extend(getattr(item, field) for field in item._fields)
+        elif isinstance(item, list):
+            stack.extend(item)
+    return counts
+
+
+def flat_counts(flat: FlatAST) -> Counter:
+    return Counter({KINDS[code]: count for code, count in
+                    enumerate(map(bytes(flat.kinds).count, (bytes([c]) for c in range(len(KINDS)))))
+                    if count})
+
+
+def best_time(run, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=1_000_000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    source = mixed_program(args.nodes // NODES_PER_CLASS)
+    ast, tree_bytes = traced(lambda: direct_source_to_ast(source))
+    encode_seconds, _ = best_time(lambda: FlatAST.from_tree(ast), 1)
+    flat, flat_bytes = traced(lambda: FlatAST.from_tree(ast))
+    decode_seconds, rebuilt = best_time(lambda: flat.to_tree(), 1)
+    if str(rebuilt) != str(ast):
+        raise SystemExit("the flat AST did not convert back to the same tree")
+
+    print(f"nodes               {len(flat):>10}")
+    print(f"object AST MiB      {tree_bytes / 2**20:>10.1f}")
+    print(f"flat AST MiB        {flat_bytes / 2**20:>10.1f}")
+    print(f"from_tree seconds   {encode_seconds:>10.3f}")
+    print(f"to_tree seconds     {decode_seconds:>10.3f}")
+    print()
+    print(f"{'analysis':>16} {'tree s':>8} {'flat s':>8} {'speedup':>8}")
+    analyses = (
+        ("calls to sum", lambda: len(tree_calls(ast, "sum")),
+         lambda: len(flat.find(MethodCall, "method_name", "sum"))),
+        ("count by class", lambda: tree_counts(ast), lambda: flat_counts(flat)),
+    )
+    for name, on_tree, on_flat in analyses:
+        tree_seconds, tree_result = best_time(on_tree, args.repeat)
+        flat_seconds, flat_result = best_time(on_flat, args.repeat)
+        if tree_result != flat_result:
+            raise SystemExit(f"{name}: the two representations disagree")
+        print(f"{name:>16} {tree_seconds:>8.3f} {flat_seconds:>8.3f} {tree_seconds / flat_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Node-count and memory reduction from hash-consing pure expressions.
+
+Parses every program embedded in tests/test_checker.py, plus a generated
+program, and builds each AST twice with ASTGeneration: once as usual and
+once with `hash_cons=True`. Checks that the two ASTs are structurally
+equal, then reports for each corpus:
+
+- nodes: counted once per mention in the tree
+- distinct node objects without and with hash-consing (types are always shared)
+- retained traced memory of the built ASTs without and with hash-consing
+- build time without and with hash-consing, best of several runs
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.astgen.ast_generation import ASTGeneration
+from src.parsing import parse_source
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import ASTNode
+
+from .bench_positions import all_nodes
+from .programs import checker_corpus, mixed_program
+
+
+def mentions(root) -> int:
+    count, stack = 0, [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            count += 1
+            stack.extend(getattr(item, name) for name in item._fields)
+        elif isinstance(item, list):
+            stack.extend(item)
+    return count
+
+
+def parse_trees(sources: list) -> list:
+    trees = []
+    for source in sources:
+        try:
+            trees.append(parse_source(source, NewErrorListener.INSTANCE))
+        except Exception:
+            pass  # programs with syntax errors have no AST
+    return trees
+
+
+def build(trees: list, hash_cons: bool) -> list:
+    return [ASTGeneration(hash_cons=hash_cons).visit(tree) for tree in trees]
+
+
+def retained_memory(trees: list, hash_cons: bool):
+    gc.collect()
+    tracemalloc.start()
+    asts = build(trees, hash_cons)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return asts, retained
+
+
+def best_time(trees: list, hash_cons: bool, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        build(trees, hash_cons)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--classes", type=int, default=200, help="classes in the generated program")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    corpora = {
+        "checker tests": parse_trees(checker_corpus()),
+        "mixed": parse_trees([mixed_program(args.classes)]),
+    }
+    print(f"{'corpus':>14} {'nodes':>8} {'distinct':>9} {'consed':>8} {'saved':>6} "
+          f"{'KiB':>7} {'consed KiB':>11} {'seconds':>8} {'consed s':>9}")
+    for name, trees in corpora.items():
+        plain, plain_bytes = retained_memory(trees, False)
+        consed, consed_bytes = retained_memory(trees, True)
+        plain_seconds = best_time(trees, False, args.repeat)
+        consed_seconds = best_time(trees, True, args.repeat)
+        if plain != consed:
+            raise SystemExit(f"{name}: hash-consing changed an AST")
+        nodes = sum(mentions(ast) for ast in plain)
+        distinct = sum(len(all_nodes(ast)) for ast in plain)
+        shared = sum(len(all_nodes(ast)) for ast in consed)
+        print(f"{name:>14} {nodes:>8} {distinct:>9} {shared:>8} {1 - shared / distinct:>6.1%} "
+              f"{plain_bytes / 2**10:>7.0f} {consed_bytes / 2**10:>11.0f} "
+              f"{plain_seconds:>8.3f} {consed_seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Lexer throughput: generated OPLangLexer versus the hand-written FastLexer.
+
+Tokenizes a multi-megabyte program with both lexers, keeping every token
+alive as CommonTokenStream does, checks that both produce the same token
+stream, and reports the best of several runs in tokens per second. With
+--no-gc the cyclic garbage collector is paused while lexing, which takes
+its traversals of the growing token list out of both measurements.
+"""
+
+import argparse
+import gc
+import time
+
+from antlr4 import InputStream, Token
+
+from build.OPLangLexer import OPLangLexer
+from src.parsing import FastLexer
+
+from .programs import mixed_program
+
+
+def drain(lexer) -> list:
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        tokens.append(token)
+        if token.type == Token.EOF:
+            return tokens
+
+
+def signature(tokens: list) -> str:
+    """Types, texts and positions of `tokens` as one string, cheap to keep across runs."""
+    return "\n".join(f"{t.type} {t.line}:{t.column} {t.start}-{t.stop} {t.text}" for t in tokens)
+
+
+def best_time(make_lexer, repeat: int, pause_gc: bool):
+    best, tokens = None, None
+    for _ in range(repeat):
+        tokens = None
+        gc.collect()
+        if pause_gc:
+            gc.disable()
+        try:
+            start = time.perf_counter()
+            tokens = drain(make_lexer())
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return tokens, best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--megabytes", type=float, default=2.0)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--no-gc", action="store_true", help="pause the garbage collector while lexing")
+    args = arg_parser.parse_args()
+
+    unit = mixed_program(1)
+    source = unit * max(1, int(args.megabytes * 2**20 / len(unit)))
+    print(f"source: {len(source) / 2**20:.1f} MiB")
+
+    results = {}
+    for name, make_lexer in (("OPLangLexer", lambda: OPLangLexer(InputStream(source))),
+                             ("FastLexer", lambda: FastLexer(source))):
+        tokens, elapsed = best_time(make_lexer, args.repeat, args.no_gc)
+        print(f"{name:>12} {len(tokens):>10} tokens {elapsed:>8.2f}s {len(tokens) / elapsed:>12.0f} tokens/s")
+        results[name] = (signature(tokens), elapsed)
+        del tokens
+
+    assert results["OPLangLexer"][0] == results["FastLexer"][0], "token streams differ"
+    print(f"speed-up: {results['OPLangLexer'][1] / results['FastLexer'][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Peak memory and startup time of `MmapCharStream` versus `InputStream`.
+
+Writes a generated program of each size to a temporary file and, in a
+fresh child process per input, opens it either as `InputStream(file.read())`
+or as `MmapCharStream(path)`. Startup is the time until the first token is
+available; the lexer is then run to EOF without keeping its tokens, so the
+peak RSS measures the character stream rather than the token buffer or the
+parse tree. With --unicode, every class carries a non-ASCII comment, which
+takes the stream off its ASCII fast path.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from antlr4 import InputStream, Token
+
+from src.parsing import FastLexer, MmapCharStream
+
+from .programs import mixed_class, MAIN_CLASS
+
+
+def run_child(mode: str, path: str):
+    """Lex `path` in this process and print startup and total seconds, token count and peak RSS in KiB."""
+    start = time.perf_counter()
+    if mode == "mmap":
+        stream = MmapCharStream(path)
+    else:
+        with open(path, encoding="utf-8") as file:
+            stream = InputStream(file.read())
+    lexer = FastLexer(stream)
+    tokens = 1
+    token = lexer.nextToken()
+    startup = time.perf_counter() - start
+    while token.type != Token.EOF:
+        token = lexer.nextToken()
+        tokens += 1
+    elapsed = time.perf_counter() - start
+    print(startup, elapsed, tokens, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def measure(mode: str, path: str):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_mmap", "--child", mode, path],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+    return float(output[0]), float(output[1]), int(output[2]), int(output[3])
+
+
+def write_program(file, n_bytes: int, unicode: bool) -> int:
+    """Write classes from `mixed_class` to `file` until about `n_bytes` are written; returns the size in bytes."""
+    written, c = 0, 0
+    while written < n_bytes:
+        text = mixed_class(c)
+        if unicode:
+            text = "# lớp số %d\n" % c + text
+        written += len(text.encode("utf-8"))
+        file.write(text)
+        c += 1
+    file.write(MAIN_CLASS)
+    return written + len(MAIN_CLASS)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--megabytes", type=float, nargs="+", default=[10.0, 100.0])
+    arg_parser.add_argument("--unicode", action="store_true", help="add a non-ASCII comment to every class")
+    arg_parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    if args.child:
+        run_child(*args.child)
+        return
+
+    print(f"{'MiB':>8} {'stream':>8} {'startup s':>10} {'total s':>9} {'tokens':>10} {'peak RSS MiB':>13}")
+    for megabytes in args.megabytes:
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".op", delete=False) as file:
+            size = write_program(file, int(megabytes * 2**20), args.unicode)
+        try:
+            for mode in ("input", "mmap"):
+                startup, elapsed, tokens, max_rss = measure(mode, file.name)
+                print(f"{size / 2**20:>8.1f} {mode:>8} {startup:>10.3f} {elapsed:>9.1f} {tokens:>10} "
+                      f"{max_rss / 2**10:>13.1f}")
+        finally:
+            os.unlink(file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Memory footprint of the AST of a generated program of about a million nodes.
+
+Builds the AST with the direct parser under tracemalloc and reports the
+total traced size (nodes plus the lists, strings and numbers they hold) and
+bytes per node, then the instance size of each node class that occurs,
+with its count.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections import Counter
+
+from src.parsing import direct_source_to_ast
+
+from .bench_positions import NODES_PER_CLASS, all_nodes
+from .programs import mixed_program
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=1_000_000)
+    args = arg_parser.parse_args()
+
+    source = mixed_program(args.nodes // NODES_PER_CLASS)
+    gc.collect()
+    tracemalloc.start()
+    ast = direct_source_to_ast(source)
+    gc.collect()
+    total = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    nodes = all_nodes(ast)
+    print(f"nodes            {len(nodes):>12}")
+    print(f"AST MiB          {total / 2**20:>12.1f}")
+    print(f"AST bytes/node   {total / len(nodes):>12.1f}")
+    print()
+    print(f"{'class':>26} {'count':>9} {'instance bytes':>15}")
+    sizes = {}
+    for node in nodes:
+        sizes.setdefault(type(node), sys.getsizeof(node))
+    for cls, count in Counter(type(node) for node in nodes).most_common():
+        print(f"{cls.__name__:>26} {count:>9} {sizes[cls]:>15}")
+
+
+if __name__ == "__main__":
+    main()
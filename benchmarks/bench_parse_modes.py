@@ -0,0 +1,51 @@
+"""
+Parse throughput of full-LL versus two-stage (SLL, then LL) prediction.
+
+Runs every program of the tests/test_checker.py corpus through both modes
+and reports lines per second. Syntax-error listeners are silenced so that
+the handful of intentionally malformed programs only cost parse time.
+"""
+
+import argparse
+import time
+
+from antlr4.error.ErrorListener import ErrorListener
+
+from src.parsing import create_parser, ll_parse, two_stage_parse
+
+from .programs import checker_corpus
+
+
+def run(corpus, parse, rounds):
+    lines = sum(source.count("\n") + 1 for source in corpus) * rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for source in corpus:
+            try:
+                parse(create_parser(source, ErrorListener()))
+            except Exception:
+                pass  # lexer errors in the corpus
+    return lines / (time.perf_counter() - start)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    corpus = checker_corpus()
+    # Warm the shared DFA cache so neither mode pays for it in the timings
+    run(corpus, ll_parse, 1)
+    run(corpus, two_stage_parse, 1)
+
+    ll = run(corpus, ll_parse, args.rounds)
+    two_stage = run(corpus, two_stage_parse, args.rounds)
+    print(f"corpus: {len(corpus)} programs, {args.rounds} rounds")
+    print(f"{'mode':<12} {'lines/sec':>12}")
+    print(f"{'LL':<12} {ll:>12.0f}")
+    print(f"{'SLL -> LL':<12} {two_stage:>12.0f}")
+    print(f"speedup: {two_stage / ll:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
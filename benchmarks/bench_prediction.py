@@ -0,0 +1,50 @@
+"""
+Parse time and full-context prediction count on large generated programs.
+
+ANTLR falls back to full-context (LL) prediction whenever SLL lookahead
+cannot separate a decision's alternatives; with left-factored rules those
+fallbacks disappear. Reports parse throughput and the number of fallbacks
+for growing inputs, in both full-LL and two-stage mode.
+"""
+
+import argparse
+import time
+
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+from src.parsing import create_parser, ll_parse, two_stage_parse
+
+from .programs import mixed_program
+
+FULL_CONTEXT_CALLS = [0]
+
+
+def _count_full_context(simulate):
+    def wrapper(self, *args):
+        FULL_CONTEXT_CALLS[0] += 1
+        return simulate(self, *args)
+    return wrapper
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 800])
+    args = arg_parser.parse_args()
+
+    ParserATNSimulator.execATNWithFullContext = _count_full_context(
+        ParserATNSimulator.execATNWithFullContext)
+
+    print(f"{'classes':>8} {'lines':>8} {'mode':>10} {'seconds':>9} {'lines/sec':>10} {'full-ctx':>9}")
+    for n in args.sizes:
+        source = mixed_program(n)
+        lines = source.count("\n")
+        for name, parse in (("LL", ll_parse), ("SLL->LL", two_stage_parse)):
+            FULL_CONTEXT_CALLS[0] = 0
+            start = time.perf_counter()
+            parse(create_parser(source))
+            elapsed = time.perf_counter() - start
+            print(f"{n:>8} {lines:>8} {name:>10} {elapsed:>9.2f} {lines / elapsed:>10.0f} {FULL_CONTEXT_CALLS[0]:>9}")
+
+
+if __name__ == "__main__":
+    main()
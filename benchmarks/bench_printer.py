@@ -0,0 +1,81 @@
+"""
+Cost of printing an AST: the streaming printer versus recursive concatenation.
+
+Builds the AST of a generated program with the direct parser and times:
+
+- recursive: the old way, where each node's text is the concatenation of
+  its children's `str`, so text is copied once per enclosing node
+- str: `str(ast)`, the streaming printer collecting into a list
+- write: `ast.write` into an `io.StringIO`
+
+Then does the same for one deep expression chain, where the recursive way
+needs a raised recursion limit. Reports the best of several runs and checks
+that all three produce the same text.
+"""
+
+import argparse
+import gc
+import io
+import sys
+import time
+
+from src.parsing import direct_source_to_ast
+
+from .bench_positions import NODES_PER_CLASS
+from .programs import mixed_program
+
+
+def recursive_str(node) -> str:
+    return "".join(recursive_str(part) if hasattr(part, "_parts") else str(part)
+                   for part in node._parts())
+
+
+def write_to_buffer(node) -> str:
+    out = io.StringIO()
+    node.write(out)
+    return out.getvalue()
+
+
+def best_time(run, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def chain_program(n_terms: int) -> str:
+    terms = " + ".join(["1", "-2", "(3 * 4)", "x"] * (n_terms // 4))
+    return "class Main { static void main() { int x := 0; x := " + terms + "; io.writeInt(x); } }"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=200_000)
+    arg_parser.add_argument("--terms", type=int, default=4_000, help="terms in the deep chain")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    corpora = {
+        "mixed": direct_source_to_ast(mixed_program(args.nodes // NODES_PER_CLASS)),
+        "deep chain": direct_source_to_ast(chain_program(args.terms)),
+    }
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 10 * args.terms))
+    try:
+        print(f"{'tree':>10} {'MiB text':>9} {'recursive':>10} {'str':>8} {'write':>8}")
+        for name, ast in corpora.items():
+            text = str(ast)
+            if recursive_str(ast) != text or write_to_buffer(ast) != text:
+                raise SystemExit(f"{name}: the printers disagree")
+            times = [best_time(lambda: run(ast), args.repeat)
+                     for run in (recursive_str, str, write_to_buffer)]
+            print(f"{name:>10} {len(text) / 2**20:>9.1f} " + " ".join(f"{t:>8.3f}" for t in times))
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Local name lookup in deeply nested blocks: shadow stacks versus scope scans.
+
+Generates a class of `--methods` methods, each a chain of `--depth` nested
+blocks declaring `--locals` variables apiece. The innermost block of each
+level reads a variable of the outermost block and one of its own, so
+every read of an outer name passes through all the scopes in between
+when the scope stack is scanned.
+
+Times `check_program` with the symbol table's per-name shadow stacks and
+with the old table, which looks a name up by scanning the scopes from the
+innermost out, and times bare lookups of the outermost names with all
+blocks open. Reports the best of several runs.
+"""
+
+import argparse
+import gc
+import sys
+import time
+
+from src.parsing import direct_source_to_ast
+from src.semantics.static_checker import StaticChecker
+from src.semantics.symbol_table import LocalSymbol, SymbolTable
+
+
+class ScanningSymbolTable(SymbolTable):
+    """The table before shadow stacks"""
+
+    def exit_scope(self):
+        if self.scopes:
+            self.scopes.pop()
+
+    def truncate(self, depth):
+        del self.scopes[depth:]
+
+    def declare(self, name, symbol):
+        if not self.scopes:
+            self.enter_scope()
+        self.scopes[-1][name] = symbol
+
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+
+class ScanningChecker(StaticChecker):
+    def __init__(self):
+        super().__init__()
+        self.symbols = ScanningSymbolTable()
+
+
+def nested_program(methods: int, depth: int, n_locals: int) -> str:
+    lines = ["class Main {", "    static void main() { }"]
+    for m in range(methods):
+        lines.append(f"    int m{m}(int p) {{")
+        for d in range(depth):
+            names = ", ".join(f"v{d}_{i} := {i}" for i in range(n_locals))
+            lines += [f"{{ int {names};", f"v{d}_0 := v0_{d % n_locals} + p;"]
+        lines += ["}" * depth, "        return p;", "    }"]
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def best_time(run, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def open_scopes(table: SymbolTable, depth: int, n_locals: int):
+    symbol = LocalSymbol("int", False, True)
+    for d in range(depth):
+        table.enter_scope()
+        for i in range(n_locals):
+            table.declare(f"v{d}_{i}", symbol)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--methods", type=int, default=20)
+    arg_parser.add_argument("--depth", type=int, default=200)
+    arg_parser.add_argument("--locals", type=int, default=20)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 20 * args.depth))  # the checker recurses into each block
+    try:
+        ast = direct_source_to_ast(nested_program(args.methods, args.depth, args.locals))
+        print(f"methods {args.methods}, depth {args.depth}, "
+              f"locals per method {args.depth * args.locals}")
+        print(f"{'':>16} {'scan':>9} {'shadow':>9}")
+        scan = best_time(lambda: ScanningChecker().check_program(ast), args.repeat)
+        shadow = best_time(lambda: StaticChecker().check_program(ast), args.repeat)
+        print(f"{'check s':>16} {scan:>9.3f} {shadow:>9.3f}")
+    finally:
+        sys.setrecursionlimit(limit)
+
+    names = [f"v0_{i}" for i in range(args.locals)] * 1000
+    times = []
+    for table in (ScanningSymbolTable(), SymbolTable()):
+        open_scopes(table, args.depth, args.locals)
+        times.append(best_time(lambda: [table.lookup(name) for name in names], args.repeat))
+    print(f"{'outer lookup ns':>16} {times[0] / len(names) * 1e9:>9.0f} {times[1] / len(names) * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Peak memory of the streaming front end versus parsing the whole text.
+
+Writes generated programs of several sizes to temporary files and parses
+each one in a fresh child process, either streamed from the file one class
+at a time with `iter_class_decls` or read whole and parsed with
+`source_to_ast`. Each class's AST is dropped as soon as it is built, so
+the streamed peak RSS measures the front end alone and should stay flat as
+the program grows. The buffered run holds every token and the whole parse
+tree, so it is skipped above --buffered-limit megabytes. Streaming parses
+roughly 0.1 MB/s here; the 200 MB default takes over half an hour.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.parsing import iter_class_decls, source_to_ast
+
+from .programs import write_mixed_program
+
+
+def run_child(mode: str, path: str):
+    """Parse `path` in this process and print class count, seconds and peak RSS in KiB."""
+    start = time.perf_counter()
+    if mode == "stream":
+        with open(path) as file:
+            classes = sum(1 for _ in iter_class_decls(file))
+    else:
+        with open(path) as file:
+            classes = len(source_to_ast(file.read()).class_decls)
+    elapsed = time.perf_counter() - start
+    print(classes, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def measure(mode: str, path: str):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_streaming", "--child", mode, path],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+    return int(output[0]), float(output[1]), int(output[2])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--megabytes", type=float, nargs="+", default=[2.0, 20.0, 200.0])
+    arg_parser.add_argument("--buffered-limit", type=float, default=8.0,
+                            help="largest program, in MB, to also parse as one string")
+    arg_parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    if args.child:
+        run_child(*args.child)
+        return
+
+    print(f"{'MiB':>8} {'mode':>9} {'classes':>9} {'seconds':>9} {'peak RSS MiB':>13}")
+    for megabytes in args.megabytes:
+        with tempfile.NamedTemporaryFile("w", suffix=".op", delete=False) as file:
+            size = write_mixed_program(file, int(megabytes * 2**20))
+        try:
+            modes = ["stream"] + (["buffered"] if megabytes <= args.buffered_limit else [])
+            for mode in modes:
+                classes, elapsed, max_rss = measure(mode, file.name)
+                print(f"{size / 2**20:>8.1f} {mode:>9} {classes:>9} {elapsed:>9.1f} {max_rss / 2**10:>13.1f}")
+        finally:
+            os.unlink(file.name)
+
+
+if __name__ == "__main__":
+    main()
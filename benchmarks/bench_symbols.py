@@ -0,0 +1,173 @@
+"""
+Memory and lookup time of slotted symbols versus the dict entries they replaced.
+
+Builds the class table of a generated program, then a copy of it in the
+old layout: one dict per class, attribute, method and constructor with
+string keys such as "returnType" and "isStatic". Reports:
+
+- retained traced memory of each table, per symbol
+- memory of local symbols, per symbol, for a batch of locals created the
+  way `declare_local` creates them
+- time of the member lookups the checker does for `obj.attr` and
+  `obj.method()` (find the member, test `is_static`, read its type) and of
+  a local lookup (test `is_final`, read the type), best of several runs
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.parsing import direct_source_to_ast
+from src.semantics.static_checker import StaticChecker
+from src.semantics.symbol_table import LocalSymbol
+from src.utils.nodes import PrimitiveType
+
+from .bench_positions import NODES_PER_CLASS
+from .programs import mixed_program
+
+
+def field_dict(field):
+    return {"type": field.type, "isFinal": field.is_final, "isStatic": field.is_static, "init": field.init}
+
+
+def method_dict(method):
+    return {"returnType": method.return_type, "params": method.params, "isStatic": method.is_static}
+
+
+def class_dicts(table):
+    """`table` in the layout the checker used before symbols"""
+    result = {}
+    for name, info in table.items():
+        attributes = {key: field_dict(field) for key, field in info.attributes.items()}
+        methods = {key: method_dict(method) for key, method in info.methods.items()}
+        result[name] = {
+            "decl": info.decl, "parent": info.parent,
+            "attributes": attributes, "methods": methods,
+            "constructors": {key: method_dict(c) for key, c in info.constructors.items()},
+            "destructor": method_dict(info.destructor) if info.destructor else None,
+            "enter": info.enter, "exit": info.exit, "root_parent": info.root_parent,
+        }
+    for name, info in table.items():
+        # Inherited members are shared with the declaring class, as in the real table
+        result[name]["all_attributes"] = {
+            key: result[owner]["attributes"][key] for key, owner in owners(table, name, "attributes")}
+        result[name]["all_methods"] = {
+            key: result[owner]["methods"][key] for key, owner in owners(table, name, "methods")}
+    return result
+
+
+def owners(table, name, kind):
+    found = {}
+    while name in table:
+        for key in getattr(table[name], kind):
+            found.setdefault(key, name)
+        name = table[name].parent
+    return found.items()
+
+
+def symbol_table(ast):
+    checker = StaticChecker()
+    checker._build_class_table(ast)
+    checker._add_io_class()
+    checker._index_class_hierarchy()
+    return checker.class_table
+
+
+def retained(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def best_time(run, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def member_lookups_symbols(table, queries):
+    for class_name, attr, method in queries:
+        field = table[class_name].all_attributes.get(attr)
+        if field.is_static:
+            raise AssertionError
+        field.type
+        info = table[class_name].all_methods.get(method)
+        if info.is_static:
+            raise AssertionError
+        info.params
+        info.return_type
+
+
+def member_lookups_dicts(table, queries):
+    for class_name, attr, method in queries:
+        field = table[class_name]["all_attributes"].get(attr)
+        if field.get("isStatic", False):
+            raise AssertionError
+        field["type"]
+        info = table[class_name]["all_methods"].get(method)
+        if info.get("isStatic", False):
+            raise AssertionError
+        info.get("params", [])
+        info["returnType"]
+
+
+def local_lookups(symbols, names, is_dict):
+    if is_dict:
+        for name in names:
+            info = symbols[name]
+            if info.get("isFinal"):
+                raise AssertionError
+            info["type"]
+    else:
+        for name in names:
+            info = symbols[name]
+            if info.is_final:
+                raise AssertionError
+            info.type
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=500_000)
+    arg_parser.add_argument("--locals", type=int, default=200_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    ast = direct_source_to_ast(mixed_program(args.nodes // NODES_PER_CLASS))
+    symbols, symbols_bytes = retained(lambda: symbol_table(ast))
+    dicts, dicts_bytes = retained(lambda: class_dicts(symbols))
+    n_symbols = sum(1 + len(info.attributes) + len(info.methods) + len(info.constructors)
+                    + (info.destructor is not None) for info in symbols.values())
+
+    int_type = PrimitiveType("int")
+    names = [f"v{i}" for i in range(args.locals)]
+    local_symbols, local_symbols_bytes = retained(
+        lambda: {name: LocalSymbol(int_type, False, True) for name in names})
+    local_dicts, local_dicts_bytes = retained(
+        lambda: {name: {"type": int_type, "isFinal": False, "initialized": True} for name in names})
+
+    queries = [(f"Node{c}", "value", "sum") for c in range(len(symbols) - 2)] * 20
+    print(f"classes {len(symbols)}, class and member symbols {n_symbols}, locals {args.locals}")
+    print(f"{'':>28} {'dicts':>9} {'symbols':>9}")
+    print(f"{'class table B/symbol':>28} {dicts_bytes / n_symbols:>9.0f} {symbols_bytes / n_symbols:>9.0f}")
+    print(f"{'locals B/symbol':>28} {local_dicts_bytes / args.locals:>9.0f} "
+          f"{local_symbols_bytes / args.locals:>9.0f}")
+    dict_time = best_time(lambda: member_lookups_dicts(dicts, queries), args.repeat)
+    symbol_time = best_time(lambda: member_lookups_symbols(symbols, queries), args.repeat)
+    print(f"{'member lookup ns':>28} {dict_time / len(queries) * 1e9:>9.0f} {symbol_time / len(queries) * 1e9:>9.0f}")
+    dict_time = best_time(lambda: local_lookups(local_dicts, names, True), args.repeat)
+    symbol_time = best_time(lambda: local_lookups(local_symbols, names, False), args.repeat)
+    print(f"{'local lookup ns':>28} {dict_time / len(names) * 1e9:>9.0f} {symbol_time / len(names) * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
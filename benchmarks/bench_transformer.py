@@ -0,0 +1,80 @@
+"""
+Allocation of a copy-on-write ASTTransformer pass versus a deep copy.
+
+Builds the AST of a generated program with the direct parser, then runs a
+pass that renames every call to `writeIntLn` (one MethodCall per class,
+under 1% of the nodes). For the pass and for `copy.deepcopy` of the whole
+tree, reports the new node objects, the retained traced memory they take
+while the original tree is still alive, and the time taken.
+"""
+
+import argparse
+import copy
+import gc
+import sys
+import time
+import tracemalloc
+
+from src.parsing import direct_source_to_ast
+from src.utils.nodes import MethodCall
+from src.utils.visitor import ASTTransformer
+
+from .bench_positions import NODES_PER_CLASS, all_nodes
+from .programs import mixed_program
+
+
+class RenameWriteIntLn(ASTTransformer):
+    def transform_method_call(self, node):
+        if node.method_name != "writeIntLn":
+            return node
+        return MethodCall("writeInt", node.args).set_position(node.line, node.column, node.end)
+
+
+def measure(build):
+    """Result, retained traced bytes and untraced seconds of `build()`"""
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, retained, elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=200_000)
+    args = arg_parser.parse_args()
+
+    ast = direct_source_to_ast(mixed_program(args.nodes // NODES_PER_CLASS))
+    original = all_nodes(ast)
+    original_ids = {id(node) for node in original}
+    _, tree_bytes, _ = measure(lambda: direct_source_to_ast(mixed_program(args.nodes // NODES_PER_CLASS)))
+    renamed = sum(type(node) is MethodCall and node.method_name == "writeIntLn" for node in original)
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 10_000))  # deepcopy recurses once per level
+    try:
+        rows = (
+            ("transform", lambda: RenameWriteIntLn().transform(ast)),
+            ("deepcopy", lambda: copy.deepcopy(ast)),
+        )
+        print(f"nodes {len(original)}, rewritten {renamed} ({renamed / len(original):.2%}), "
+              f"tree {tree_bytes / 2**20:.1f} MiB")
+        print(f"{'pass':>10} {'new nodes':>10} {'share':>7} {'new KiB':>8} {'share':>7} {'seconds':>8}")
+        for name, run in rows:
+            result, retained, elapsed = measure(run)
+            new = sum(id(node) not in original_ids for node in all_nodes(result))
+            print(f"{name:>10} {new:>10} {new / len(original):>7.2%} {retained / 2**10:>8.0f} "
+                  f"{retained / tree_bytes:>7.2%} {elapsed:>8.3f}")
+            del result
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Type-node allocations saved by interning, over the checker test corpus.
+
+Builds the AST of every program embedded in tests/test_checker.py and runs
+the static checker on it, counting how many type nodes the parser and the
+checker ask for and how many distinct type nodes exist while the ASTs and
+checkers are alive.
+Without interning each request would have allocated a fresh node. Also
+reports the time to check the whole corpus.
+"""
+
+import argparse
+import time
+from collections import Counter
+
+from src.parsing import direct_source_to_ast
+from src.semantics.static_checker import StaticChecker
+from src.utils.nodes import InternedMeta, Type
+
+from .programs import checker_corpus
+
+
+def type_classes() -> list:
+    classes, stack = [], [Type]
+    while stack:
+        cls = stack.pop()
+        classes.append(cls)
+        stack.extend(cls.__subclasses__())
+    return classes
+
+
+def check_corpus(sources: list) -> list:
+    """The ASTs and checkers of `sources`, which keep their types interned"""
+    kept = []
+    for source in sources:
+        checker = StaticChecker()
+        try:
+            ast = direct_source_to_ast(source)
+            kept.append((checker, ast))
+            checker.check_program(ast)
+        except Exception:
+            pass
+    return kept
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    sources = checker_corpus()
+    requests = Counter()
+    call = InternedMeta.__call__
+
+    def counting_call(cls, *args, **kwargs):
+        requests[cls.__name__] += 1
+        return call(cls, *args, **kwargs)
+
+    for cls in type_classes():
+        cls._instances.clear()
+    InternedMeta.__call__ = counting_call
+    try:
+        kept = check_corpus(sources)
+    finally:
+        InternedMeta.__call__ = call
+
+    print(f"programs {len(sources)}")
+    print(f"{'class':>14} {'requested':>10} {'allocated':>10}")
+    for cls in type_classes()[1:]:
+        print(f"{cls.__name__:>14} {requests[cls.__name__]:>10} {len(cls._instances):>10}")
+    allocated = sum(len(cls._instances) for cls in type_classes())
+    print(f"{'total':>14} {sum(requests.values()):>10} {allocated:>10}")
+    del kept
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        check_corpus(sources)
+        best = min(best, time.perf_counter() - start)
+    print(f"parse+check seconds {best:.3f}")
+
+
+if __name__ == "__main__":
+    main()
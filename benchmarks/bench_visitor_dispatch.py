@@ -0,0 +1,98 @@
+"""
+Per-node cost of visitor dispatch: dispatch tables versus accept and getattr.
+
+Builds the AST of a generated program with the direct parser, then times:
+
+- walk: a full BaseVisitor traversal, dispatching through `node.accept`
+  (the old `ASTVisitor.visit`) and through the visitor's dispatch table;
+- checker-style: one call per node to a visitor with a no-op `visit<Class>`
+  method for every node class, found by building `f"visit{name}"` and a
+  `getattr` (the old `StaticChecker.visit`) and through the dispatch table.
+
+Reports the best of several runs in nanoseconds per node.
+"""
+
+import argparse
+import gc
+import time
+
+from src.parsing import direct_source_to_ast
+from src.utils.visitor import BaseVisitor, node_classes
+
+from .bench_positions import NODES_PER_CLASS, all_nodes
+from .programs import mixed_program
+
+
+class AcceptWalker(BaseVisitor):
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+class TableWalker(BaseVisitor):
+    pass
+
+
+def _no_op(self, node):
+    return None
+
+
+def _checker_dispatch_name(cls, node_class):
+    return f"visit{node_class.__name__}"
+
+
+# Named like StaticChecker's methods, one no-op `visit<Class>` per node class
+CheckerStyle = type("CheckerStyle", (BaseVisitor,), {
+    "dispatch_name": classmethod(_checker_dispatch_name),
+    **{f"visit{node_class.__name__}": _no_op for node_class in node_classes()},
+})
+
+
+def getattr_dispatch(visitor, nodes):
+    for node in nodes:
+        method = getattr(visitor, f"visit{node.__class__.__name__}", None)
+        if method:
+            method(node)
+
+
+def table_dispatch(visitor, nodes):
+    dispatch = visitor._dispatch
+    for node in nodes:
+        method = dispatch.get(type(node))
+        if method:
+            method(visitor, node)
+
+
+def best_time(run, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--nodes", type=int, default=200_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    ast = direct_source_to_ast(mixed_program(args.nodes // NODES_PER_CLASS))
+    nodes = all_nodes(ast)
+    visitor = CheckerStyle()
+    rows = (
+        ("walk", "accept", lambda: AcceptWalker().visit(ast)),
+        ("walk", "table", lambda: TableWalker().visit(ast)),
+        ("checker-style", "getattr", lambda: getattr_dispatch(visitor, nodes)),
+        ("checker-style", "table", lambda: table_dispatch(visitor, nodes)),
+    )
+    print(f"nodes {len(nodes)}")
+    print(f"{'visit':>14} {'dispatch':>9} {'seconds':>8} {'ns/node':>8}")
+    for name, dispatch, run in rows:
+        seconds = best_time(run, args.repeat)
+        print(f"{name:>14} {dispatch:>9} {seconds:>8.3f} {seconds / len(nodes) * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Synthetic OPLang program generators shared by the benchmark scripts.
+"""
+
+
+def statements_program(n_statements: int) -> str:
+    """A single `main` method containing `n_statements` assignments."""
+    lines = ["class Bench {", "    static void main() {", "        int x := 0;"]
+    lines.extend("        x := x + %d;" % (i % 7) for i in range(n_statements))
+    lines.extend(["    }", "}"])
+    return "\n".join(lines) + "\n"
+
+
+def members_program(n_members: int) -> str:
+    """A single class with `n_members` attributes and methods, plus `main`."""
+    lines = ["class Bench {"]
+    for i in range(n_members):
+        if i % 2:
+            lines.append("    int get%d() { return %d; }" % (i, i))
+        else:
+            lines.append("    int a%d := %d, b%d;" % (i, i, i))
+    lines.extend(["    static void main() {}", "}"])
+    return "\n".join(lines) + "\n"
+
+
+def expressions_program(n_statements: int) -> str:
+    """A single `main` method of assignments with long mixed-operator expressions."""
+    lines = ["class Bench {", "    static void main() {", "        int x := 0;"]
+    lines.extend(
+        "        x := (x + %d * a[%d] - b.c(1, 2.5) \\ 3) %% 7 + -y ^ \"s\" + (x == %d) < !done && z;"
+        % (i % 7, i % 5, i % 3)
+        for i in range(n_statements))
+    lines.extend(["    }", "}"])
+    return "\n".join(lines) + "\n"
+
+
+def checker_corpus() -> list:
+    """Every `source = \"\"\"...\"\"\"` program embedded in tests/test_checker.py."""
+    import ast
+    import os
+
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "test_checker.py")
+    with open(path, encoding="utf-8") as f:
+        module = ast.parse(f.read())
+    sources = []
+    for node in ast.walk(module):
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "source" for t in node.targets)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)):
+            sources.append(node.value.value)
+    return sources
+
+
+def mixed_class(c: int) -> str:
+    """Class `Node<c>` mixing constructors, if/for headers, calls and member assignments."""
+    lines = [
+        "class Node%d {" % c,
+        "    int value; float weight; Node%d next;" % c,
+        "    Node%d() { this.value := 0; }" % c,
+        "    Node%d(Node%d other) { this.value := other.value; }" % (c, c),
+        "    Node%d(int v; float w) { this.value := v; this.weight := w; }" % c,
+        "    int sum(int[10] data; int n) {",
+        "        int i, total := 0;",
+        "        for i := (0) to n - 1 do {",
+        "            if (data[i] > 0) && (i % 2 == 0) then total := total + data[i];",
+        "            else { total := total - 1; }",
+        "        }",
+        "        this.next.value := total;",
+        "        io.writeIntLn(this.sum(data, n - 1));",
+        "        return total * (this.value + 1);",
+        "    }",
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+MAIN_CLASS = "class Main {\n    static void main() {}\n}\n"
+
+
+def mixed_program(n_classes: int) -> str:
+    """`n_classes` classes from `mixed_class`, plus `Main`."""
+    return "".join(mixed_class(c) for c in range(n_classes)) + MAIN_CLASS
+
+
+def write_mixed_program(file, n_bytes: int) -> int:
+    """Write classes from `mixed_class` to `file` until about `n_bytes` are written; returns the size."""
+    written, c = 0, 0
+    while written < n_bytes:
+        written += file.write(mixed_class(c))
+        c += 1
+    return written + file.write(MAIN_CLASS)
@@ -0,0 +1,335 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,62,465,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,1,0,1,0,1,1,1,1,1,1,1,
+        1,5,1,134,8,1,10,1,12,1,137,9,1,1,1,1,1,1,1,3,1,142,8,1,1,1,1,1,
+        5,1,146,8,1,10,1,12,1,149,9,1,1,1,3,1,152,8,1,3,1,154,8,1,1,1,1,
+        1,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,
+        4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,
+        7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,
+        9,1,9,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,
+        1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,14,1,14,1,14,1,14,
+        1,14,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,17,1,17,1,17,
+        1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,
+        1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,22,
+        1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,24,1,24,1,24,
+        1,24,1,24,1,24,1,24,1,24,1,24,3,24,290,8,24,1,25,4,25,293,8,25,11,
+        25,12,25,294,1,26,4,26,298,8,26,11,26,12,26,299,1,26,1,26,5,26,304,
+        8,26,10,26,12,26,307,9,26,1,26,4,26,310,8,26,11,26,12,26,311,1,26,
+        1,26,4,26,316,8,26,11,26,12,26,317,1,26,1,26,1,26,3,26,323,8,26,
+        1,26,4,26,326,8,26,11,26,12,26,327,1,26,4,26,331,8,26,11,26,12,26,
+        332,1,26,1,26,1,26,3,26,338,8,26,1,26,4,26,341,8,26,11,26,12,26,
+        342,3,26,345,8,26,1,27,1,27,1,27,5,27,350,8,27,10,27,12,27,353,9,
+        27,1,27,1,27,1,27,1,28,1,28,1,28,1,29,1,29,1,30,1,30,1,31,1,31,1,
+        32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,38,1,
+        38,1,39,1,39,1,40,1,40,1,41,1,41,1,42,1,42,1,43,1,43,1,44,1,44,1,
+        45,1,45,1,46,1,46,1,46,1,47,1,47,1,47,1,48,1,48,1,49,1,49,1,49,1,
+        50,1,50,1,51,1,51,1,51,1,52,1,52,1,52,1,53,1,53,1,53,1,54,1,54,1,
+        55,1,55,1,55,1,55,1,56,1,56,1,57,1,57,1,57,1,58,1,58,5,58,430,8,
+        58,10,58,12,58,433,9,58,1,59,4,59,436,8,59,11,59,12,59,437,1,59,
+        1,59,1,60,1,60,1,61,1,61,1,61,5,61,447,8,61,10,61,12,61,450,9,61,
+        1,61,1,61,1,61,1,62,1,62,1,62,5,62,458,8,62,10,62,12,62,461,9,62,
+        1,62,3,62,464,8,62,1,135,0,63,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,
+        17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,
+        39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,0,59,29,
+        61,30,63,31,65,32,67,33,69,34,71,35,73,36,75,37,77,38,79,39,81,40,
+        83,41,85,42,87,43,89,44,91,45,93,46,95,47,97,48,99,49,101,50,103,
+        51,105,52,107,53,109,54,111,55,113,56,115,57,117,58,119,59,121,60,
+        123,61,125,62,1,0,11,2,0,10,10,13,13,1,1,10,10,1,0,48,57,2,0,69,
+        69,101,101,2,0,43,43,45,45,4,0,10,10,13,13,34,34,92,92,5,0,34,34,
+        92,92,98,98,102,102,116,116,3,0,65,90,95,95,97,122,4,0,48,57,65,
+        90,95,95,97,122,3,0,9,10,13,13,32,32,2,1,10,10,13,13,488,0,1,1,0,
+        0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,
+        0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,
+        0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,
+        0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,
+        0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,
+        0,53,1,0,0,0,0,55,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,
+        0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,
+        0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,
+        0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,
+        0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,
+        0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,
+        1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,0,0,0,
+        0,123,1,0,0,0,0,125,1,0,0,0,1,127,1,0,0,0,3,153,1,0,0,0,5,157,1,
+        0,0,0,7,163,1,0,0,0,9,171,1,0,0,0,11,175,1,0,0,0,13,181,1,0,0,0,
+        15,188,1,0,0,0,17,196,1,0,0,0,19,201,1,0,0,0,21,206,1,0,0,0,23,211,
+        1,0,0,0,25,218,1,0,0,0,27,224,1,0,0,0,29,227,1,0,0,0,31,232,1,0,
+        0,0,33,237,1,0,0,0,35,241,1,0,0,0,37,244,1,0,0,0,39,247,1,0,0,0,
+        41,253,1,0,0,0,43,262,1,0,0,0,45,269,1,0,0,0,47,276,1,0,0,0,49,289,
+        1,0,0,0,51,292,1,0,0,0,53,344,1,0,0,0,55,346,1,0,0,0,57,357,1,0,
+        0,0,59,360,1,0,0,0,61,362,1,0,0,0,63,364,1,0,0,0,65,366,1,0,0,0,
+        67,368,1,0,0,0,69,370,1,0,0,0,71,372,1,0,0,0,73,374,1,0,0,0,75,376,
+        1,0,0,0,77,378,1,0,0,0,79,380,1,0,0,0,81,382,1,0,0,0,83,384,1,0,
+        0,0,85,386,1,0,0,0,87,388,1,0,0,0,89,390,1,0,0,0,91,392,1,0,0,0,
+        93,394,1,0,0,0,95,397,1,0,0,0,97,400,1,0,0,0,99,402,1,0,0,0,101,
+        405,1,0,0,0,103,407,1,0,0,0,105,410,1,0,0,0,107,413,1,0,0,0,109,
+        416,1,0,0,0,111,418,1,0,0,0,113,422,1,0,0,0,115,424,1,0,0,0,117,
+        427,1,0,0,0,119,435,1,0,0,0,121,441,1,0,0,0,123,443,1,0,0,0,125,
+        454,1,0,0,0,127,128,5,126,0,0,128,2,1,0,0,0,129,130,5,47,0,0,130,
+        131,5,42,0,0,131,135,1,0,0,0,132,134,9,0,0,0,133,132,1,0,0,0,134,
+        137,1,0,0,0,135,136,1,0,0,0,135,133,1,0,0,0,136,141,1,0,0,0,137,
+        135,1,0,0,0,138,139,5,42,0,0,139,142,5,47,0,0,140,142,5,0,0,1,141,
+        138,1,0,0,0,141,140,1,0,0,0,142,154,1,0,0,0,143,147,5,35,0,0,144,
+        146,8,0,0,0,145,144,1,0,0,0,146,149,1,0,0,0,147,145,1,0,0,0,147,
+        148,1,0,0,0,148,151,1,0,0,0,149,147,1,0,0,0,150,152,7,1,0,0,151,
+        150,1,0,0,0,152,154,1,0,0,0,153,129,1,0,0,0,153,143,1,0,0,0,154,
+        155,1,0,0,0,155,156,6,1,0,0,156,4,1,0,0,0,157,158,5,99,0,0,158,159,
+        5,108,0,0,159,160,5,97,0,0,160,161,5,115,0,0,161,162,5,115,0,0,162,
+        6,1,0,0,0,163,164,5,101,0,0,164,165,5,120,0,0,165,166,5,116,0,0,
+        166,167,5,101,0,0,167,168,5,110,0,0,168,169,5,100,0,0,169,170,5,
+        115,0,0,170,8,1,0,0,0,171,172,5,105,0,0,172,173,5,110,0,0,173,174,
+        5,116,0,0,174,10,1,0,0,0,175,176,5,102,0,0,176,177,5,108,0,0,177,
+        178,5,111,0,0,178,179,5,97,0,0,179,180,5,116,0,0,180,12,1,0,0,0,
+        181,182,5,115,0,0,182,183,5,116,0,0,183,184,5,114,0,0,184,185,5,
+        105,0,0,185,186,5,110,0,0,186,187,5,103,0,0,187,14,1,0,0,0,188,189,
+        5,98,0,0,189,190,5,111,0,0,190,191,5,111,0,0,191,192,5,108,0,0,192,
+        193,5,101,0,0,193,194,5,97,0,0,194,195,5,110,0,0,195,16,1,0,0,0,
+        196,197,5,118,0,0,197,198,5,111,0,0,198,199,5,105,0,0,199,200,5,
+        100,0,0,200,18,1,0,0,0,201,202,5,109,0,0,202,203,5,97,0,0,203,204,
+        5,105,0,0,204,205,5,110,0,0,205,20,1,0,0,0,206,207,5,116,0,0,207,
+        208,5,104,0,0,208,209,5,105,0,0,209,210,5,115,0,0,210,22,1,0,0,0,
+        211,212,5,115,0,0,212,213,5,116,0,0,213,214,5,97,0,0,214,215,5,116,
+        0,0,215,216,5,105,0,0,216,217,5,99,0,0,217,24,1,0,0,0,218,219,5,
+        102,0,0,219,220,5,105,0,0,220,221,5,110,0,0,221,222,5,97,0,0,222,
+        223,5,108,0,0,223,26,1,0,0,0,224,225,5,105,0,0,225,226,5,102,0,0,
+        226,28,1,0,0,0,227,228,5,116,0,0,228,229,5,104,0,0,229,230,5,101,
+        0,0,230,231,5,110,0,0,231,30,1,0,0,0,232,233,5,101,0,0,233,234,5,
+        108,0,0,234,235,5,115,0,0,235,236,5,101,0,0,236,32,1,0,0,0,237,238,
+        5,102,0,0,238,239,5,111,0,0,239,240,5,114,0,0,240,34,1,0,0,0,241,
+        242,5,116,0,0,242,243,5,111,0,0,243,36,1,0,0,0,244,245,5,100,0,0,
+        245,246,5,111,0,0,246,38,1,0,0,0,247,248,5,98,0,0,248,249,5,114,
+        0,0,249,250,5,101,0,0,250,251,5,97,0,0,251,252,5,107,0,0,252,40,
+        1,0,0,0,253,254,5,99,0,0,254,255,5,111,0,0,255,256,5,110,0,0,256,
+        257,5,116,0,0,257,258,5,105,0,0,258,259,5,110,0,0,259,260,5,117,
+        0,0,260,261,5,101,0,0,261,42,1,0,0,0,262,263,5,100,0,0,263,264,5,
+        111,0,0,264,265,5,119,0,0,265,266,5,110,0,0,266,267,5,116,0,0,267,
+        268,5,111,0,0,268,44,1,0,0,0,269,270,5,114,0,0,270,271,5,101,0,0,
+        271,272,5,116,0,0,272,273,5,117,0,0,273,274,5,114,0,0,274,275,5,
+        110,0,0,275,46,1,0,0,0,276,277,5,110,0,0,277,278,5,105,0,0,278,279,
+        5,108,0,0,279,48,1,0,0,0,280,281,5,116,0,0,281,282,5,114,0,0,282,
+        283,5,117,0,0,283,290,5,101,0,0,284,285,5,102,0,0,285,286,5,97,0,
+        0,286,287,5,108,0,0,287,288,5,115,0,0,288,290,5,101,0,0,289,280,
+        1,0,0,0,289,284,1,0,0,0,290,50,1,0,0,0,291,293,7,2,0,0,292,291,1,
+        0,0,0,293,294,1,0,0,0,294,292,1,0,0,0,294,295,1,0,0,0,295,52,1,0,
+        0,0,296,298,7,2,0,0,297,296,1,0,0,0,298,299,1,0,0,0,299,297,1,0,
+        0,0,299,300,1,0,0,0,300,301,1,0,0,0,301,305,5,46,0,0,302,304,7,2,
+        0,0,303,302,1,0,0,0,304,307,1,0,0,0,305,303,1,0,0,0,305,306,1,0,
+        0,0,306,345,1,0,0,0,307,305,1,0,0,0,308,310,7,2,0,0,309,308,1,0,
+        0,0,310,311,1,0,0,0,311,309,1,0,0,0,311,312,1,0,0,0,312,313,1,0,
+        0,0,313,315,5,46,0,0,314,316,7,2,0,0,315,314,1,0,0,0,316,317,1,0,
+        0,0,317,315,1,0,0,0,317,318,1,0,0,0,318,319,1,0,0,0,319,322,7,3,
+        0,0,320,323,7,4,0,0,321,323,1,0,0,0,322,320,1,0,0,0,322,321,1,0,
+        0,0,323,325,1,0,0,0,324,326,7,2,0,0,325,324,1,0,0,0,326,327,1,0,
+        0,0,327,325,1,0,0,0,327,328,1,0,0,0,328,345,1,0,0,0,329,331,7,2,
+        0,0,330,329,1,0,0,0,331,332,1,0,0,0,332,330,1,0,0,0,332,333,1,0,
+        0,0,333,334,1,0,0,0,334,337,7,3,0,0,335,338,7,4,0,0,336,338,1,0,
+        0,0,337,335,1,0,0,0,337,336,1,0,0,0,338,340,1,0,0,0,339,341,7,2,
+        0,0,340,339,1,0,0,0,341,342,1,0,0,0,342,340,1,0,0,0,342,343,1,0,
+        0,0,343,345,1,0,0,0,344,297,1,0,0,0,344,309,1,0,0,0,344,330,1,0,
+        0,0,345,54,1,0,0,0,346,351,5,34,0,0,347,350,3,57,28,0,348,350,8,
+        5,0,0,349,347,1,0,0,0,349,348,1,0,0,0,350,353,1,0,0,0,351,349,1,
+        0,0,0,351,352,1,0,0,0,352,354,1,0,0,0,353,351,1,0,0,0,354,355,5,
+        34,0,0,355,356,6,27,1,0,356,56,1,0,0,0,357,358,5,92,0,0,358,359,
+        7,6,0,0,359,58,1,0,0,0,360,361,5,59,0,0,361,60,1,0,0,0,362,363,5,
+        123,0,0,363,62,1,0,0,0,364,365,5,125,0,0,365,64,1,0,0,0,366,367,
+        5,38,0,0,367,66,1,0,0,0,368,369,5,40,0,0,369,68,1,0,0,0,370,371,
+        5,41,0,0,371,70,1,0,0,0,372,373,5,91,0,0,373,72,1,0,0,0,374,375,
+        5,93,0,0,375,74,1,0,0,0,376,377,5,44,0,0,377,76,1,0,0,0,378,379,
+        5,46,0,0,379,78,1,0,0,0,380,381,5,58,0,0,381,80,1,0,0,0,382,383,
+        5,43,0,0,383,82,1,0,0,0,384,385,5,45,0,0,385,84,1,0,0,0,386,387,
+        5,42,0,0,387,86,1,0,0,0,388,389,5,92,0,0,389,88,1,0,0,0,390,391,
+        5,47,0,0,391,90,1,0,0,0,392,393,5,37,0,0,393,92,1,0,0,0,394,395,
+        5,61,0,0,395,396,5,61,0,0,396,94,1,0,0,0,397,398,5,33,0,0,398,399,
+        5,61,0,0,399,96,1,0,0,0,400,401,5,60,0,0,401,98,1,0,0,0,402,403,
+        5,60,0,0,403,404,5,61,0,0,404,100,1,0,0,0,405,406,5,62,0,0,406,102,
+        1,0,0,0,407,408,5,62,0,0,408,409,5,61,0,0,409,104,1,0,0,0,410,411,
+        5,124,0,0,411,412,5,124,0,0,412,106,1,0,0,0,413,414,5,38,0,0,414,
+        415,5,38,0,0,415,108,1,0,0,0,416,417,5,33,0,0,417,110,1,0,0,0,418,
+        419,5,110,0,0,419,420,5,101,0,0,420,421,5,119,0,0,421,112,1,0,0,
+        0,422,423,5,94,0,0,423,114,1,0,0,0,424,425,5,58,0,0,425,426,5,61,
+        0,0,426,116,1,0,0,0,427,431,7,7,0,0,428,430,7,8,0,0,429,428,1,0,
+        0,0,430,433,1,0,0,0,431,429,1,0,0,0,431,432,1,0,0,0,432,118,1,0,
+        0,0,433,431,1,0,0,0,434,436,7,9,0,0,435,434,1,0,0,0,436,437,1,0,
+        0,0,437,435,1,0,0,0,437,438,1,0,0,0,438,439,1,0,0,0,439,440,6,59,
+        0,0,440,120,1,0,0,0,441,442,9,0,0,0,442,122,1,0,0,0,443,448,5,34,
+        0,0,444,447,3,57,28,0,445,447,8,5,0,0,446,444,1,0,0,0,446,445,1,
+        0,0,0,447,450,1,0,0,0,448,446,1,0,0,0,448,449,1,0,0,0,449,451,1,
+        0,0,0,450,448,1,0,0,0,451,452,5,92,0,0,452,453,8,6,0,0,453,124,1,
+        0,0,0,454,459,5,34,0,0,455,458,3,57,28,0,456,458,8,5,0,0,457,455,
+        1,0,0,0,457,456,1,0,0,0,458,461,1,0,0,0,459,457,1,0,0,0,459,460,
+        1,0,0,0,460,463,1,0,0,0,461,459,1,0,0,0,462,464,7,10,0,0,463,462,
+        1,0,0,0,464,126,1,0,0,0,27,0,135,141,147,151,153,289,294,299,305,
+        311,317,322,327,332,337,342,344,349,351,431,437,446,448,457,459,
+        463,2,6,0,0,1,27,0
+    ]
+
+class OPLangLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    T__0 = 1
+    COMMENT = 2
+    CLASS = 3
+    EXTEND = 4
+    INT = 5
+    FLOAT = 6
+    STRING = 7
+    BOOL = 8
+    VOID = 9
+    MAIN = 10
+    THIS = 11
+    STA = 12
+    FIN = 13
+    IF = 14
+    THEN = 15
+    ELSE = 16
+    FOR = 17
+    TO = 18
+    DO = 19
+    BREAK = 20
+    CON = 21
+    DOWNTO = 22
+    RETURN = 23
+    NIL = 24
+    BOOLLIT = 25
+    INTLIT = 26
+    FLOATLIT = 27
+    STRINGLIT = 28
+    SEMI = 29
+    LB = 30
+    RB = 31
+    REF = 32
+    LRB = 33
+    RRB = 34
+    LSB = 35
+    RSB = 36
+    COMMA = 37
+    DOT = 38
+    COLON = 39
+    ADD = 40
+    SUB = 41
+    MUL = 42
+    INTDIV = 43
+    FLOATDIV = 44
+    MOD = 45
+    EQ = 46
+    NEQ = 47
+    LESST = 48
+    LESSEQ = 49
+    MORET = 50
+    MOREEQ = 51
+    OR = 52
+    AND = 53
+    NOT = 54
+    NEW = 55
+    CONCAT = 56
+    ASSIGN = 57
+    ID = 58
+    WS = 59
+    ERROR_CHAR = 60
+    ILLEGAL_ESCAPE = 61
+    UNCLOSE_STRING = 62
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'~'", "'class'", "'extends'", "'int'", "'float'", "'string'", 
+            "'boolean'", "'void'", "'main'", "'this'", "'static'", "'final'", 
+            "'if'", "'then'", "'else'", "'for'", "'to'", "'do'", "'break'", 
+            "'continue'", "'downto'", "'return'", "'nil'", "';'", "'{'", 
+            "'}'", "'&'", "'('", "')'", "'['", "']'", "','", "'.'", "':'", 
+            "'+'", "'-'", "'*'", "'\\'", "'/'", "'%'", "'=='", "'!='", "'<'", 
+            "'<='", "'>'", "'>='", "'||'", "'&&'", "'!'", "'new'", "'^'", 
+            "':='" ]
+
+    symbolicNames = [ "<INVALID>",
+            "COMMENT", "CLASS", "EXTEND", "INT", "FLOAT", "STRING", "BOOL", 
+            "VOID", "MAIN", "THIS", "STA", "FIN", "IF", "THEN", "ELSE", 
+            "FOR", "TO", "DO", "BREAK", "CON", "DOWNTO", "RETURN", "NIL", 
+            "BOOLLIT", "INTLIT", "FLOATLIT", "STRINGLIT", "SEMI", "LB", 
+            "RB", "REF", "LRB", "RRB", "LSB", "RSB", "COMMA", "DOT", "COLON", 
+            "ADD", "SUB", "MUL", "INTDIV", "FLOATDIV", "MOD", "EQ", "NEQ", 
+            "LESST", "LESSEQ", "MORET", "MOREEQ", "OR", "AND", "NOT", "NEW", 
+            "CONCAT", "ASSIGN", "ID", "WS", "ERROR_CHAR", "ILLEGAL_ESCAPE", 
+            "UNCLOSE_STRING" ]
+
+    ruleNames = [ "T__0", "COMMENT", "CLASS", "EXTEND", "INT", "FLOAT", 
+                  "STRING", "BOOL", "VOID", "MAIN", "THIS", "STA", "FIN", 
+                  "IF", "THEN", "ELSE", "FOR", "TO", "DO", "BREAK", "CON", 
+                  "DOWNTO", "RETURN", "NIL", "BOOLLIT", "INTLIT", "FLOATLIT", 
+                  "STRINGLIT", "ESCAPE", "SEMI", "LB", "RB", "REF", "LRB", 
+                  "RRB", "LSB", "RSB", "COMMA", "DOT", "COLON", "ADD", "SUB", 
+                  "MUL", "INTDIV", "FLOATDIV", "MOD", "EQ", "NEQ", "LESST", 
+                  "LESSEQ", "MORET", "MOREEQ", "OR", "AND", "NOT", "NEW", 
+                  "CONCAT", "ASSIGN", "ID", "WS", "ERROR_CHAR", "ILLEGAL_ESCAPE", 
+                  "UNCLOSE_STRING" ]
+
+    grammarFileName = "OPLang.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def emit(self):
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            raise UncloseString(result.text[1:]);
+        elif tk == self.ILLEGAL_ESCAPE:
+            result = super().emit();
+            raise IllegalEscape(result.text[1:]);
+        elif tk == self.ERROR_CHAR:
+            result = super().emit();
+            raise ErrorToken(result.text); 
+        else:
+            return super().emit();
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[27] = self.STRINGLIT_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def STRINGLIT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+            self.text = self.text[1:-1]
+     
+
+
@@ -0,0 +1,4297 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,62,545,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
+        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,46,
+        7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,52,7,52,
+        2,53,7,53,2,54,7,54,1,0,1,0,1,0,1,1,1,1,3,1,116,8,1,1,1,1,1,1,2,
+        1,2,1,2,5,2,123,8,2,10,2,12,2,126,9,2,1,3,1,3,3,3,130,8,3,1,4,1,
+        4,1,4,3,4,135,8,4,1,5,1,5,1,6,1,6,3,6,141,8,6,1,7,1,7,1,7,1,7,1,
+        7,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,3,9,156,8,9,1,9,1,9,1,10,1,10,
+        1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,13,5,13,171,8,13,10,13,
+        12,13,174,9,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,184,
+        8,14,1,15,1,15,1,15,1,15,1,15,3,15,191,8,15,1,15,3,15,194,8,15,1,
+        15,1,15,1,15,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,
+        18,1,18,3,18,211,8,18,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,
+        19,1,20,1,20,1,20,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,23,1,23,1,
+        23,1,24,3,24,236,8,24,1,24,1,24,1,24,1,24,3,24,242,8,24,1,24,1,24,
+        1,24,1,24,5,24,248,8,24,10,24,12,24,251,9,24,1,24,1,24,1,25,1,25,
+        1,25,1,25,1,25,1,25,1,25,3,25,262,8,25,3,25,264,8,25,1,26,1,26,1,
+        26,1,26,1,26,1,27,1,27,3,27,273,8,27,1,28,1,28,1,28,5,28,278,8,28,
+        10,28,12,28,281,9,28,1,29,1,29,1,30,1,30,5,30,287,8,30,10,30,12,
+        30,290,9,30,1,31,4,31,293,8,31,11,31,12,31,294,1,32,1,32,1,32,1,
+        32,3,32,301,8,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,
+        33,1,33,3,33,314,8,33,1,33,1,33,1,34,1,34,3,34,320,8,34,1,34,1,34,
+        1,34,3,34,325,8,34,5,34,327,8,34,10,34,12,34,330,9,34,1,35,1,35,
+        1,35,1,35,1,35,1,35,5,35,338,8,35,10,35,12,35,341,9,35,1,36,1,36,
+        1,37,1,37,1,38,1,38,1,38,3,38,350,8,38,1,39,3,39,353,8,39,1,39,1,
+        39,1,39,1,39,1,39,1,39,3,39,361,8,39,1,39,1,39,1,39,1,39,1,39,3,
+        39,368,8,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,
+        41,1,41,1,41,1,41,1,42,1,42,3,42,386,8,42,1,43,1,43,3,43,390,8,43,
+        1,43,1,43,1,43,1,43,3,43,396,8,43,1,43,1,43,5,43,400,8,43,10,43,
+        12,43,403,9,43,1,44,1,44,1,44,5,44,408,8,44,10,44,12,44,411,9,44,
+        1,45,5,45,414,8,45,10,45,12,45,417,9,45,1,46,3,46,420,8,46,1,46,
+        1,46,1,46,1,46,1,46,1,46,3,46,428,8,46,1,46,1,46,1,47,1,47,1,47,
+        1,47,1,47,1,47,1,47,3,47,439,8,47,1,47,1,47,1,48,1,48,1,48,1,48,
+        1,48,1,48,1,48,3,48,450,8,48,1,49,1,49,3,49,454,8,49,1,49,1,49,1,
+        49,3,49,459,8,49,5,49,461,8,49,10,49,12,49,464,9,49,1,50,1,50,1,
+        50,1,50,1,50,1,50,5,50,472,8,50,10,50,12,50,475,9,50,1,51,1,51,1,
+        52,1,52,1,52,3,52,482,8,52,1,52,1,52,1,52,1,52,3,52,488,8,52,3,52,
+        490,8,52,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,3,53,500,8,53,1,
+        53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,
+        53,1,53,1,53,3,53,518,8,53,1,53,1,53,1,53,1,53,1,53,5,53,525,8,53,
+        10,53,12,53,528,9,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,
+        1,54,1,54,1,54,1,54,3,54,543,8,54,1,54,0,1,106,55,0,2,4,6,8,10,12,
+        14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,
+        58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,90,92,94,96,98,100,
+        102,104,106,108,0,7,1,0,5,8,2,0,18,18,22,22,1,0,46,47,1,0,48,51,
+        1,0,40,41,1,0,42,45,1,0,52,53,569,0,110,1,0,0,0,2,113,1,0,0,0,4,
+        119,1,0,0,0,6,129,1,0,0,0,8,134,1,0,0,0,10,136,1,0,0,0,12,140,1,
+        0,0,0,14,142,1,0,0,0,16,147,1,0,0,0,18,155,1,0,0,0,20,159,1,0,0,
+        0,22,161,1,0,0,0,24,164,1,0,0,0,26,172,1,0,0,0,28,183,1,0,0,0,30,
+        193,1,0,0,0,32,198,1,0,0,0,34,201,1,0,0,0,36,210,1,0,0,0,38,212,
+        1,0,0,0,40,221,1,0,0,0,42,224,1,0,0,0,44,227,1,0,0,0,46,231,1,0,
+        0,0,48,235,1,0,0,0,50,254,1,0,0,0,52,265,1,0,0,0,54,272,1,0,0,0,
+        56,274,1,0,0,0,58,282,1,0,0,0,60,288,1,0,0,0,62,292,1,0,0,0,64,296,
+        1,0,0,0,66,306,1,0,0,0,68,317,1,0,0,0,70,331,1,0,0,0,72,342,1,0,
+        0,0,74,344,1,0,0,0,76,349,1,0,0,0,78,352,1,0,0,0,80,371,1,0,0,0,
+        82,377,1,0,0,0,84,385,1,0,0,0,86,389,1,0,0,0,88,404,1,0,0,0,90,415,
+        1,0,0,0,92,419,1,0,0,0,94,431,1,0,0,0,96,449,1,0,0,0,98,451,1,0,
+        0,0,100,465,1,0,0,0,102,476,1,0,0,0,104,478,1,0,0,0,106,499,1,0,
+        0,0,108,542,1,0,0,0,110,111,3,62,31,0,111,112,5,0,0,1,112,1,1,0,
+        0,0,113,115,5,30,0,0,114,116,3,4,2,0,115,114,1,0,0,0,115,116,1,0,
+        0,0,116,117,1,0,0,0,117,118,5,31,0,0,118,3,1,0,0,0,119,124,3,104,
+        52,0,120,121,5,37,0,0,121,123,3,104,52,0,122,120,1,0,0,0,123,126,
+        1,0,0,0,124,122,1,0,0,0,124,125,1,0,0,0,125,5,1,0,0,0,126,124,1,
+        0,0,0,127,130,3,8,4,0,128,130,5,9,0,0,129,127,1,0,0,0,129,128,1,
+        0,0,0,130,7,1,0,0,0,131,135,3,10,5,0,132,135,3,12,6,0,133,135,3,
+        20,10,0,134,131,1,0,0,0,134,132,1,0,0,0,134,133,1,0,0,0,135,9,1,
+        0,0,0,136,137,7,0,0,0,137,11,1,0,0,0,138,141,3,14,7,0,139,141,3,
+        16,8,0,140,138,1,0,0,0,140,139,1,0,0,0,141,13,1,0,0,0,142,143,3,
+        10,5,0,143,144,5,35,0,0,144,145,5,26,0,0,145,146,5,36,0,0,146,15,
+        1,0,0,0,147,148,5,58,0,0,148,149,5,35,0,0,149,150,5,26,0,0,150,151,
+        5,36,0,0,151,17,1,0,0,0,152,156,3,10,5,0,153,156,3,20,10,0,154,156,
+        3,12,6,0,155,152,1,0,0,0,155,153,1,0,0,0,155,154,1,0,0,0,156,157,
+        1,0,0,0,157,158,5,32,0,0,158,19,1,0,0,0,159,160,5,58,0,0,160,21,
+        1,0,0,0,161,162,5,9,0,0,162,163,5,10,0,0,163,23,1,0,0,0,164,165,
+        5,30,0,0,165,166,3,90,45,0,166,167,3,26,13,0,167,168,5,31,0,0,168,
+        25,1,0,0,0,169,171,3,28,14,0,170,169,1,0,0,0,171,174,1,0,0,0,172,
+        170,1,0,0,0,172,173,1,0,0,0,173,27,1,0,0,0,174,172,1,0,0,0,175,184,
+        3,30,15,0,176,184,3,34,17,0,177,184,3,38,19,0,178,184,3,40,20,0,
+        179,184,3,42,21,0,180,184,3,44,22,0,181,184,3,46,23,0,182,184,3,
+        24,12,0,183,175,1,0,0,0,183,176,1,0,0,0,183,177,1,0,0,0,183,178,
+        1,0,0,0,183,179,1,0,0,0,183,180,1,0,0,0,183,181,1,0,0,0,183,182,
+        1,0,0,0,184,29,1,0,0,0,185,190,5,58,0,0,186,187,5,35,0,0,187,188,
+        3,104,52,0,188,189,5,36,0,0,189,191,1,0,0,0,190,186,1,0,0,0,190,
+        191,1,0,0,0,191,194,1,0,0,0,192,194,3,48,24,0,193,185,1,0,0,0,193,
+        192,1,0,0,0,194,195,1,0,0,0,195,196,3,32,16,0,196,197,5,29,0,0,197,
+        31,1,0,0,0,198,199,5,57,0,0,199,200,3,104,52,0,200,33,1,0,0,0,201,
+        202,5,14,0,0,202,203,3,104,52,0,203,204,5,15,0,0,204,205,3,28,14,
+        0,205,206,3,36,18,0,206,35,1,0,0,0,207,208,5,16,0,0,208,211,3,28,
+        14,0,209,211,1,0,0,0,210,207,1,0,0,0,210,209,1,0,0,0,211,37,1,0,
+        0,0,212,213,5,17,0,0,213,214,5,58,0,0,214,215,5,57,0,0,215,216,3,
+        104,52,0,216,217,7,1,0,0,217,218,3,104,52,0,218,219,5,19,0,0,219,
+        220,3,28,14,0,220,39,1,0,0,0,221,222,5,20,0,0,222,223,5,29,0,0,223,
+        41,1,0,0,0,224,225,5,21,0,0,225,226,5,29,0,0,226,43,1,0,0,0,227,
+        228,5,23,0,0,228,229,3,104,52,0,229,230,5,29,0,0,230,45,1,0,0,0,
+        231,232,3,48,24,0,232,233,5,29,0,0,233,47,1,0,0,0,234,236,5,55,0,
+        0,235,234,1,0,0,0,235,236,1,0,0,0,236,237,1,0,0,0,237,249,3,108,
+        54,0,238,241,5,38,0,0,239,242,3,52,26,0,240,242,5,58,0,0,241,239,
+        1,0,0,0,241,240,1,0,0,0,242,248,1,0,0,0,243,244,5,35,0,0,244,245,
+        3,104,52,0,245,246,5,36,0,0,246,248,1,0,0,0,247,238,1,0,0,0,247,
+        243,1,0,0,0,248,251,1,0,0,0,249,247,1,0,0,0,249,250,1,0,0,0,250,
+        252,1,0,0,0,251,249,1,0,0,0,252,253,3,50,25,0,253,49,1,0,0,0,254,
+        263,5,38,0,0,255,264,3,52,26,0,256,261,5,58,0,0,257,258,5,35,0,0,
+        258,259,3,104,52,0,259,260,5,36,0,0,260,262,1,0,0,0,261,257,1,0,
+        0,0,261,262,1,0,0,0,262,264,1,0,0,0,263,255,1,0,0,0,263,256,1,0,
+        0,0,264,51,1,0,0,0,265,266,5,58,0,0,266,267,5,33,0,0,267,268,3,54,
+        27,0,268,269,5,34,0,0,269,53,1,0,0,0,270,273,3,56,28,0,271,273,1,
+        0,0,0,272,270,1,0,0,0,272,271,1,0,0,0,273,55,1,0,0,0,274,279,3,58,
+        29,0,275,276,5,37,0,0,276,278,3,58,29,0,277,275,1,0,0,0,278,281,
+        1,0,0,0,279,277,1,0,0,0,279,280,1,0,0,0,280,57,1,0,0,0,281,279,1,
+        0,0,0,282,283,3,104,52,0,283,59,1,0,0,0,284,287,3,66,33,0,285,287,
+        3,76,38,0,286,284,1,0,0,0,286,285,1,0,0,0,287,290,1,0,0,0,288,286,
+        1,0,0,0,288,289,1,0,0,0,289,61,1,0,0,0,290,288,1,0,0,0,291,293,3,
+        64,32,0,292,291,1,0,0,0,293,294,1,0,0,0,294,292,1,0,0,0,294,295,
+        1,0,0,0,295,63,1,0,0,0,296,297,5,3,0,0,297,300,5,58,0,0,298,299,
+        5,4,0,0,299,301,5,58,0,0,300,298,1,0,0,0,300,301,1,0,0,0,301,302,
+        1,0,0,0,302,303,5,30,0,0,303,304,3,74,37,0,304,305,5,31,0,0,305,
+        65,1,0,0,0,306,313,3,96,48,0,307,308,3,8,4,0,308,309,3,68,34,0,309,
+        314,1,0,0,0,310,311,3,18,9,0,311,312,3,70,35,0,312,314,1,0,0,0,313,
+        307,1,0,0,0,313,310,1,0,0,0,314,315,1,0,0,0,315,316,5,29,0,0,316,
+        67,1,0,0,0,317,319,3,72,36,0,318,320,3,32,16,0,319,318,1,0,0,0,319,
+        320,1,0,0,0,320,328,1,0,0,0,321,322,5,37,0,0,322,324,3,72,36,0,323,
+        325,3,32,16,0,324,323,1,0,0,0,324,325,1,0,0,0,325,327,1,0,0,0,326,
+        321,1,0,0,0,327,330,1,0,0,0,328,326,1,0,0,0,328,329,1,0,0,0,329,
+        69,1,0,0,0,330,328,1,0,0,0,331,332,3,72,36,0,332,339,3,32,16,0,333,
+        334,5,37,0,0,334,335,3,72,36,0,335,336,3,32,16,0,336,338,1,0,0,0,
+        337,333,1,0,0,0,338,341,1,0,0,0,339,337,1,0,0,0,339,340,1,0,0,0,
+        340,71,1,0,0,0,341,339,1,0,0,0,342,343,5,58,0,0,343,73,1,0,0,0,344,
+        345,3,60,30,0,345,75,1,0,0,0,346,350,3,78,39,0,347,350,3,80,40,0,
+        348,350,3,82,41,0,349,346,1,0,0,0,349,347,1,0,0,0,349,348,1,0,0,
+        0,350,77,1,0,0,0,351,353,5,12,0,0,352,351,1,0,0,0,352,353,1,0,0,
+        0,353,367,1,0,0,0,354,355,3,22,11,0,355,356,5,33,0,0,356,357,5,34,
+        0,0,357,368,1,0,0,0,358,361,3,6,3,0,359,361,3,18,9,0,360,358,1,0,
+        0,0,360,359,1,0,0,0,361,362,1,0,0,0,362,363,5,58,0,0,363,364,5,33,
+        0,0,364,365,3,84,42,0,365,366,5,34,0,0,366,368,1,0,0,0,367,354,1,
+        0,0,0,367,360,1,0,0,0,368,369,1,0,0,0,369,370,3,24,12,0,370,79,1,
+        0,0,0,371,372,5,58,0,0,372,373,5,33,0,0,373,374,3,84,42,0,374,375,
+        5,34,0,0,375,376,3,24,12,0,376,81,1,0,0,0,377,378,5,1,0,0,378,379,
+        5,58,0,0,379,380,5,33,0,0,380,381,5,34,0,0,381,382,3,24,12,0,382,
+        83,1,0,0,0,383,386,3,86,43,0,384,386,1,0,0,0,385,383,1,0,0,0,385,
+        384,1,0,0,0,386,85,1,0,0,0,387,390,3,8,4,0,388,390,3,18,9,0,389,
+        387,1,0,0,0,389,388,1,0,0,0,390,391,1,0,0,0,391,401,3,88,44,0,392,
+        395,5,29,0,0,393,396,3,8,4,0,394,396,3,18,9,0,395,393,1,0,0,0,395,
+        394,1,0,0,0,396,397,1,0,0,0,397,398,3,88,44,0,398,400,1,0,0,0,399,
+        392,1,0,0,0,400,403,1,0,0,0,401,399,1,0,0,0,401,402,1,0,0,0,402,
+        87,1,0,0,0,403,401,1,0,0,0,404,409,3,102,51,0,405,406,5,37,0,0,406,
+        408,3,102,51,0,407,405,1,0,0,0,408,411,1,0,0,0,409,407,1,0,0,0,409,
+        410,1,0,0,0,410,89,1,0,0,0,411,409,1,0,0,0,412,414,3,92,46,0,413,
+        412,1,0,0,0,414,417,1,0,0,0,415,413,1,0,0,0,415,416,1,0,0,0,416,
+        91,1,0,0,0,417,415,1,0,0,0,418,420,5,13,0,0,419,418,1,0,0,0,419,
+        420,1,0,0,0,420,427,1,0,0,0,421,422,3,8,4,0,422,423,3,98,49,0,423,
+        428,1,0,0,0,424,425,3,18,9,0,425,426,3,100,50,0,426,428,1,0,0,0,
+        427,421,1,0,0,0,427,424,1,0,0,0,428,429,1,0,0,0,429,430,5,29,0,0,
+        430,93,1,0,0,0,431,438,3,96,48,0,432,433,3,8,4,0,433,434,3,98,49,
+        0,434,439,1,0,0,0,435,436,3,18,9,0,436,437,3,100,50,0,437,439,1,
+        0,0,0,438,432,1,0,0,0,438,435,1,0,0,0,439,440,1,0,0,0,440,441,5,
+        29,0,0,441,95,1,0,0,0,442,443,5,12,0,0,443,450,5,13,0,0,444,445,
+        5,13,0,0,445,450,5,12,0,0,446,450,5,12,0,0,447,450,5,13,0,0,448,
+        450,1,0,0,0,449,442,1,0,0,0,449,444,1,0,0,0,449,446,1,0,0,0,449,
+        447,1,0,0,0,449,448,1,0,0,0,450,97,1,0,0,0,451,453,3,102,51,0,452,
+        454,3,32,16,0,453,452,1,0,0,0,453,454,1,0,0,0,454,462,1,0,0,0,455,
+        456,5,37,0,0,456,458,3,102,51,0,457,459,3,32,16,0,458,457,1,0,0,
+        0,458,459,1,0,0,0,459,461,1,0,0,0,460,455,1,0,0,0,461,464,1,0,0,
+        0,462,460,1,0,0,0,462,463,1,0,0,0,463,99,1,0,0,0,464,462,1,0,0,0,
+        465,466,3,102,51,0,466,473,3,32,16,0,467,468,5,37,0,0,468,469,3,
+        102,51,0,469,470,3,32,16,0,470,472,1,0,0,0,471,467,1,0,0,0,472,475,
+        1,0,0,0,473,471,1,0,0,0,473,474,1,0,0,0,474,101,1,0,0,0,475,473,
+        1,0,0,0,476,477,5,58,0,0,477,103,1,0,0,0,478,481,3,106,53,0,479,
+        480,7,2,0,0,480,482,3,106,53,0,481,479,1,0,0,0,481,482,1,0,0,0,482,
+        489,1,0,0,0,483,484,7,3,0,0,484,487,3,106,53,0,485,486,7,2,0,0,486,
+        488,3,106,53,0,487,485,1,0,0,0,487,488,1,0,0,0,488,490,1,0,0,0,489,
+        483,1,0,0,0,489,490,1,0,0,0,490,105,1,0,0,0,491,492,6,53,-1,0,492,
+        493,5,55,0,0,493,500,3,106,53,10,494,495,7,4,0,0,495,500,3,106,53,
+        7,496,497,5,54,0,0,497,500,3,106,53,6,498,500,3,108,54,0,499,491,
+        1,0,0,0,499,494,1,0,0,0,499,496,1,0,0,0,499,498,1,0,0,0,500,526,
+        1,0,0,0,501,502,10,5,0,0,502,503,5,56,0,0,503,525,3,106,53,6,504,
+        505,10,4,0,0,505,506,7,5,0,0,506,525,3,106,53,5,507,508,10,3,0,0,
+        508,509,7,4,0,0,509,525,3,106,53,4,510,511,10,2,0,0,511,512,7,6,
+        0,0,512,525,3,106,53,3,513,514,10,9,0,0,514,517,5,38,0,0,515,518,
+        3,52,26,0,516,518,5,58,0,0,517,515,1,0,0,0,517,516,1,0,0,0,518,525,
+        1,0,0,0,519,520,10,8,0,0,520,521,5,35,0,0,521,522,3,104,52,0,522,
+        523,5,36,0,0,523,525,1,0,0,0,524,501,1,0,0,0,524,504,1,0,0,0,524,
+        507,1,0,0,0,524,510,1,0,0,0,524,513,1,0,0,0,524,519,1,0,0,0,525,
+        528,1,0,0,0,526,524,1,0,0,0,526,527,1,0,0,0,527,107,1,0,0,0,528,
+        526,1,0,0,0,529,543,5,26,0,0,530,543,5,27,0,0,531,543,5,28,0,0,532,
+        543,5,25,0,0,533,543,5,58,0,0,534,543,3,52,26,0,535,543,3,2,1,0,
+        536,543,5,11,0,0,537,543,5,24,0,0,538,539,5,33,0,0,539,540,3,104,
+        52,0,540,541,5,34,0,0,541,543,1,0,0,0,542,529,1,0,0,0,542,530,1,
+        0,0,0,542,531,1,0,0,0,542,532,1,0,0,0,542,533,1,0,0,0,542,534,1,
+        0,0,0,542,535,1,0,0,0,542,536,1,0,0,0,542,537,1,0,0,0,542,538,1,
+        0,0,0,543,109,1,0,0,0,54,115,124,129,134,140,155,172,183,190,193,
+        210,235,241,247,249,261,263,272,279,286,288,294,300,313,319,324,
+        328,339,349,352,360,367,385,389,395,401,409,415,419,427,438,449,
+        453,458,462,473,481,487,489,499,517,524,526,542
+    ]
+
+class OPLangParser ( Parser ):
+
+    grammarFileName = "OPLang.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'~'", "<INVALID>", "'class'", "'extends'", 
+                     "'int'", "'float'", "'string'", "'boolean'", "'void'", 
+                     "'main'", "'this'", "'static'", "'final'", "'if'", 
+                     "'then'", "'else'", "'for'", "'to'", "'do'", "'break'", 
+                     "'continue'", "'downto'", "'return'", "'nil'", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "';'", "'{'", 
+                     "'}'", "'&'", "'('", "')'", "'['", "']'", "','", "'.'", 
+                     "':'", "'+'", "'-'", "'*'", "'\\'", "'/'", "'%'", "'=='", 
+                     "'!='", "'<'", "'<='", "'>'", "'>='", "'||'", "'&&'", 
+                     "'!'", "'new'", "'^'", "':='" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "COMMENT", "CLASS", "EXTEND", 
+                      "INT", "FLOAT", "STRING", "BOOL", "VOID", "MAIN", 
+                      "THIS", "STA", "FIN", "IF", "THEN", "ELSE", "FOR", 
+                      "TO", "DO", "BREAK", "CON", "DOWNTO", "RETURN", "NIL", 
+                      "BOOLLIT", "INTLIT", "FLOATLIT", "STRINGLIT", "SEMI", 
+                      "LB", "RB", "REF", "LRB", "RRB", "LSB", "RSB", "COMMA", 
+                      "DOT", "COLON", "ADD", "SUB", "MUL", "INTDIV", "FLOATDIV", 
+                      "MOD", "EQ", "NEQ", "LESST", "LESSEQ", "MORET", "MOREEQ", 
+                      "OR", "AND", "NOT", "NEW", "CONCAT", "ASSIGN", "ID", 
+                      "WS", "ERROR_CHAR", "ILLEGAL_ESCAPE", "UNCLOSE_STRING" ]
+
+    RULE_program = 0
+    RULE_array = 1
+    RULE_array_element_list = 2
+    RULE_func_type = 3
+    RULE_type = 4
+    RULE_primitivetype = 5
+    RULE_arraytype = 6
+    RULE_arraytype_primitive = 7
+    RULE_arraytype_non_primitive = 8
+    RULE_referencetype = 9
+    RULE_classtype = 10
+    RULE_main_func = 11
+    RULE_blockstm = 12
+    RULE_stmlist = 13
+    RULE_stm = 14
+    RULE_assingstm = 15
+    RULE_vardecl_assign = 16
+    RULE_ifstm = 17
+    RULE_elsestm = 18
+    RULE_forstm = 19
+    RULE_breakstm = 20
+    RULE_continuestm = 21
+    RULE_returnstm = 22
+    RULE_invocationstm = 23
+    RULE_invocationstm_frame = 24
+    RULE_dotting = 25
+    RULE_callfuncstm = 26
+    RULE_input_func_param_list = 27
+    RULE_input_func_param_prime = 28
+    RULE_input_func_param = 29
+    RULE_decl = 30
+    RULE_class_decl_list = 31
+    RULE_class_decl = 32
+    RULE_attr_decl = 33
+    RULE_attr_decl_list = 34
+    RULE_attr_decl_list_ref = 35
+    RULE_attr_name = 36
+    RULE_class_member = 37
+    RULE_func_decl = 38
+    RULE_normal_func = 39
+    RULE_constructor = 40
+    RULE_destructor = 41
+    RULE_func_param_list = 42
+    RULE_func_param_prime = 43
+    RULE_func_param = 44
+    RULE_var_decl_stm = 45
+    RULE_var_decl_no_stafin = 46
+    RULE_var_decl = 47
+    RULE_stafin = 48
+    RULE_var_decl_list = 49
+    RULE_var_decl_list_ref = 50
+    RULE_var_name = 51
+    RULE_expr = 52
+    RULE_operand = 53
+    RULE_primary = 54
+
+    ruleNames =  [ "program", "array", "array_element_list", "func_type", 
+                   "type", "primitivetype", "arraytype", "arraytype_primitive", 
+                   "arraytype_non_primitive", "referencetype", "classtype", 
+                   "main_func", "blockstm", "stmlist", "stm", "assingstm", 
+                   "vardecl_assign", "ifstm", "elsestm", "forstm", "breakstm", 
+                   "continuestm", "returnstm", "invocationstm", "invocationstm_frame", 
+                   "dotting", "callfuncstm", "input_func_param_list", "input_func_param_prime", 
+                   "input_func_param", "decl", "class_decl_list", "class_decl", 
+                   "attr_decl", "attr_decl_list", "attr_decl_list_ref", 
+                   "attr_name", "class_member", "func_decl", "normal_func", 
+                   "constructor", "destructor", "func_param_list", "func_param_prime", 
+                   "func_param", "var_decl_stm", "var_decl_no_stafin", "var_decl", 
+                   "stafin", "var_decl_list", "var_decl_list_ref", "var_name", 
+                   "expr", "operand", "primary" ]
+
+    EOF = Token.EOF
+    T__0=1
+    COMMENT=2
+    CLASS=3
+    EXTEND=4
+    INT=5
+    FLOAT=6
+    STRING=7
+    BOOL=8
+    VOID=9
+    MAIN=10
+    THIS=11
+    STA=12
+    FIN=13
+    IF=14
+    THEN=15
+    ELSE=16
+    FOR=17
+    TO=18
+    DO=19
+    BREAK=20
+    CON=21
+    DOWNTO=22
+    RETURN=23
+    NIL=24
+    BOOLLIT=25
+    INTLIT=26
+    FLOATLIT=27
+    STRINGLIT=28
+    SEMI=29
+    LB=30
+    RB=31
+    REF=32
+    LRB=33
+    RRB=34
+    LSB=35
+    RSB=36
+    COMMA=37
+    DOT=38
+    COLON=39
+    ADD=40
+    SUB=41
+    MUL=42
+    INTDIV=43
+    FLOATDIV=44
+    MOD=45
+    EQ=46
+    NEQ=47
+    LESST=48
+    LESSEQ=49
+    MORET=50
+    MOREEQ=51
+    OR=52
+    AND=53
+    NOT=54
+    NEW=55
+    CONCAT=56
+    ASSIGN=57
+    ID=58
+    WS=59
+    ERROR_CHAR=60
+    ILLEGAL_ESCAPE=61
+    UNCLOSE_STRING=62
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def class_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Class_decl_listContext,0)
+
+
+        def EOF(self):
+            return self.getToken(OPLangParser.EOF, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = OPLangParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 110
+            self.class_decl_list()
+            self.state = 111
+            self.match(OPLangParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArrayContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def array_element_list(self):
+            return self.getTypedRuleContext(OPLangParser.Array_element_listContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_array
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArray" ):
+                return visitor.visitArray(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def array(self):
+
+        localctx = OPLangParser.ArrayContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_array)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 113
+            self.match(OPLangParser.LB)
+            self.state = 115
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 342276880398813184) != 0):
+                self.state = 114
+                self.array_element_list()
+
+
+            self.state = 117
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Array_element_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_array_element_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArray_element_list" ):
+                return visitor.visitArray_element_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def array_element_list(self):
+
+        localctx = OPLangParser.Array_element_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_array_element_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 119
+            self.expr()
+            self.state = 124
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 120
+                self.match(OPLangParser.COMMA)
+                self.state = 121
+                self.expr()
+                self.state = 126
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_typeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def VOID(self):
+            return self.getToken(OPLangParser.VOID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_type" ):
+                return visitor.visitFunc_type(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_type(self):
+
+        localctx = OPLangParser.Func_typeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_func_type)
+        try:
+            self.state = 129
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 7, 8, 58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 127
+                self.type_()
+                pass
+            elif token in [9]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 128
+                self.match(OPLangParser.VOID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primitivetype(self):
+            return self.getTypedRuleContext(OPLangParser.PrimitivetypeContext,0)
+
+
+        def arraytype(self):
+            return self.getTypedRuleContext(OPLangParser.ArraytypeContext,0)
+
+
+        def classtype(self):
+            return self.getTypedRuleContext(OPLangParser.ClasstypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitType" ):
+                return visitor.visitType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def type_(self):
+
+        localctx = OPLangParser.TypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_type)
+        try:
+            self.state = 134
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 131
+                self.primitivetype()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 132
+                self.arraytype()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 133
+                self.classtype()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimitivetypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(OPLangParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(OPLangParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(OPLangParser.STRING, 0)
+
+        def BOOL(self):
+            return self.getToken(OPLangParser.BOOL, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_primitivetype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimitivetype" ):
+                return visitor.visitPrimitivetype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primitivetype(self):
+
+        localctx = OPLangParser.PrimitivetypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_primitivetype)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 136
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 480) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArraytypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def arraytype_primitive(self):
+            return self.getTypedRuleContext(OPLangParser.Arraytype_primitiveContext,0)
+
+
+        def arraytype_non_primitive(self):
+            return self.getTypedRuleContext(OPLangParser.Arraytype_non_primitiveContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype" ):
+                return visitor.visitArraytype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype(self):
+
+        localctx = OPLangParser.ArraytypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_arraytype)
+        try:
+            self.state = 140
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 7, 8]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 138
+                self.arraytype_primitive()
+                pass
+            elif token in [58]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 139
+                self.arraytype_non_primitive()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Arraytype_primitiveContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primitivetype(self):
+            return self.getTypedRuleContext(OPLangParser.PrimitivetypeContext,0)
+
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype_primitive
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype_primitive" ):
+                return visitor.visitArraytype_primitive(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype_primitive(self):
+
+        localctx = OPLangParser.Arraytype_primitiveContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_arraytype_primitive)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 142
+            self.primitivetype()
+            self.state = 143
+            self.match(OPLangParser.LSB)
+            self.state = 144
+            self.match(OPLangParser.INTLIT)
+            self.state = 145
+            self.match(OPLangParser.RSB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Arraytype_non_primitiveContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype_non_primitive
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype_non_primitive" ):
+                return visitor.visitArraytype_non_primitive(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype_non_primitive(self):
+
+        localctx = OPLangParser.Arraytype_non_primitiveContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_arraytype_non_primitive)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 147
+            self.match(OPLangParser.ID)
+            self.state = 148
+            self.match(OPLangParser.LSB)
+            self.state = 149
+            self.match(OPLangParser.INTLIT)
+            self.state = 150
+            self.match(OPLangParser.RSB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferencetypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def REF(self):
+            return self.getToken(OPLangParser.REF, 0)
+
+        def primitivetype(self):
+            return self.getTypedRuleContext(OPLangParser.PrimitivetypeContext,0)
+
+
+        def classtype(self):
+            return self.getTypedRuleContext(OPLangParser.ClasstypeContext,0)
+
+
+        def arraytype(self):
+            return self.getTypedRuleContext(OPLangParser.ArraytypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_referencetype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferencetype" ):
+                return visitor.visitReferencetype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referencetype(self):
+
+        localctx = OPLangParser.ReferencetypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_referencetype)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 155
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
+            if la_ == 1:
+                self.state = 152
+                self.primitivetype()
+                pass
+
+            elif la_ == 2:
+                self.state = 153
+                self.classtype()
+                pass
+
+            elif la_ == 3:
+                self.state = 154
+                self.arraytype()
+                pass
+
+
+            self.state = 157
+            self.match(OPLangParser.REF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ClasstypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_classtype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClasstype" ):
+                return visitor.visitClasstype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def classtype(self):
+
+        localctx = OPLangParser.ClasstypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_classtype)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 159
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Main_funcContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def VOID(self):
+            return self.getToken(OPLangParser.VOID, 0)
+
+        def MAIN(self):
+            return self.getToken(OPLangParser.MAIN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_main_func
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMain_func" ):
+                return visitor.visitMain_func(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def main_func(self):
+
+        localctx = OPLangParser.Main_funcContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_main_func)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 161
+            self.match(OPLangParser.VOID)
+            self.state = 162
+            self.match(OPLangParser.MAIN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def var_decl_stm(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_stmContext,0)
+
+
+        def stmlist(self):
+            return self.getTypedRuleContext(OPLangParser.StmlistContext,0)
+
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_blockstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockstm" ):
+                return visitor.visitBlockstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockstm(self):
+
+        localctx = OPLangParser.BlockstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_blockstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 164
+            self.match(OPLangParser.LB)
+            self.state = 165
+            self.var_decl_stm()
+            self.state = 166
+            self.stmlist()
+            self.state = 167
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stm(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.StmContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.StmContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stmlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmlist" ):
+                return visitor.visitStmlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmlist(self):
+
+        localctx = OPLangParser.StmlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_stmlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 172
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 324259183366129664) != 0):
+                self.state = 169
+                self.stm()
+                self.state = 174
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def assingstm(self):
+            return self.getTypedRuleContext(OPLangParser.AssingstmContext,0)
+
+
+        def ifstm(self):
+            return self.getTypedRuleContext(OPLangParser.IfstmContext,0)
+
+
+        def forstm(self):
+            return self.getTypedRuleContext(OPLangParser.ForstmContext,0)
+
+
+        def breakstm(self):
+            return self.getTypedRuleContext(OPLangParser.BreakstmContext,0)
+
+
+        def continuestm(self):
+            return self.getTypedRuleContext(OPLangParser.ContinuestmContext,0)
+
+
+        def returnstm(self):
+            return self.getTypedRuleContext(OPLangParser.ReturnstmContext,0)
+
+
+        def invocationstm(self):
+            return self.getTypedRuleContext(OPLangParser.InvocationstmContext,0)
+
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStm" ):
+                return visitor.visitStm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stm(self):
+
+        localctx = OPLangParser.StmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_stm)
+        try:
+            self.state = 183
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,7,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 175
+                self.assingstm()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 176
+                self.ifstm()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 177
+                self.forstm()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 178
+                self.breakstm()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 179
+                self.continuestm()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 180
+                self.returnstm()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 181
+                self.invocationstm()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 182
+                self.blockstm()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssingstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def vardecl_assign(self):
+            return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def invocationstm_frame(self):
+            return self.getTypedRuleContext(OPLangParser.Invocationstm_frameContext,0)
+
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_assingstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssingstm" ):
+                return visitor.visitAssingstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assingstm(self):
+
+        localctx = OPLangParser.AssingstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_assingstm)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 193
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+            if la_ == 1:
+                self.state = 185
+                self.match(OPLangParser.ID)
+                self.state = 190
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 186
+                    self.match(OPLangParser.LSB)
+                    self.state = 187
+                    self.expr()
+                    self.state = 188
+                    self.match(OPLangParser.RSB)
+
+
+                pass
+
+            elif la_ == 2:
+                self.state = 192
+                self.invocationstm_frame()
+                pass
+
+
+            self.state = 195
+            self.vardecl_assign()
+            self.state = 196
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Vardecl_assignContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_vardecl_assign
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVardecl_assign" ):
+                return visitor.visitVardecl_assign(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def vardecl_assign(self):
+
+        localctx = OPLangParser.Vardecl_assignContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_vardecl_assign)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 198
+            self.match(OPLangParser.ASSIGN)
+            self.state = 199
+            self.expr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(OPLangParser.IF, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def THEN(self):
+            return self.getToken(OPLangParser.THEN, 0)
+
+        def stm(self):
+            return self.getTypedRuleContext(OPLangParser.StmContext,0)
+
+
+        def elsestm(self):
+            return self.getTypedRuleContext(OPLangParser.ElsestmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_ifstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfstm" ):
+                return visitor.visitIfstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifstm(self):
+
+        localctx = OPLangParser.IfstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_ifstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 201
+            self.match(OPLangParser.IF)
+            self.state = 202
+            self.expr()
+            self.state = 203
+            self.match(OPLangParser.THEN)
+            self.state = 204
+            self.stm()
+            self.state = 205
+            self.elsestm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ElsestmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ELSE(self):
+            return self.getToken(OPLangParser.ELSE, 0)
+
+        def stm(self):
+            return self.getTypedRuleContext(OPLangParser.StmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_elsestm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElsestm" ):
+                return visitor.visitElsestm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def elsestm(self):
+
+        localctx = OPLangParser.ElsestmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_elsestm)
+        try:
+            self.state = 210
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 207
+                self.match(OPLangParser.ELSE)
+                self.state = 208
+                self.stm()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(OPLangParser.FOR, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def DO(self):
+            return self.getToken(OPLangParser.DO, 0)
+
+        def stm(self):
+            return self.getTypedRuleContext(OPLangParser.StmContext,0)
+
+
+        def TO(self):
+            return self.getToken(OPLangParser.TO, 0)
+
+        def DOWNTO(self):
+            return self.getToken(OPLangParser.DOWNTO, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_forstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForstm" ):
+                return visitor.visitForstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forstm(self):
+
+        localctx = OPLangParser.ForstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_forstm)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 212
+            self.match(OPLangParser.FOR)
+            self.state = 213
+            self.match(OPLangParser.ID)
+            self.state = 214
+            self.match(OPLangParser.ASSIGN)
+            self.state = 215
+            self.expr()
+            self.state = 216
+            _la = self._input.LA(1)
+            if not(_la==18 or _la==22):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 217
+            self.expr()
+            self.state = 218
+            self.match(OPLangParser.DO)
+            self.state = 219
+            self.stm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(OPLangParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_breakstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakstm" ):
+                return visitor.visitBreakstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakstm(self):
+
+        localctx = OPLangParser.BreakstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_breakstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 221
+            self.match(OPLangParser.BREAK)
+            self.state = 222
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinuestmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CON(self):
+            return self.getToken(OPLangParser.CON, 0)
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_continuestm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinuestm" ):
+                return visitor.visitContinuestm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continuestm(self):
+
+        localctx = OPLangParser.ContinuestmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_continuestm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 224
+            self.match(OPLangParser.CON)
+            self.state = 225
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(OPLangParser.RETURN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_returnstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnstm" ):
+                return visitor.visitReturnstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnstm(self):
+
+        localctx = OPLangParser.ReturnstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_returnstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 227
+            self.match(OPLangParser.RETURN)
+            self.state = 228
+            self.expr()
+            self.state = 229
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class InvocationstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def invocationstm_frame(self):
+            return self.getTypedRuleContext(OPLangParser.Invocationstm_frameContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_invocationstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInvocationstm" ):
+                return visitor.visitInvocationstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def invocationstm(self):
+
+        localctx = OPLangParser.InvocationstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_invocationstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 231
+            self.invocationstm_frame()
+            self.state = 232
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Invocationstm_frameContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primary(self):
+            return self.getTypedRuleContext(OPLangParser.PrimaryContext,0)
+
+
+        def dotting(self):
+            return self.getTypedRuleContext(OPLangParser.DottingContext,0)
+
+
+        def NEW(self):
+            return self.getToken(OPLangParser.NEW, 0)
+
+        def DOT(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.DOT)
+            else:
+                return self.getToken(OPLangParser.DOT, i)
+
+        def LSB(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.LSB)
+            else:
+                return self.getToken(OPLangParser.LSB, i)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def RSB(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.RSB)
+            else:
+                return self.getToken(OPLangParser.RSB, i)
+
+        def callfuncstm(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.CallfuncstmContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.CallfuncstmContext,i)
+
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.ID)
+            else:
+                return self.getToken(OPLangParser.ID, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_invocationstm_frame
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInvocationstm_frame" ):
+                return visitor.visitInvocationstm_frame(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def invocationstm_frame(self):
+
+        localctx = OPLangParser.Invocationstm_frameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_invocationstm_frame)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 235
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==55:
+                self.state = 234
+                self.match(OPLangParser.NEW)
+
+
+            self.state = 237
+            self.primary()
+            self.state = 249
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,14,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 247
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [38]:
+                        self.state = 238
+                        self.match(OPLangParser.DOT)
+                        self.state = 241
+                        self._errHandler.sync(self)
+                        la_ = self._interp.adaptivePredict(self._input,12,self._ctx)
+                        if la_ == 1:
+                            self.state = 239
+                            self.callfuncstm()
+                            pass
+
+                        elif la_ == 2:
+                            self.state = 240
+                            self.match(OPLangParser.ID)
+                            pass
+
+
+                        pass
+                    elif token in [35]:
+                        self.state = 243
+                        self.match(OPLangParser.LSB)
+                        self.state = 244
+                        self.expr()
+                        self.state = 245
+                        self.match(OPLangParser.RSB)
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+             
+                self.state = 251
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,14,self._ctx)
+
+            self.state = 252
+            self.dotting()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DottingContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def callfuncstm(self):
+            return self.getTypedRuleContext(OPLangParser.CallfuncstmContext,0)
+
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_dotting
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDotting" ):
+                return visitor.visitDotting(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dotting(self):
+
+        localctx = OPLangParser.DottingContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_dotting)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 254
+            self.match(OPLangParser.DOT)
+            self.state = 263
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
+            if la_ == 1:
+                self.state = 255
+                self.callfuncstm()
+                pass
+
+            elif la_ == 2:
+                self.state = 256
+                self.match(OPLangParser.ID)
+                self.state = 261
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==35:
+                    self.state = 257
+                    self.match(OPLangParser.LSB)
+                    self.state = 258
+                    self.expr()
+                    self.state = 259
+                    self.match(OPLangParser.RSB)
+
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CallfuncstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def input_func_param_list(self):
+            return self.getTypedRuleContext(OPLangParser.Input_func_param_listContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_callfuncstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCallfuncstm" ):
+                return visitor.visitCallfuncstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def callfuncstm(self):
+
+        localctx = OPLangParser.CallfuncstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_callfuncstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 265
+            self.match(OPLangParser.ID)
+            self.state = 266
+            self.match(OPLangParser.LRB)
+            self.state = 267
+            self.input_func_param_list()
+            self.state = 268
+            self.match(OPLangParser.RRB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Input_func_param_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def input_func_param_prime(self):
+            return self.getTypedRuleContext(OPLangParser.Input_func_param_primeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_input_func_param_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInput_func_param_list" ):
+                return visitor.visitInput_func_param_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def input_func_param_list(self):
+
+        localctx = OPLangParser.Input_func_param_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_input_func_param_list)
+        try:
+            self.state = 272
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [11, 24, 25, 26, 27, 28, 30, 33, 40, 41, 54, 55, 58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 270
+                self.input_func_param_prime()
+                pass
+            elif token in [34]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Input_func_param_primeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def input_func_param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Input_func_paramContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Input_func_paramContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_input_func_param_prime
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInput_func_param_prime" ):
+                return visitor.visitInput_func_param_prime(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def input_func_param_prime(self):
+
+        localctx = OPLangParser.Input_func_param_primeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_input_func_param_prime)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 274
+            self.input_func_param()
+            self.state = 279
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 275
+                self.match(OPLangParser.COMMA)
+                self.state = 276
+                self.input_func_param()
+                self.state = 281
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Input_func_paramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_input_func_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInput_func_param" ):
+                return visitor.visitInput_func_param(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def input_func_param(self):
+
+        localctx = OPLangParser.Input_func_paramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_input_func_param)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 282
+            self.expr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attr_decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Attr_declContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Attr_declContext,i)
+
+
+        def func_decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Func_declContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Func_declContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDecl" ):
+                return visitor.visitDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def decl(self):
+
+        localctx = OPLangParser.DeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_decl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 288
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 288230376151725026) != 0):
+                self.state = 286
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
+                if la_ == 1:
+                    self.state = 284
+                    self.attr_decl()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 285
+                    self.func_decl()
+                    pass
+
+
+                self.state = 290
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Class_decl_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def class_decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Class_declContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Class_declContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_class_decl_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass_decl_list" ):
+                return visitor.visitClass_decl_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def class_decl_list(self):
+
+        localctx = OPLangParser.Class_decl_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_class_decl_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 292 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 291
+                self.class_decl()
+                self.state = 294 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==3):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Class_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CLASS(self):
+            return self.getToken(OPLangParser.CLASS, 0)
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.ID)
+            else:
+                return self.getToken(OPLangParser.ID, i)
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def class_member(self):
+            return self.getTypedRuleContext(OPLangParser.Class_memberContext,0)
+
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def EXTEND(self):
+            return self.getToken(OPLangParser.EXTEND, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_class_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass_decl" ):
+                return visitor.visitClass_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def class_decl(self):
+
+        localctx = OPLangParser.Class_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_class_decl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 296
+            self.match(OPLangParser.CLASS)
+            self.state = 297
+            self.match(OPLangParser.ID)
+            self.state = 300
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==4:
+                self.state = 298
+                self.match(OPLangParser.EXTEND)
+                self.state = 299
+                self.match(OPLangParser.ID)
+
+
+            self.state = 302
+            self.match(OPLangParser.LB)
+            self.state = 303
+            self.class_member()
+            self.state = 304
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stafin(self):
+            return self.getTypedRuleContext(OPLangParser.StafinContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def attr_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_decl_listContext,0)
+
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def attr_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_decl" ):
+                return visitor.visitAttr_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_decl(self):
+
+        localctx = OPLangParser.Attr_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_attr_decl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 306
+            self.stafin()
+            self.state = 313
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,23,self._ctx)
+            if la_ == 1:
+                self.state = 307
+                self.type_()
+                self.state = 308
+                self.attr_decl_list()
+                pass
+
+            elif la_ == 2:
+                self.state = 310
+                self.referencetype()
+                self.state = 311
+                self.attr_decl_list_ref()
+                pass
+
+
+            self.state = 315
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_decl_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attr_name(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Attr_nameContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Attr_nameContext,i)
+
+
+        def vardecl_assign(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Vardecl_assignContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_decl_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_decl_list" ):
+                return visitor.visitAttr_decl_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_decl_list(self):
+
+        localctx = OPLangParser.Attr_decl_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_attr_decl_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 317
+            self.attr_name()
+            self.state = 319
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==57:
+                self.state = 318
+                self.vardecl_assign()
+
+
+            self.state = 328
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 321
+                self.match(OPLangParser.COMMA)
+                self.state = 322
+                self.attr_name()
+                self.state = 324
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==57:
+                    self.state = 323
+                    self.vardecl_assign()
+
+
+                self.state = 330
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_decl_list_refContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attr_name(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Attr_nameContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Attr_nameContext,i)
+
+
+        def vardecl_assign(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Vardecl_assignContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_decl_list_ref
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_decl_list_ref" ):
+                return visitor.visitAttr_decl_list_ref(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_decl_list_ref(self):
+
+        localctx = OPLangParser.Attr_decl_list_refContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_attr_decl_list_ref)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 331
+            self.attr_name()
+            self.state = 332
+            self.vardecl_assign()
+            self.state = 339
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 333
+                self.match(OPLangParser.COMMA)
+                self.state = 334
+                self.attr_name()
+                self.state = 335
+                self.vardecl_assign()
+                self.state = 341
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_nameContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_name
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_name" ):
+                return visitor.visitAttr_name(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_name(self):
+
+        localctx = OPLangParser.Attr_nameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_attr_name)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 342
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Class_memberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def decl(self):
+            return self.getTypedRuleContext(OPLangParser.DeclContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_class_member
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass_member" ):
+                return visitor.visitClass_member(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def class_member(self):
+
+        localctx = OPLangParser.Class_memberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_class_member)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 344
+            self.decl()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def normal_func(self):
+            return self.getTypedRuleContext(OPLangParser.Normal_funcContext,0)
+
+
+        def constructor(self):
+            return self.getTypedRuleContext(OPLangParser.ConstructorContext,0)
+
+
+        def destructor(self):
+            return self.getTypedRuleContext(OPLangParser.DestructorContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_decl" ):
+                return visitor.visitFunc_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_decl(self):
+
+        localctx = OPLangParser.Func_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_func_decl)
+        try:
+            self.state = 349
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,28,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 346
+                self.normal_func()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 347
+                self.constructor()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 348
+                self.destructor()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Normal_funcContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def main_func(self):
+            return self.getTypedRuleContext(OPLangParser.Main_funcContext,0)
+
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def func_param_list(self):
+            return self.getTypedRuleContext(OPLangParser.Func_param_listContext,0)
+
+
+        def STA(self):
+            return self.getToken(OPLangParser.STA, 0)
+
+        def func_type(self):
+            return self.getTypedRuleContext(OPLangParser.Func_typeContext,0)
+
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_normal_func
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNormal_func" ):
+                return visitor.visitNormal_func(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def normal_func(self):
+
+        localctx = OPLangParser.Normal_funcContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 78, self.RULE_normal_func)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 352
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==12:
+                self.state = 351
+                self.match(OPLangParser.STA)
+
+
+            self.state = 367
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
+            if la_ == 1:
+                self.state = 354
+                self.main_func()
+                self.state = 355
+                self.match(OPLangParser.LRB)
+                self.state = 356
+                self.match(OPLangParser.RRB)
+                pass
+
+            elif la_ == 2:
+                self.state = 360
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,30,self._ctx)
+                if la_ == 1:
+                    self.state = 358
+                    self.func_type()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 359
+                    self.referencetype()
+                    pass
+
+
+                self.state = 362
+                self.match(OPLangParser.ID)
+                self.state = 363
+                self.match(OPLangParser.LRB)
+                self.state = 364
+                self.func_param_list()
+                self.state = 365
+                self.match(OPLangParser.RRB)
+                pass
+
+
+            self.state = 369
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def func_param_list(self):
+            return self.getTypedRuleContext(OPLangParser.Func_param_listContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_constructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstructor" ):
+                return visitor.visitConstructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constructor(self):
+
+        localctx = OPLangParser.ConstructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 80, self.RULE_constructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 371
+            self.match(OPLangParser.ID)
+            self.state = 372
+            self.match(OPLangParser.LRB)
+            self.state = 373
+            self.func_param_list()
+            self.state = 374
+            self.match(OPLangParser.RRB)
+            self.state = 375
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DestructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_destructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDestructor" ):
+                return visitor.visitDestructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def destructor(self):
+
+        localctx = OPLangParser.DestructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 82, self.RULE_destructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 377
+            self.match(OPLangParser.T__0)
+            self.state = 378
+            self.match(OPLangParser.ID)
+            self.state = 379
+            self.match(OPLangParser.LRB)
+            self.state = 380
+            self.match(OPLangParser.RRB)
+            self.state = 381
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_param_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def func_param_prime(self):
+            return self.getTypedRuleContext(OPLangParser.Func_param_primeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param_list" ):
+                return visitor.visitFunc_param_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param_list(self):
+
+        localctx = OPLangParser.Func_param_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 84, self.RULE_func_param_list)
+        try:
+            self.state = 385
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 7, 8, 58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 383
+                self.func_param_prime()
+                pass
+            elif token in [34]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_param_primeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def func_param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Func_paramContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Func_paramContext,i)
+
+
+        def type_(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.TypeContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.TypeContext,i)
+
+
+        def referencetype(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ReferencetypeContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,i)
+
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.SEMI)
+            else:
+                return self.getToken(OPLangParser.SEMI, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param_prime
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param_prime" ):
+                return visitor.visitFunc_param_prime(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param_prime(self):
+
+        localctx = OPLangParser.Func_param_primeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_func_param_prime)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 389
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,33,self._ctx)
+            if la_ == 1:
+                self.state = 387
+                self.type_()
+                pass
+
+            elif la_ == 2:
+                self.state = 388
+                self.referencetype()
+                pass
+
+
+            self.state = 391
+            self.func_param()
+            self.state = 401
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==29:
+                self.state = 392
+                self.match(OPLangParser.SEMI)
+                self.state = 395
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,34,self._ctx)
+                if la_ == 1:
+                    self.state = 393
+                    self.type_()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 394
+                    self.referencetype()
+                    pass
+
+
+                self.state = 397
+                self.func_param()
+                self.state = 403
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_paramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_name(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Var_nameContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Var_nameContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param" ):
+                return visitor.visitFunc_param(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param(self):
+
+        localctx = OPLangParser.Func_paramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_func_param)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 404
+            self.var_name()
+            self.state = 409
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 405
+                self.match(OPLangParser.COMMA)
+                self.state = 406
+                self.var_name()
+                self.state = 411
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_stmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_decl_no_stafin(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Var_decl_no_stafinContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Var_decl_no_stafinContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_stm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_stm" ):
+                return visitor.visitVar_decl_stm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_stm(self):
+
+        localctx = OPLangParser.Var_decl_stmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_var_decl_stm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 415
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,37,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 412
+                    self.var_decl_no_stafin() 
+                self.state = 417
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,37,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_no_stafinContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def var_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_listContext,0)
+
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def var_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_list_refContext,0)
+
+
+        def FIN(self):
+            return self.getToken(OPLangParser.FIN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_no_stafin
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_no_stafin" ):
+                return visitor.visitVar_decl_no_stafin(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_no_stafin(self):
+
+        localctx = OPLangParser.Var_decl_no_stafinContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 92, self.RULE_var_decl_no_stafin)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 419
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==13:
+                self.state = 418
+                self.match(OPLangParser.FIN)
+
+
+            self.state = 427
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,39,self._ctx)
+            if la_ == 1:
+                self.state = 421
+                self.type_()
+                self.state = 422
+                self.var_decl_list()
+                pass
+
+            elif la_ == 2:
+                self.state = 424
+                self.referencetype()
+                self.state = 425
+                self.var_decl_list_ref()
+                pass
+
+
+            self.state = 429
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stafin(self):
+            return self.getTypedRuleContext(OPLangParser.StafinContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def var_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_listContext,0)
+
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def var_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl" ):
+                return visitor.visitVar_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl(self):
+
+        localctx = OPLangParser.Var_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 94, self.RULE_var_decl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 431
+            self.stafin()
+            self.state = 438
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,40,self._ctx)
+            if la_ == 1:
+                self.state = 432
+                self.type_()
+                self.state = 433
+                self.var_decl_list()
+                pass
+
+            elif la_ == 2:
+                self.state = 435
+                self.referencetype()
+                self.state = 436
+                self.var_decl_list_ref()
+                pass
+
+
+            self.state = 440
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StafinContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STA(self):
+            return self.getToken(OPLangParser.STA, 0)
+
+        def FIN(self):
+            return self.getToken(OPLangParser.FIN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stafin
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStafin" ):
+                return visitor.visitStafin(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stafin(self):
+
+        localctx = OPLangParser.StafinContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 96, self.RULE_stafin)
+        try:
+            self.state = 449
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,41,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 442
+                self.match(OPLangParser.STA)
+                self.state = 443
+                self.match(OPLangParser.FIN)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 444
+                self.match(OPLangParser.FIN)
+                self.state = 445
+                self.match(OPLangParser.STA)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 446
+                self.match(OPLangParser.STA)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 447
+                self.match(OPLangParser.FIN)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_name(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Var_nameContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Var_nameContext,i)
+
+
+        def vardecl_assign(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Vardecl_assignContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_list" ):
+                return visitor.visitVar_decl_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_list(self):
+
+        localctx = OPLangParser.Var_decl_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 98, self.RULE_var_decl_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 451
+            self.var_name()
+            self.state = 453
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==57:
+                self.state = 452
+                self.vardecl_assign()
+
+
+            self.state = 462
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 455
+                self.match(OPLangParser.COMMA)
+                self.state = 456
+                self.var_name()
+                self.state = 458
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==57:
+                    self.state = 457
+                    self.vardecl_assign()
+
+
+                self.state = 464
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_list_refContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_name(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Var_nameContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Var_nameContext,i)
+
+
+        def vardecl_assign(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Vardecl_assignContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_list_ref
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_list_ref" ):
+                return visitor.visitVar_decl_list_ref(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_list_ref(self):
+
+        localctx = OPLangParser.Var_decl_list_refContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 100, self.RULE_var_decl_list_ref)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 465
+            self.var_name()
+            self.state = 466
+            self.vardecl_assign()
+            self.state = 473
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 467
+                self.match(OPLangParser.COMMA)
+                self.state = 468
+                self.var_name()
+                self.state = 469
+                self.vardecl_assign()
+                self.state = 475
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_nameContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_name
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_name" ):
+                return visitor.visitVar_name(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_name(self):
+
+        localctx = OPLangParser.Var_nameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 102, self.RULE_var_name)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 476
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def operand(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.OperandContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.OperandContext,i)
+
+
+        def EQ(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.EQ)
+            else:
+                return self.getToken(OPLangParser.EQ, i)
+
+        def NEQ(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.NEQ)
+            else:
+                return self.getToken(OPLangParser.NEQ, i)
+
+        def LESST(self):
+            return self.getToken(OPLangParser.LESST, 0)
+
+        def LESSEQ(self):
+            return self.getToken(OPLangParser.LESSEQ, 0)
+
+        def MORET(self):
+            return self.getToken(OPLangParser.MORET, 0)
+
+        def MOREEQ(self):
+            return self.getToken(OPLangParser.MOREEQ, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr(self):
+
+        localctx = OPLangParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 104, self.RULE_expr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 478
+            self.operand(0)
+            self.state = 481
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==46 or _la==47:
+                self.state = 479
+                _la = self._input.LA(1)
+                if not(_la==46 or _la==47):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 480
+                self.operand(0)
+
+
+            self.state = 489
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 4222124650659840) != 0):
+                self.state = 483
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 4222124650659840) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 484
+                self.operand(0)
+                self.state = 487
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==46 or _la==47:
+                    self.state = 485
+                    _la = self._input.LA(1)
+                    if not(_la==46 or _la==47):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 486
+                    self.operand(0)
+
+
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OperandContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NEW(self):
+            return self.getToken(OPLangParser.NEW, 0)
+
+        def operand(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.OperandContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.OperandContext,i)
+
+
+        def ADD(self):
+            return self.getToken(OPLangParser.ADD, 0)
+
+        def SUB(self):
+            return self.getToken(OPLangParser.SUB, 0)
+
+        def NOT(self):
+            return self.getToken(OPLangParser.NOT, 0)
+
+        def primary(self):
+            return self.getTypedRuleContext(OPLangParser.PrimaryContext,0)
+
+
+        def CONCAT(self):
+            return self.getToken(OPLangParser.CONCAT, 0)
+
+        def MUL(self):
+            return self.getToken(OPLangParser.MUL, 0)
+
+        def INTDIV(self):
+            return self.getToken(OPLangParser.INTDIV, 0)
+
+        def FLOATDIV(self):
+            return self.getToken(OPLangParser.FLOATDIV, 0)
+
+        def MOD(self):
+            return self.getToken(OPLangParser.MOD, 0)
+
+        def AND(self):
+            return self.getToken(OPLangParser.AND, 0)
+
+        def OR(self):
+            return self.getToken(OPLangParser.OR, 0)
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def callfuncstm(self):
+            return self.getTypedRuleContext(OPLangParser.CallfuncstmContext,0)
+
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_operand
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOperand" ):
+                return visitor.visitOperand(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def operand(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.OperandContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 106
+        self.enterRecursionRule(localctx, 106, self.RULE_operand, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 499
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [55]:
+                self.state = 492
+                self.match(OPLangParser.NEW)
+                self.state = 493
+                self.operand(10)
+                pass
+            elif token in [40, 41]:
+                self.state = 494
+                _la = self._input.LA(1)
+                if not(_la==40 or _la==41):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 495
+                self.operand(7)
+                pass
+            elif token in [54]:
+                self.state = 496
+                self.match(OPLangParser.NOT)
+                self.state = 497
+                self.operand(6)
+                pass
+            elif token in [11, 24, 25, 26, 27, 28, 30, 33, 58]:
+                self.state = 498
+                self.primary()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 526
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 524
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,51,self._ctx)
+                    if la_ == 1:
+                        localctx = OPLangParser.OperandContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operand)
+                        self.state = 501
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 502
+                        self.match(OPLangParser.CONCAT)
+                        self.state = 503
+                        self.operand(6)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = OPLangParser.OperandContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operand)
+                        self.state = 504
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 505
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 65970697666560) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 506
+                        self.operand(5)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = OPLangParser.OperandContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operand)
+                        self.state = 507
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 508
+                        _la = self._input.LA(1)
+                        if not(_la==40 or _la==41):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 509
+                        self.operand(4)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = OPLangParser.OperandContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operand)
+                        self.state = 510
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 511
+                        _la = self._input.LA(1)
+                        if not(_la==52 or _la==53):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 512
+                        self.operand(3)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = OPLangParser.OperandContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operand)
+                        self.state = 513
+                        if not self.precpred(self._ctx, 9):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
+                        self.state = 514
+                        self.match(OPLangParser.DOT)
+                        self.state = 517
+                        self._errHandler.sync(self)
+                        la_ = self._interp.adaptivePredict(self._input,50,self._ctx)
+                        if la_ == 1:
+                            self.state = 515
+                            self.callfuncstm()
+                            pass
+
+                        elif la_ == 2:
+                            self.state = 516
+                            self.match(OPLangParser.ID)
+                            pass
+
+
+                        pass
+
+                    elif la_ == 6:
+                        localctx = OPLangParser.OperandContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operand)
+                        self.state = 519
+                        if not self.precpred(self._ctx, 8):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
+                        self.state = 520
+                        self.match(OPLangParser.LSB)
+                        self.state = 521
+                        self.expr()
+                        self.state = 522
+                        self.match(OPLangParser.RSB)
+                        pass
+
+             
+                self.state = 528
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class PrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def FLOATLIT(self):
+            return self.getToken(OPLangParser.FLOATLIT, 0)
+
+        def STRINGLIT(self):
+            return self.getToken(OPLangParser.STRINGLIT, 0)
+
+        def BOOLLIT(self):
+            return self.getToken(OPLangParser.BOOLLIT, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def callfuncstm(self):
+            return self.getTypedRuleContext(OPLangParser.CallfuncstmContext,0)
+
+
+        def array(self):
+            return self.getTypedRuleContext(OPLangParser.ArrayContext,0)
+
+
+        def THIS(self):
+            return self.getToken(OPLangParser.THIS, 0)
+
+        def NIL(self):
+            return self.getToken(OPLangParser.NIL, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_primary
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimary" ):
+                return visitor.visitPrimary(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primary(self):
+
+        localctx = OPLangParser.PrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 108, self.RULE_primary)
+        try:
+            self.state = 542
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,53,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 529
+                self.match(OPLangParser.INTLIT)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 530
+                self.match(OPLangParser.FLOATLIT)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 531
+                self.match(OPLangParser.STRINGLIT)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 532
+                self.match(OPLangParser.BOOLLIT)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 533
+                self.match(OPLangParser.ID)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 534
+                self.callfuncstm()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 535
+                self.array()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 536
+                self.match(OPLangParser.THIS)
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 537
+                self.match(OPLangParser.NIL)
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 538
+                self.match(OPLangParser.LRB)
+                self.state = 539
+                self.expr()
+                self.state = 540
+                self.match(OPLangParser.RRB)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[53] = self.operand_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def operand_sempred(self, localctx:OperandContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 4)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 2)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 9)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 8)
+         
+
+
+
+
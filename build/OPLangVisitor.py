@@ -0,0 +1,288 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .OPLangParser import OPLangParser
+else:
+    from OPLangParser import OPLangParser
+
+# This class defines a complete generic visitor for a parse tree produced by OPLangParser.
+
+class OPLangVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by OPLangParser#program.
+    def visitProgram(self, ctx:OPLangParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#array.
+    def visitArray(self, ctx:OPLangParser.ArrayContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#array_element_list.
+    def visitArray_element_list(self, ctx:OPLangParser.Array_element_listContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#func_type.
+    def visitFunc_type(self, ctx:OPLangParser.Func_typeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#type.
+    def visitType(self, ctx:OPLangParser.TypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#primitivetype.
+    def visitPrimitivetype(self, ctx:OPLangParser.PrimitivetypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#arraytype.
+    def visitArraytype(self, ctx:OPLangParser.ArraytypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#arraytype_primitive.
+    def visitArraytype_primitive(self, ctx:OPLangParser.Arraytype_primitiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#arraytype_non_primitive.
+    def visitArraytype_non_primitive(self, ctx:OPLangParser.Arraytype_non_primitiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#referencetype.
+    def visitReferencetype(self, ctx:OPLangParser.ReferencetypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#classtype.
+    def visitClasstype(self, ctx:OPLangParser.ClasstypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#main_func.
+    def visitMain_func(self, ctx:OPLangParser.Main_funcContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#blockstm.
+    def visitBlockstm(self, ctx:OPLangParser.BlockstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#stmlist.
+    def visitStmlist(self, ctx:OPLangParser.StmlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#stm.
+    def visitStm(self, ctx:OPLangParser.StmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#assingstm.
+    def visitAssingstm(self, ctx:OPLangParser.AssingstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#vardecl_assign.
+    def visitVardecl_assign(self, ctx:OPLangParser.Vardecl_assignContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#ifstm.
+    def visitIfstm(self, ctx:OPLangParser.IfstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#elsestm.
+    def visitElsestm(self, ctx:OPLangParser.ElsestmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#forstm.
+    def visitForstm(self, ctx:OPLangParser.ForstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#breakstm.
+    def visitBreakstm(self, ctx:OPLangParser.BreakstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#continuestm.
+    def visitContinuestm(self, ctx:OPLangParser.ContinuestmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#returnstm.
+    def visitReturnstm(self, ctx:OPLangParser.ReturnstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#invocationstm.
+    def visitInvocationstm(self, ctx:OPLangParser.InvocationstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#invocationstm_frame.
+    def visitInvocationstm_frame(self, ctx:OPLangParser.Invocationstm_frameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#dotting.
+    def visitDotting(self, ctx:OPLangParser.DottingContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#callfuncstm.
+    def visitCallfuncstm(self, ctx:OPLangParser.CallfuncstmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#input_func_param_list.
+    def visitInput_func_param_list(self, ctx:OPLangParser.Input_func_param_listContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#input_func_param_prime.
+    def visitInput_func_param_prime(self, ctx:OPLangParser.Input_func_param_primeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#input_func_param.
+    def visitInput_func_param(self, ctx:OPLangParser.Input_func_paramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#decl.
+    def visitDecl(self, ctx:OPLangParser.DeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#class_decl_list.
+    def visitClass_decl_list(self, ctx:OPLangParser.Class_decl_listContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#class_decl.
+    def visitClass_decl(self, ctx:OPLangParser.Class_declContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attr_decl.
+    def visitAttr_decl(self, ctx:OPLangParser.Attr_declContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attr_decl_list.
+    def visitAttr_decl_list(self, ctx:OPLangParser.Attr_decl_listContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attr_decl_list_ref.
+    def visitAttr_decl_list_ref(self, ctx:OPLangParser.Attr_decl_list_refContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attr_name.
+    def visitAttr_name(self, ctx:OPLangParser.Attr_nameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#class_member.
+    def visitClass_member(self, ctx:OPLangParser.Class_memberContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#func_decl.
+    def visitFunc_decl(self, ctx:OPLangParser.Func_declContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#normal_func.
+    def visitNormal_func(self, ctx:OPLangParser.Normal_funcContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#constructor.
+    def visitConstructor(self, ctx:OPLangParser.ConstructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#destructor.
+    def visitDestructor(self, ctx:OPLangParser.DestructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#func_param_list.
+    def visitFunc_param_list(self, ctx:OPLangParser.Func_param_listContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#func_param_prime.
+    def visitFunc_param_prime(self, ctx:OPLangParser.Func_param_primeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#func_param.
+    def visitFunc_param(self, ctx:OPLangParser.Func_paramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#var_decl_stm.
+    def visitVar_decl_stm(self, ctx:OPLangParser.Var_decl_stmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#var_decl_no_stafin.
+    def visitVar_decl_no_stafin(self, ctx:OPLangParser.Var_decl_no_stafinContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#var_decl.
+    def visitVar_decl(self, ctx:OPLangParser.Var_declContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#stafin.
+    def visitStafin(self, ctx:OPLangParser.StafinContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#var_decl_list.
+    def visitVar_decl_list(self, ctx:OPLangParser.Var_decl_listContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#var_decl_list_ref.
+    def visitVar_decl_list_ref(self, ctx:OPLangParser.Var_decl_list_refContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#var_name.
+    def visitVar_name(self, ctx:OPLangParser.Var_nameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#expr.
+    def visitExpr(self, ctx:OPLangParser.ExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#operand.
+    def visitOperand(self, ctx:OPLangParser.OperandContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#primary.
+    def visitPrimary(self, ctx:OPLangParser.PrimaryContext):
+        return self.visitChildren(ctx)
+
+
+
+del OPLangParser
\ No newline at end of file
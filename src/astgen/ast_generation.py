@@ -5,13 +5,120 @@ into Abstract Syntax Trees using the visitor pattern.
 """
 
 from functools import reduce
+from antlr4.tree.Tree import TerminalNode
 from build.OPLangVisitor import OPLangVisitor
 from build.OPLangParser import OPLangParser
 from src.utils.nodes import *
 
 
+def _span(node, first, last):
+    """Give `node` the position of the source text from token `first` to token `last`"""
+    return node.set_position(first.line, first.column, last.stop + 1)
+
+
+def frame_expression(expr, ops, line, column):
+    """The target of an invocation or assignment statement: `expr` followed by `ops`.
+
+    `ops` are the member accesses, calls and indexes after the primary, in
+    source order, and must end in a member access or call, plus at most an
+    index after a member access; otherwise returns None. Nesting follows
+    the original grammar, where the target was an expression followed by
+    one or more dot operations and the expression took as many of `ops`
+    as it could. Each operation of the expression wraps the expression so
+    far, an index it could only take as `.ID[expr]` in the middle of the
+    chain is dropped, and the remaining operations go into one
+    PostfixExpression without their indexes. Chains that grammar rejected,
+    with another index before a member access, end the expression at the
+    last dot operation instead.
+    """
+    dots = [i for i, op in enumerate(ops) if type(op) is not ArrayAccess]
+    if not dots or len(ops) - dots[-1] > 2:
+        return None
+    if len(ops) - dots[-1] == 2 and type(ops[-2]) is not MemberAccess:
+        return None
+    # An index is droppable when it directly follows a member access. The
+    # original expression could not take a member after any other index,
+    # and its trailing dot operations could not hold one either
+    last_bad, blocked = -1, len(ops)
+    for i, op in enumerate(ops):
+        if type(op) is ArrayAccess:
+            if i == 0 or type(ops[i - 1]) is not MemberAccess:
+                last_bad = i
+        elif last_bad >= 0 and blocked == len(ops):
+            blocked = i
+    split = next((i for i in reversed(dots) if last_bad < i <= blocked), dots[-1])
+    trailing = split
+    while trailing > 0 and type(ops[trailing - 1]) is ArrayAccess:
+        trailing -= 1
+    for i in range(split):
+        op = ops[i]
+        if type(op) is not ArrayAccess or i >= trailing or i == 0 or type(ops[i - 1]) is not MemberAccess:
+            expr = PostfixExpression(expr, [op]).set_position(line, column, op.end)
+    return PostfixExpression(expr, [op for op in ops[split:] if type(op) is not ArrayAccess])
+
+
+# Expressions without side effects, which hash-consing may share
+PURE_EXPRESSIONS = frozenset((
+    IntLiteral, FloatLiteral, BoolLiteral, StringLiteral, NilLiteral, ArrayLiteral,
+    Identifier, ThisExpression, BinaryOp, UnaryOp, ParenthesizedExpression,
+    PostfixExpression, MemberAccess, ArrayAccess,
+))
+
+
 class ASTGeneration(OPLangVisitor):
-    """AST Generation visitor that converts parse tree to AST nodes."""
+    """AST Generation visitor that converts parse tree to AST nodes.
+
+    Every node gets the source position of the context it was built from;
+    nodes built without a context of their own (declarators, postfix
+    operations, comparisons, ...) are positioned from their tokens.
+
+    With `hash_cons`, structurally equal pure expressions (see
+    `PURE_EXPRESSIONS`) are built once and shared; a shared node keeps the
+    position of its first occurrence.
+    """
+
+    def __init__(self, hash_cons: bool = False):
+        super().__init__()
+        self._shared = {} if hash_cons else None
+        self._shared_ids = set()
+
+    def visit(self, tree):
+        """Visit `tree` and give the node it returns the span of `tree`, unless already positioned"""
+        node = tree.accept(self)
+        if isinstance(node, ASTNode):
+            if not node._position and tree.stop is not None:
+                _span(node, tree.start, tree.stop)
+            if self._shared is not None:
+                node = self._share(node)
+        return node
+
+    def _share(self, node):
+        """The shared node equal to `node` if it is a pure expression of shared parts, else `node`"""
+        shared_ids = self._shared_ids
+        if id(node) in shared_ids or type(node) not in PURE_EXPRESSIONS:
+            return node
+        # Children built without a visit of their own have not been shared
+        # yet. Once they are, equal children are the same object, so the
+        # node is keyed by its class, its values and its children's ids
+        key = [type(node)]
+        for name in node._fields:
+            value = getattr(node, name)
+            if type(value) is list:
+                value[:] = [self._share(item) for item in value]
+                if not all(id(item) in shared_ids for item in value):
+                    return node
+                key.append(tuple(map(id, value)))
+            elif hasattr(value, "_fields"):
+                value = self._share(value)
+                if id(value) not in shared_ids:
+                    return node
+                setattr(node, name, value)
+                key.append(id(value))
+            else:
+                key.append(value)
+        shared = self._shared.setdefault(tuple(key), node)
+        self._shared_ids.add(id(shared))
+        return shared
 
     # ============================================================================
     # Program and Top-level
@@ -23,13 +130,8 @@ class ASTGeneration(OPLangVisitor):
         return Program(class_decls)
 
     def visitClass_decl_list(self, ctx: OPLangParser.Class_decl_listContext):
-        """Visit class_decl_list: class_decl class_decl_list | class_decl"""
-        class_decls = []
-        # Handle both cases: single class_decl or class_decl followed by class_decl_list
-        class_decls.append(self.visit(ctx.class_decl()))
-        if ctx.class_decl_list():
-            class_decls.extend(self.visit(ctx.class_decl_list()))
-        return class_decls
+        """Visit class_decl_list: class_decl+"""
+        return [self.visit(class_decl) for class_decl in ctx.class_decl()]
 
     def visitClass_decl(self, ctx: OPLangParser.Class_declContext):
         """Visit class declaration with optional extends"""
@@ -50,31 +152,17 @@ class ASTGeneration(OPLangVisitor):
         return self.visit(ctx.decl()) if ctx.decl() else []
 
     def visitDecl(self, ctx: OPLangParser.DeclContext):
-        """Visit decl: (attr_decl|func_decl) decl | empty"""
-        current_decl = []
-        
-        if ctx.attr_decl():
-            current_decl = [self.visit(ctx.attr_decl())]
-        elif ctx.func_decl():
-            current_decl = [self.visit(ctx.func_decl())]
-        
-        # Get remaining declarations recursively
-        remaining_decls = self.visit(ctx.decl()) if ctx.decl() else []
-        
-        return current_decl + remaining_decls
+        """Visit decl: (attr_decl|func_decl)*"""
+        # Children are attr_decl/func_decl contexts in source order
+        return [self.visit(member) for member in ctx.getChildren()]
 
     # ============================================================================
     # Variable/Attribute Declarations
     # ============================================================================
 
     def visitVar_decl_stm(self, ctx: OPLangParser.Var_decl_stmContext):
-        """Visit var_decl_stm: var_decl_no_stafin var_decl_stm | empty"""
-        var_decls = []
-        if ctx.var_decl_no_stafin():
-            var_decls.append(self.visit(ctx.var_decl_no_stafin()))
-        if ctx.var_decl_stm():
-            var_decls.extend(self.visit(ctx.var_decl_stm()))
-        return var_decls
+        """Visit var_decl_stm: var_decl_no_stafin*"""
+        return [self.visit(var_decl) for var_decl in ctx.var_decl_no_stafin()]
 
     def visitStafin(self, ctx: OPLangParser.StafinContext):
         """Visit stafin: STA FIN | FIN STA | STA | FIN | empty"""
@@ -85,43 +173,36 @@ class ASTGeneration(OPLangVisitor):
             modifiers.append('final')
         return modifiers
 
+    def _visit_declarators(self, ctx, node_class):
+        """Visit a flat `name (:= expr)? (COMMA name (:= expr)?)*` list"""
+        declarators = []
+        children = ctx.children
+        last = len(children) - 1
+        for i, child in enumerate(children):
+            if isinstance(child, (OPLangParser.Var_nameContext, OPLangParser.Attr_nameContext)):
+                following = children[i + 1] if i < last else None
+                if isinstance(following, OPLangParser.Vardecl_assignContext):
+                    declarator = node_class(child.getText(), self.visit(following))
+                    declarators.append(_span(declarator, child.start, following.stop))
+                else:
+                    declarators.append(_span(node_class(child.getText()), child.start, child.stop))
+        return declarators
+
     # Dùng cho AttributeDecl (thuộc tính trong class)
     def _visit_var_decl_list_as_attributes(self, ctx: OPLangParser.Var_decl_listContext):
-        attributes = []
-        var_name = ctx.var_name().getText()
-        init_value = self.visit(ctx.vardecl_assign()) if ctx.vardecl_assign() else None
-        attributes.append(Attribute(var_name, init_value))
-        if ctx.var_decl_list():
-            attributes.extend(self._visit_var_decl_list_as_attributes(ctx.var_decl_list()))
-        return attributes
+        return self._visit_declarators(ctx, Attribute)
 
     def _visit_var_decl_list_ref_as_attributes(self, ctx: OPLangParser.Var_decl_list_refContext):
-        attributes = []
-        var_name = ctx.var_name().getText()
-        init_value = self.visit(ctx.vardecl_assign())
-        attributes.append(Attribute(var_name, init_value))
-        if ctx.var_decl_list_ref():
-            attributes.extend(self._visit_var_decl_list_ref_as_attributes(ctx.var_decl_list_ref()))
-        return attributes
+        return self._visit_declarators(ctx, Attribute)
 
     # Dùng cho VariableDecl (biến cục bộ)
     def visitVar_decl_list(self, ctx: OPLangParser.Var_decl_listContext):
-        variables = []
-        var_name = ctx.var_name().getText()
-        init_value = self.visit(ctx.vardecl_assign()) if ctx.vardecl_assign() else None
-        variables.append(Variable(var_name, init_value))
-        if ctx.var_decl_list():
-            variables.extend(self.visit(ctx.var_decl_list()))
-        return variables
+        """Visit var_decl_list: var_name vardecl_assign? (COMMA var_name vardecl_assign?)*"""
+        return self._visit_declarators(ctx, Variable)
 
     def visitVar_decl_list_ref(self, ctx: OPLangParser.Var_decl_list_refContext):
-        variables = []
-        var_name = ctx.var_name().getText()
-        init_value = self.visit(ctx.vardecl_assign())
-        variables.append(Variable(var_name, init_value))
-        if ctx.var_decl_list_ref():
-            variables.extend(self.visit(ctx.var_decl_list_ref()))
-        return variables
+        """Visit var_decl_list_ref: var_name vardecl_assign (COMMA var_name vardecl_assign)*"""
+        return self._visit_declarators(ctx, Variable)
 
     # Trong visitVar_decl, gọi helper tạo Attribute
     def visitAttr_decl(self, ctx: OPLangParser.Attr_declContext):
@@ -141,23 +222,11 @@ class ASTGeneration(OPLangVisitor):
 
     def _visit_attr_decl_list_as_attributes(self, ctx: OPLangParser.Attr_decl_listContext):
         """Helper to visit attr_decl_list and create Attribute objects"""
-        attributes = []
-        attr_name = ctx.attr_name().getText()
-        init_value = self.visit(ctx.vardecl_assign()) if ctx.vardecl_assign() else None
-        attributes.append(Attribute(attr_name, init_value))
-        if ctx.attr_decl_list():
-            attributes.extend(self._visit_attr_decl_list_as_attributes(ctx.attr_decl_list()))
-        return attributes
+        return self._visit_declarators(ctx, Attribute)
 
     def _visit_attr_decl_list_ref_as_attributes(self, ctx: OPLangParser.Attr_decl_list_refContext):
         """Helper to visit attr_decl_list_ref and create Attribute objects"""
-        attributes = []
-        attr_name = ctx.attr_name().getText()
-        init_value = self.visit(ctx.vardecl_assign())
-        attributes.append(Attribute(attr_name, init_value))
-        if ctx.attr_decl_list_ref():
-            attributes.extend(self._visit_attr_decl_list_ref_as_attributes(ctx.attr_decl_list_ref()))
-        return attributes
+        return self._visit_declarators(ctx, Attribute)
 
     # Trong visitVar_decl_no_stafin, gọi helper tạo Variable
     def visitVar_decl_no_stafin(self, ctx: OPLangParser.Var_decl_no_stafinContext):
@@ -196,7 +265,8 @@ class ASTGeneration(OPLangVisitor):
         
         # Check if it's main function
         if ctx.main_func():
-            return_type = PrimitiveType("void")
+            void = ctx.main_func().VOID().getSymbol()
+            return_type = _span(PrimitiveType("void"), void, void)
             name = "main"
             params = []
         else:
@@ -213,33 +283,9 @@ class ASTGeneration(OPLangVisitor):
         return MethodDecl(is_static, return_type, name, params, body)
 
     def visitConstructor(self, ctx: OPLangParser.ConstructorContext):
-        """Visit constructor: default_constructor | copy_constructor | user_constructor"""
-        if ctx.default_constructor():
-            return self.visit(ctx.default_constructor())
-        elif ctx.copy_constructor():
-            return self.visit(ctx.copy_constructor())
-        else:  # user_constructor
-            return self.visit(ctx.user_constructor())
-
-    def visitDefault_constructor(self, ctx: OPLangParser.Default_constructorContext):
-        """Visit default_constructor: ID LRB RRB blockstm"""
+        """Visit constructor: ID LRB func_param_list RRB blockstm"""
         name = ctx.ID().getText()
-        body = self.visit(ctx.blockstm())
-        return ConstructorDecl(name, [], body)
-
-    def visitCopy_constructor(self, ctx: OPLangParser.Copy_constructorContext):
-        """Visit copy_constructor: ID LRB ID ID RRB blockstm"""
-        name = ctx.ID(0).getText()
-        param_type = ClassType(ctx.ID(1).getText())
-        param_name = ctx.ID(2).getText()
-        params = [Parameter(param_type, param_name)]
-        body = self.visit(ctx.blockstm())
-        return ConstructorDecl(name, params, body)
-
-    def visitUser_constructor(self, ctx: OPLangParser.User_constructorContext):
-        """Visit user_constructor: ID LRB func_param_list RRB blockstm"""
-        name = ctx.ID().getText()
-        params = self.visit(ctx.func_param_list()) if ctx.func_param_list() else []
+        params = self.visit(ctx.func_param_list())
         body = self.visit(ctx.blockstm())
         return ConstructorDecl(name, params, body)
 
@@ -256,34 +302,20 @@ class ASTGeneration(OPLangVisitor):
         return []
 
     def visitFunc_param_prime(self, ctx: OPLangParser.Func_param_primeContext):
-        """Visit func_param_prime"""
+        """Visit func_param_prime: (type | referencetype) func_param (SEMI (type | referencetype) func_param)*"""
         params = []
-        
-        # Get parameter type
-        if ctx.type_():
-            param_type = self.visit(ctx.type_())
-        else:  # referencetype
-            param_type = self.visit(ctx.referencetype())
-            
-        # Get parameter names from func_param
-        param_names = self.visit(ctx.func_param())
-        for name in param_names:
-            params.append(Parameter(param_type, name))
-            
-        # Process remaining parameters if any
-        if ctx.func_param_prime():
-            params.extend(self.visit(ctx.func_param_prime()))
-            
+        param_type = None
+        for child in ctx.getChildren():
+            if isinstance(child, (OPLangParser.TypeContext, OPLangParser.ReferencetypeContext)):
+                param_type = self.visit(child)
+            elif isinstance(child, OPLangParser.Func_paramContext):
+                for var_name in child.var_name():
+                    params.append(_span(Parameter(param_type, var_name.getText()), var_name.start, var_name.stop))
         return params
 
     def visitFunc_param(self, ctx: OPLangParser.Func_paramContext):
-        """Visit func_param: var_name COMMA func_param | var_name"""
-        param_names = [ctx.var_name().getText()]
-        
-        if ctx.func_param():
-            param_names.extend(self.visit(ctx.func_param()))
-            
-        return param_names
+        """Visit func_param: var_name (COMMA var_name)*"""
+        return [var_name.getText() for var_name in ctx.var_name()]
 
     # ============================================================================
     # Type System
@@ -330,7 +362,8 @@ class ASTGeneration(OPLangVisitor):
 
     def visitArraytype_non_primitive(self, ctx: OPLangParser.Arraytype_non_primitiveContext):
         """Visit arraytype_non_primitive: ID LSB INTLIT RSB"""
-        element_type = ClassType(ctx.ID().getText())
+        class_name = ctx.ID().getSymbol()
+        element_type = _span(ClassType(class_name.text), class_name, class_name)
         size = int(ctx.INTLIT().getText())
         return ArrayType(element_type, size)
 
@@ -359,13 +392,8 @@ class ASTGeneration(OPLangVisitor):
         return BlockStatement(var_decls, statements)
 
     def visitStmlist(self, ctx: OPLangParser.StmlistContext):
-        """Visit stmlist: stm stmlist | empty"""
-        statements = []
-        if ctx.stm():
-            statements.append(self.visit(ctx.stm()))
-        if ctx.stmlist():
-            statements.extend(self.visit(ctx.stmlist()))
-        return statements
+        """Visit stmlist: stm*"""
+        return [self.visit(stm) for stm in ctx.stm()]
 
     def visitStm(self, ctx: OPLangParser.StmContext):
         """Visit stm: various statement types"""
@@ -391,17 +419,22 @@ class ASTGeneration(OPLangVisitor):
         # Determine LHS type based on what's present
         if ctx.invocationstm_frame():
             # Method/member access on LHS (like obj.field or obj.method())
-            postfix_expr = self.visit(ctx.invocationstm_frame())
-            lhs = PostfixLHS(postfix_expr)
+            frame = ctx.invocationstm_frame()
+            postfix_expr = self.visit(frame)
+            lhs = _span(PostfixLHS(postfix_expr), frame.start, frame.stop)
         elif ctx.ID() and ctx.LSB():  
             # Array access (ID[expr])
-            name = ctx.ID().getText()  # Không dùng index
+            name = ctx.ID().getSymbol()  # Không dùng index
             index = self.visit(ctx.expr())
-            array_access = PostfixExpression(Identifier(name), [ArrayAccess(index)])
-            lhs = PostfixLHS(array_access)
+            rsb = ctx.RSB().getSymbol()
+            array_access = PostfixExpression(
+                _span(Identifier(name.text), name, name),
+                [_span(ArrayAccess(index), ctx.LSB().getSymbol(), rsb)])
+            lhs = _span(PostfixLHS(_span(array_access, name, rsb)), name, rsb)
         elif ctx.ID():  
             # Simple ID
-            lhs = IdLHS(ctx.ID().getText())  # Không dùng index
+            name = ctx.ID().getSymbol()
+            lhs = _span(IdLHS(name.text), name, name)  # Không dùng index
         else:
             # Should not reach here if grammar is correct
             raise Exception("Invalid assignment statement")
@@ -409,18 +442,18 @@ class ASTGeneration(OPLangVisitor):
         rhs = self.visit(ctx.vardecl_assign())
         return AssignmentStatement(lhs, rhs)
 
+    def _visit_header_expr(self, ctx: OPLangParser.ExprContext):
+        """Visit an if/for header expr, dropping one pair of enclosing parentheses"""
+        expr = self.visit(ctx)
+        if isinstance(expr, ParenthesizedExpression):
+            return expr.expr
+        return expr
+
     def visitIfstm(self, ctx: OPLangParser.IfstmContext):
-        """Visit if statement"""
-        # Get condition expression
-        condition = self.visit(ctx.expr())
-        
-        # Get then statement/block
-        # Kiểm tra xem phần THEN là blockstm hay stm
-        if ctx.blockstm():
-            then_stmt = self.visit(ctx.blockstm())  # Không dùng index
-        else:
-            then_stmt = self.visit(ctx.stm())  # Không dùng index
-            
+        """Visit ifstm: IF expr THEN stm elsestm"""
+        condition = self._visit_header_expr(ctx.expr())
+        then_stmt = self.visit(ctx.stm())
+
         # Get else statement/block from elsestm if exists
         else_stmt = None
         if ctx.elsestm():
@@ -429,27 +462,18 @@ class ASTGeneration(OPLangVisitor):
         return IfStatement(condition, then_stmt, else_stmt)
     
     def visitElsestm(self, ctx: OPLangParser.ElsestmContext):
-        """Visit elsestm: ELSE (stm | blockstm) | empty"""
+        """Visit elsestm: ELSE stm | empty"""
         if ctx.ELSE():
-            # There is an else clause
-            if ctx.blockstm():
-                return self.visit(ctx.blockstm())
-            else:
-                return self.visit(ctx.stm())
+            return self.visit(ctx.stm())
         return None  # No else clause
 
     def visitForstm(self, ctx: OPLangParser.ForstmContext):
-        """Visit for statement"""
+        """Visit forstm: FOR ID ASSIGN expr (TO|DOWNTO) expr DO stm"""
         variable = ctx.ID().getText()
-        start_expr = self.visit(ctx.expr(0))
+        start_expr = self._visit_header_expr(ctx.expr(0))
         direction = "to" if ctx.TO() else "downto"
-        end_expr = self.visit(ctx.expr(1))
-        
-        if ctx.blockstm():
-            body = self.visit(ctx.blockstm())
-        else:
-            body = self.visit(ctx.stm())
-            
+        end_expr = self._visit_header_expr(ctx.expr(1))
+        body = self.visit(ctx.stm())
         return ForStatement(variable, start_expr, direction, end_expr, body)
 
     def visitBreakstm(self, ctx: OPLangParser.BreakstmContext):
@@ -472,150 +496,98 @@ class ASTGeneration(OPLangVisitor):
         return MethodInvocationStatement(method_call)
 
     def visitInvocationstm_frame(self, ctx: OPLangParser.Invocationstm_frameContext):
-        """Visit invocationstm_frame: expr dotting"""
-        left_expr = self.visit(ctx.expr())
-        postfix_ops = self.visit(ctx.dotting())
-        return PostfixExpression(left_expr, postfix_ops)
+        """Visit invocationstm_frame: NEW? primary (DOT (callfuncstm | ID) | LSB expr RSB)* dotting"""
+        primary = ctx.primary()
+        expr = self.visit(primary)
+        if ctx.NEW():
+            expr = _span(self._object_creation(expr), ctx.start, primary.stop)
+        ops = []
+        children = ctx.children
+        for i, child in enumerate(children):
+            if isinstance(child, OPLangParser.DottingContext):
+                ops.extend(self.visit(child))
+            elif isinstance(child, OPLangParser.CallfuncstmContext):
+                ops.append(self.visit(child))
+            elif isinstance(child, OPLangParser.ExprContext):
+                ops.append(_span(ArrayAccess(self.visit(child)), children[i - 1].getSymbol(),
+                                 children[i + 1].getSymbol()))
+            elif isinstance(child, TerminalNode) and child.getSymbol().type == OPLangParser.ID:
+                name = child.getSymbol()
+                ops.append(_span(MemberAccess(name.text), name, name))
+        return frame_expression(expr, ops, ctx.start.line, ctx.start.column)
 
     # ============================================================================
     # Expressions
     # ============================================================================
 
     def visitExpr(self, ctx: OPLangParser.ExprContext):
-        """Visit expr: comparison operators"""
-        if ctx.getChildCount() == 3:
-            left = self.visit(ctx.expr1(0))
-            right = self.visit(ctx.expr1(1))
-            if ctx.LESST():
-                op = "<"
-            elif ctx.LESSEQ():
-                op = "<="
-            elif ctx.MORET():
-                op = ">"
-            else:  # MOREEQ
-                op = ">="
-            return BinaryOp(left, op, right)
-        return self.visit(ctx.expr1(0))
-
-    def visitExpr1(self, ctx: OPLangParser.Expr1Context):
-        """Visit expr1: equality operators"""
-        if ctx.getChildCount() == 3:
-            left = self.visit(ctx.expr2(0))
-            right = self.visit(ctx.expr2(1))
-            op = "==" if ctx.EQ() else "!="
-            return BinaryOp(left, op, right)
-        return self.visit(ctx.expr2(0))
-
-    def visitExpr2(self, ctx: OPLangParser.Expr2Context):
-        """Visit expr2: logical operators"""
-        if ctx.getChildCount() > 1:
-            left = self.visit(ctx.expr2())
-            right = self.visit(ctx.expr3())
-            op = "&&" if ctx.AND() else "||"
-            return BinaryOp(left, op, right)
-        return self.visit(ctx.expr3())
-
-    def visitExpr3(self, ctx: OPLangParser.Expr3Context):
-        """Visit expr3: addition/subtraction"""
-        if ctx.getChildCount() > 1:
-            left = self.visit(ctx.expr3())
-            right = self.visit(ctx.expr4())
-            op = "+" if ctx.ADD() else "-"
-            return BinaryOp(left, op, right)
-        return self.visit(ctx.expr4())
-
-    def visitExpr4(self, ctx: OPLangParser.Expr4Context):
-        """Visit expr4: multiplication/division/modulo"""
-        if ctx.getChildCount() > 1:
-            left = self.visit(ctx.expr4())
-            right = self.visit(ctx.expr5())
-            if ctx.MUL():
-                op = "*"
-            elif ctx.INTDIV():
-                op = "\\"
-            elif ctx.FLOATDIV():
-                op = "/"
-            else:  # MOD
-                op = "%"
-            return BinaryOp(left, op, right)
-        return self.visit(ctx.expr5())
-
-    def visitExpr5(self, ctx: OPLangParser.Expr5Context):
-        """Visit expr5: string concatenation"""
-        if ctx.getChildCount() > 1:
-            left = self.visit(ctx.expr5())
-            right = self.visit(ctx.expr6())
-            return BinaryOp(left, "^", right)
-        return self.visit(ctx.expr6())
-
-    def visitExpr6(self, ctx: OPLangParser.Expr6Context):
-        """Visit expr6: logical NOT"""
-        if ctx.NOT():
-            operand = self.visit(ctx.expr6())
-            return UnaryOp("!", operand)
-        return self.visit(ctx.expr7())
-
-    def visitExpr7(self, ctx: OPLangParser.Expr7Context):
-        """Visit expr7: unary plus/minus"""
-        if ctx.ADD() or ctx.SUB():
-            op = "+" if ctx.ADD() else "-"
-            operand = self.visit(ctx.expr7())
-            return UnaryOp(op, operand)
-        return self.visit(ctx.expr8())
-
-    def visitExpr8(self, ctx: OPLangParser.Expr8Context):
-        """Visit expr8: expr8 LSB expr RSB | expr9"""
-        if ctx.LSB():  # Has array access
-            base = self.visit(ctx.expr8())
-            index = self.visit(ctx.expr())
-            # Mỗi array access tạo PostfixExpression mới
-            return PostfixExpression(base, [ArrayAccess(index)])
-        return self.visit(ctx.expr9())
-
-    def visitExpr9(self, ctx: OPLangParser.Expr9Context):
-        """Visit expr9: expr9 dotting | expr10"""
-        if ctx.dotting():  # Has dotting
-            base = self.visit(ctx.expr9())
-            ops = self.visit(ctx.dotting())
-            
-            # Tạo PostfixExpression lồng nhau
-            result = base
-            for op in ops:
-                result = PostfixExpression(result, [op])
-            return result
-        return self.visit(ctx.expr10())
+        """Visit expr: operand (eqop operand)? (relop operand (eqop operand)?)?"""
+        children = ctx.children
+        left = self.visit(children[0])
+        i = 1
+        if i < len(children) and children[i].getSymbol().type in (OPLangParser.EQ, OPLangParser.NEQ):
+            left = BinaryOp(left, children[i].getText(), self.visit(children[i + 1]))
+            _span(left, ctx.start, children[i + 1].stop)
+            i += 2
+        if i < len(children):
+            op = children[i].getText()
+            right = self.visit(children[i + 1])
+            if i + 2 < len(children):
+                right = BinaryOp(right, children[i + 2].getText(), self.visit(children[i + 3]))
+                _span(right, children[i + 1].start, children[i + 3].stop)
+            left = _span(BinaryOp(left, op, right), ctx.start, ctx.stop)
+        return left
+
+    def visitOperand(self, ctx: OPLangParser.OperandContext):
+        """Visit operand: prefix, postfix and binary operators above comparisons"""
+        if ctx.getChildCount() == 1:
+            return self.visit(ctx.primary())
+
+        first = ctx.getChild(0)
+        if isinstance(first, TerminalNode):
+            # Prefix: NEW operand | (ADD|SUB) operand | NOT operand
+            operand = self.visit(ctx.getChild(1))
+            if first.getSymbol().type == OPLangParser.NEW:
+                return self._object_creation(operand)
+            return UnaryOp(first.getText(), operand)
+
+        base = self.visit(first)
+        op = ctx.getChild(1)
+        op_type = op.getSymbol().type
+        # Mỗi member access / method call / array access tạo PostfixExpression mới
+        if op_type == OPLangParser.DOT:
+            if ctx.callfuncstm():
+                return PostfixExpression(base, [self.visit(ctx.callfuncstm())])
+            name = ctx.ID().getSymbol()
+            return PostfixExpression(base, [_span(MemberAccess(name.text), name, name)])
+        if op_type == OPLangParser.LSB:
+            index = _span(ArrayAccess(self.visit(ctx.expr())), op.getSymbol(), ctx.RSB().getSymbol())
+            return PostfixExpression(base, [index])
+        return BinaryOp(base, op.getText(), self.visit(ctx.getChild(2)))
+
+    def _object_creation(self, expr):
+        """Turn the operand of NEW (a call or a bare class name) into an ObjectCreation"""
+        if isinstance(expr, PostfixExpression) and expr.postfix_ops:
+            if isinstance(expr.postfix_ops[0], MethodCall):
+                class_name = expr.primary.name if isinstance(expr.primary, Identifier) else ""
+                return ObjectCreation(class_name, expr.postfix_ops[0].args)
+        elif isinstance(expr, Identifier):
+            return ObjectCreation(expr.name, [])
+        raise Exception("Invalid object creation")
 
     def visitDotting(self, ctx: OPLangParser.DottingContext):
-        """Visit dotting - trả về list các operations"""
-        ops = []
-        
+        """Visit dotting: DOT (callfuncstm | ID (LSB expr RSB)?) - trả về list các operations"""
         if ctx.callfuncstm():
-            ops.append(self.visit(ctx.callfuncstm()))
-        elif ctx.ID():
-            ops.append(MemberAccess(ctx.ID().getText()))
-        
-        # Xử lý đệ quy
-        if ctx.dotting():
-            ops.extend(self.visit(ctx.dotting()))
-        
+            return [self.visit(ctx.callfuncstm())]
+        name = ctx.ID().getSymbol()
+        ops = [_span(MemberAccess(name.text), name, name)]
+        if ctx.expr():
+            # `frame_expression` decides whether the index is kept
+            ops.append(_span(ArrayAccess(self.visit(ctx.expr())), ctx.LSB().getSymbol(), ctx.RSB().getSymbol()))
         return ops
 
-    def visitExpr10(self, ctx: OPLangParser.Expr10Context):
-        """Visit expr10: object creation"""
-        if ctx.NEW():
-            expr = self.visit(ctx.expr10())
-            # Extract class name and arguments from the expression
-            if isinstance(expr, PostfixExpression) and expr.postfix_ops:
-                if isinstance(expr.postfix_ops[0], MethodCall):
-                    class_name = expr.primary.name if isinstance(expr.primary, Identifier) else ""
-                    args = expr.postfix_ops[0].args
-                    return ObjectCreation(class_name, args)
-            elif isinstance(expr, Identifier):
-                return ObjectCreation(expr.name, [])
-        return self.visit(ctx.expr11())
-
-    def visitExpr11(self, ctx: OPLangParser.Expr11Context):
-        """Visit expr11: primary expressions"""
+    def visitPrimary(self, ctx: OPLangParser.PrimaryContext):
+        """Visit primary: literals, identifiers, calls, arrays, this, nil and (expr)"""
         if ctx.INTLIT():
             return IntLiteral(int(ctx.INTLIT().getText()))
         elif ctx.FLOATLIT():
@@ -628,8 +600,10 @@ class ASTGeneration(OPLangVisitor):
             return Identifier(ctx.ID().getText())
         elif ctx.callfuncstm():
             # Method call without receiver
-            call = self.visit(ctx.callfuncstm())
-            return PostfixExpression(Identifier(call.method_name), [call])
+            call_ctx = ctx.callfuncstm()
+            call = self.visit(call_ctx)
+            name = call_ctx.ID().getSymbol()
+            return PostfixExpression(_span(Identifier(call.method_name), name, name), [call])
         elif ctx.array():
             return self.visit(ctx.array())
         elif ctx.THIS():
@@ -653,24 +627,12 @@ class ASTGeneration(OPLangVisitor):
         return []
 
     def visitInput_func_param_prime(self, ctx: OPLangParser.Input_func_param_primeContext):
-        """Visit input_func_param_prime"""
-        params = [self.visit(ctx.input_func_param())]
-        if ctx.input_func_param_prime():
-            params.extend(self.visit(ctx.input_func_param_prime()))
-        return params
+        """Visit input_func_param_prime: input_func_param (COMMA input_func_param)*"""
+        return [self.visit(param) for param in ctx.input_func_param()]
 
     def visitInput_func_param(self, ctx: OPLangParser.Input_func_paramContext):
-        """Visit input_func_param"""
-        if ctx.INTLIT():
-            return IntLiteral(int(ctx.INTLIT().getText()))
-        elif ctx.FLOATLIT():
-            return FloatLiteral(float(ctx.FLOATLIT().getText()))
-        elif ctx.STRINGLIT():
-            return StringLiteral(ctx.STRINGLIT().getText())
-        elif ctx.ID():
-            return Identifier(ctx.ID().getText())
-        else:  # expr
-            return self.visit(ctx.expr())
+        """Visit input_func_param: expr"""
+        return self.visit(ctx.expr())
 
     # ============================================================================
     # Array Literals
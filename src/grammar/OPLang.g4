@@ -144,18 +144,19 @@ COMMENT: ('/*' .*? ('*/' | EOF) | '#' ~[\r\n]* ('\n' | EOF)) -> skip;
 //Statement:
     //Block statement:
     blockstm: LB var_decl_stm stmlist RB;
-    stmlist: stm stmlist| ; //Note: Added stmlist to have recursive
+    stmlist: stm*; //Flat loop: no recursion per statement
     stm: assingstm | ifstm | forstm | breakstm | continuestm | returnstm | invocationstm | blockstm;
 
         //Assign statement
-        assingstm: (ID | ID LSB expr RSB | invocationstm_frame) vardecl_assign SEMI; //Added SEMI
+        assingstm: (ID (LSB expr RSB)? | invocationstm_frame) vardecl_assign SEMI; //Added SEMI
         vardecl_assign: ASSIGN expr; //Seperate for assignment of initiated variable
 
         //If statement
-        ifstm: IF (LRB expr RRB | expr) THEN (stm | blockstm) elsestm; //Review //Added LRB, RRB
-        elsestm: ELSE (stm | blockstm) | ;
+        //A parenthesized condition is just a parenthesized expr: no separate LRB alternative to predict
+        ifstm: IF expr THEN stm elsestm; //Review
+        elsestm: ELSE stm | ; //stm already covers blockstm
         //For statement
-        forstm: FOR ID ASSIGN (LRB expr RRB | expr) (TO|DOWNTO) (LRB expr RRB | expr) DO (blockstm | stm); //Review
+        forstm: FOR ID ASSIGN expr (TO|DOWNTO) expr DO stm; //Review
 
         //Break + Continue + Return statement
         breakstm: BREAK SEMI; //Review
@@ -164,7 +165,10 @@ COMMENT: ('/*' .*? ('*/' | EOF) | '#' ~[\r\n]* ('\n' | EOF)) -> skip;
 
         //Invocation statement
         invocationstm: invocationstm_frame SEMI;
-        invocationstm_frame: expr dotting; //(in_attribute_access | sta_attribute_access | in_method | sta_method);//Copy from expression
+        //Same member/index chain as operand but looped here, so the dots are predicted from the statement's own tokens.
+        //Any member/index chain ending in a dot; see `frame_expression` for how it nests
+        invocationstm_frame: NEW? primary (DOT (callfuncstm | ID) | LSB expr RSB)* dotting; //(in_attribute_access | sta_attribute_access | in_method | sta_method);//Copy from expression
+        dotting: DOT (callfuncstm | ID (LSB expr RSB)?);
         // in_attribute_access: expr DOT ID;
         // sta_attribute_access: ID DOT ID;
         // in_method: expr DOT callfuncstm;
@@ -173,43 +177,39 @@ COMMENT: ('/*' .*? ('*/' | EOF) | '#' ~[\r\n]* ('\n' | EOF)) -> skip;
         //Call function statement:
         callfuncstm: ID LRB input_func_param_list RRB;
         input_func_param_list: input_func_param_prime | ; //nullable 4, YES sep SEMI
-        input_func_param_prime: input_func_param COMMA input_func_param_prime | input_func_param;
-        input_func_param: INTLIT | FLOATLIT | STRINGLIT | ID | expr;
+        input_func_param_prime: input_func_param (COMMA input_func_param)*;
+        input_func_param: expr; //Literals and IDs are already exprs
 
 //Declare:
-    decl : (attr_decl|func_decl) decl| ;
+    decl : (attr_decl|func_decl)*;
 //Class Declaration:
-class_decl_list: class_decl class_decl_list| class_decl; // non-nullable 1 class
-    class_decl: CLASS ID LB class_member RB //Replaced ID -> class_type
-                | CLASS ID EXTEND ID LB class_member RB; //
+class_decl_list: class_decl+; // non-nullable 1 class
+    class_decl: CLASS ID (EXTEND ID)? LB class_member RB; //Replaced ID -> class_type
     //NOT in this Project: Check duplicate
         ID: [a-zA-Z_][a-zA-Z0-9_]*;
         
 
-    attr_decl: stafin type attr_decl_list SEMI | stafin referencetype attr_decl_list_ref SEMI; 
-    attr_decl_list: attr_name (vardecl_assign| ) COMMA attr_decl_list | attr_name (vardecl_assign| ); //non-nullable 3, YES sep COMMA
-    attr_decl_list_ref: attr_name vardecl_assign COMMA attr_decl_list_ref | attr_name vardecl_assign;
+    attr_decl: stafin (type attr_decl_list | referencetype attr_decl_list_ref) SEMI;
+    attr_decl_list: attr_name vardecl_assign? (COMMA attr_name vardecl_assign?)*; //non-nullable 3, YES sep COMMA
+    attr_decl_list_ref: attr_name vardecl_assign (COMMA attr_name vardecl_assign)*;
     attr_name: ID ; //(assign_stm | )
 
     class_member: decl; //null-able var or fun 2, NO sep
 //Function/Method Declaration:
 func_decl: normal_func | constructor | destructor; 
-    normal_func: (STA | ) main_func LRB RRB blockstm 
-                | (STA | ) (func_type | referencetype) ID LRB func_param_list RRB blockstm;
+    normal_func: STA? (main_func LRB RRB | (func_type | referencetype) ID LRB func_param_list RRB) blockstm;
     //NOT in this Project: Check duplicate?
         // ID: [a-zA-Z_][a-zA-Z0-9_]*;
         //Block Statement:
 
-    constructor: default_constructor | copy_constructor | user_constructor;
+    //Default (empty list) and copy (`ID ID`) constructors are special cases of the parameter list
+    constructor: ID LRB func_param_list RRB blockstm;
     //YES:
     // - Have no return type
     //NOT in this Project about Constructor:
     // - Have the same name as the class
     // - Cannot contain return statements in the body
     // - Are automatically called when creating objects with `new`
-        default_constructor: ID LRB RRB blockstm;
-        copy_constructor: ID LRB ID ID RRB blockstm;
-        user_constructor: ID LRB func_param_list RRB blockstm;
     
     destructor: '~' ID LRB RRB blockstm;
     //YES: 
@@ -224,40 +224,42 @@ func_decl: normal_func | constructor | destructor;
         // RETYPE: TYPE | VOID;
 
     func_param_list: func_param_prime | ; //nullable 4, YES sep SEMI
-    func_param_prime: (type | referencetype) func_param SEMI func_param_prime | (type | referencetype) func_param;
-    func_param: var_name COMMA func_param | var_name;
+    func_param_prime: (type | referencetype) func_param (SEMI (type | referencetype) func_param)*;
+    func_param: var_name (COMMA var_name)*;
     
         
 //Variable/Attribute Declaration:
-var_decl_stm: var_decl_no_stafin var_decl_stm | ;
+var_decl_stm: var_decl_no_stafin*;
 
-var_decl_no_stafin: (FIN | ) type var_decl_list SEMI | (FIN | ) referencetype var_decl_list_ref SEMI; 
+var_decl_no_stafin: FIN? (type var_decl_list | referencetype var_decl_list_ref) SEMI;
 
-var_decl: stafin type var_decl_list SEMI | stafin referencetype var_decl_list_ref SEMI; 
+var_decl: stafin (type var_decl_list | referencetype var_decl_list_ref) SEMI;
 
     //Check duplicate: Not in this Project ?
         stafin: STA FIN|FIN STA|STA|FIN| ;
-    var_decl_list: var_name (vardecl_assign| ) COMMA var_decl_list | var_name (vardecl_assign| ); //non-nullable 3, YES sep COMMA
-    var_decl_list_ref: var_name vardecl_assign COMMA var_decl_list_ref | var_name vardecl_assign;
+    var_decl_list: var_name vardecl_assign? (COMMA var_name vardecl_assign?)*; //non-nullable 3, YES sep COMMA
+    var_decl_list_ref: var_name vardecl_assign (COMMA var_name vardecl_assign)*;
     var_name: ID ; //(assign_stm | )
 
 
 
 
 //Expression:
-    expr: expr1 (LESST | LESSEQ | MORET | MOREEQ) expr1 | expr1;
-    expr1: expr2 (EQ | NEQ) expr2 | expr2;
-    expr2: expr2 (AND | OR) expr3 | expr3;
-    expr3: expr3 (ADD | SUB) expr4 | expr4;
-    expr4: expr4 (MUL | INTDIV | FLOATDIV | MOD) expr5 | expr5;
-    expr5: expr5 CONCAT expr6 | expr6;
-    expr6: NOT expr6 | expr7;
-    expr7: (ADD|SUB) expr7 | expr8;
-    expr8: expr8 LSB expr RSB | expr9;
-    dotting: DOT (ID | callfuncstm | ID LSB expr RSB) dotting | DOT (ID | callfuncstm| ID LSB expr RSB);
-    expr9: expr9 dotting | expr10;
-    expr10: NEW expr10 | expr11;
-    expr11: INTLIT | FLOATLIT | STRINGLIT | BOOLLIT | ID | callfuncstm | array | THIS | NIL | LRB expr RRB;
+    //Comparisons are non-associative (a < b < c is a syntax error), which a left-recursive
+    //alternative cannot express, so they stay a flat optional suffix: relational binds looser than equality
+    expr: operand ((EQ | NEQ) operand)? ((LESST | LESSEQ | MORET | MOREEQ) operand ((EQ | NEQ) operand)?)?;
+    //One left-recursive rule for the rest of the ladder; alternatives are listed from tightest to loosest
+    operand: NEW operand
+        | operand DOT (callfuncstm | ID)
+        | operand LSB expr RSB
+        | (ADD | SUB) operand
+        | NOT operand
+        | operand CONCAT operand
+        | operand (MUL | INTDIV | FLOATDIV | MOD) operand
+        | operand (ADD | SUB) operand
+        | operand (AND | OR) operand
+        | primary;
+    primary: INTLIT | FLOATLIT | STRINGLIT | BOOLLIT | ID | callfuncstm | array | THIS | NIL | LRB expr RRB;
 
 WS : [ \t\r\n]+ -> skip ; // skip spaces, tabs 
 
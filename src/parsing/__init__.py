@@ -0,0 +1,42 @@
+"""
+Parsing module for OPLang programming language.
+This module provides the entry points that turn OPLang source text into
+parse trees and ASTs using the hand-written lexer and the generated parser,
+either from in-memory text or streamed from a file, and a recursive-descent
+parser that builds the AST without a parse tree.
+"""
+
+from .fast_lexer import FastLexer
+from .mmap_stream import MmapCharStream
+from .frontend import (
+    two_stage_parse,
+    ll_parse,
+    create_parser,
+    parse_source,
+    source_to_ast,
+    compile_file,
+)
+from .streaming import (
+    StreamingTokenStream,
+    create_streaming_parser,
+    iter_class_decls,
+    stream_to_ast,
+)
+from .direct import DirectParser, direct_source_to_ast
+
+__all__ = [
+    "FastLexer",
+    "MmapCharStream",
+    "two_stage_parse",
+    "ll_parse",
+    "create_parser",
+    "parse_source",
+    "source_to_ast",
+    "compile_file",
+    "StreamingTokenStream",
+    "create_streaming_parser",
+    "iter_class_decls",
+    "stream_to_ast",
+    "DirectParser",
+    "direct_source_to_ast",
+]
@@ -0,0 +1,509 @@
+"""
+Direct AST builder for OPLang programming language.
+This module parses the token stream of `FastLexer` by recursive descent
+and builds `src.utils.nodes` objects while parsing, so no ANTLR parse tree
+is materialized. It accepts the language of `src/grammar/OPLang.g4` and
+builds the same AST as `ASTGeneration` does from the parse tree.
+"""
+
+from build.OPLangParser import OPLangParser as P
+from src.astgen.ast_generation import frame_expression
+from src.utils.error_listener import SyntaxException
+from src.utils.nodes import *
+
+from .fast_lexer import FastLexer
+
+
+PRIMITIVE_TYPES = {
+    P.INT: "int",
+    P.FLOAT: "float",
+    P.STRING: "string",
+    P.BOOL: "boolean",
+}
+
+EQUALITY_OPS = (P.EQ, P.NEQ)
+RELATIONAL_OPS = (P.LESST, P.LESSEQ, P.MORET, P.MOREEQ)
+
+# Binding power of each infix and postfix operator of the `operand` rule,
+# numbered the way ANTLR numbers the alternatives of a left-recursive rule
+INFIX_PRECEDENCE = {
+    P.DOT: 9,
+    P.LSB: 8,
+    P.CONCAT: 5,
+    P.MUL: 4, P.INTDIV: 4, P.FLOATDIV: 4, P.MOD: 4,
+    P.ADD: 3, P.SUB: 3,
+    P.AND: 2, P.OR: 2,
+}
+NEW_PRECEDENCE = 10
+SIGN_PRECEDENCE = 7
+NOT_PRECEDENCE = 6
+
+# Consumed tokens are dropped once this many have piled up in the window
+WINDOW_SIZE = 1024
+
+
+class DirectParser:
+    """Recursive-descent parser that builds the AST without a parse tree.
+
+    Each grammar rule is a method returning AST nodes. Lookahead is bounded
+    (at most five tokens, to tell a local declaration such as `A[3] x;` from
+    a statement), so only a small window of tokens is kept. The first
+    syntax error raises `SyntaxException` with the message
+    `NewErrorListener` gives; there is no error recovery. The generated
+    parser looks further ahead before it gives up, so on some invalid
+    programs the two report different tokens.
+
+    A `{` that starts a statement always opens a block, where the grammar
+    would also let an array literal start an invocation statement.
+    """
+
+    def __init__(self, source, chunk_size: int = 1 << 16):
+        """`source` is the source text, a text file object, or an ANTLR `CharStream`."""
+        self._next_token = FastLexer(source, chunk_size).nextToken
+        self._tokens = [self._next_token()]
+        self._p = 0
+        self._last = None  # last consumed token, where the node being built ends
+
+    # ------------------------------------------------------------------
+    # Token window
+    # ------------------------------------------------------------------
+
+    def _peek(self, k: int = 1):
+        i = self._p + k - 1
+        tokens = self._tokens
+        while i >= len(tokens):
+            tokens.append(self._next_token())
+        return tokens[i]
+
+    def _type(self, k: int = 1) -> int:
+        return self._peek(k).type
+
+    def _advance(self):
+        token = self._peek()
+        self._last = token
+        self._p += 1
+        if self._p >= WINDOW_SIZE:
+            del self._tokens[:self._p]
+            self._p = 0
+        return token
+
+    def _expect(self, token_type: int):
+        token = self._peek()
+        if token.type != token_type:
+            raise self._error(token)
+        return self._advance()
+
+    @staticmethod
+    def _error(token):
+        return SyntaxException(f"Error on line {token.line} col {token.column}: {token.text}")
+
+    def _span(self, node, first):
+        """Give `node` the position of the source text from token `first` to the last consumed token"""
+        return node.set_position(first.line, first.column, self._last.stop + 1)
+
+    @staticmethod
+    def _at(node, token):
+        """Give `node` the position of `token`"""
+        return node.set_position(token.line, token.column, token.stop + 1)
+
+    # ------------------------------------------------------------------
+    # Program and declarations
+    # ------------------------------------------------------------------
+
+    def program(self) -> Program:
+        """program: class_decl+ EOF"""
+        first = self._peek()
+        class_decls = [self._class_decl()]
+        while self._type() != P.EOF:
+            class_decls.append(self._class_decl())
+        return self._span(Program(class_decls), first)
+
+    def _class_decl(self) -> ClassDecl:
+        """class_decl: CLASS ID (EXTEND ID)? LB decl RB"""
+        first = self._expect(P.CLASS)
+        name = self._expect(P.ID).text
+        superclass = None
+        if self._type() == P.EXTEND:
+            self._advance()
+            superclass = self._expect(P.ID).text
+        self._expect(P.LB)
+        members = []
+        while self._type() != P.RB:
+            members.append(self._member())
+        self._advance()
+        return self._span(ClassDecl(name, superclass, members), first)
+
+    def _member(self):
+        """attr_decl | normal_func | constructor | destructor"""
+        first = self._peek()
+        token_type = first.type
+        if token_type == P.T__0:
+            self._advance()
+            name = self._expect(P.ID).text
+            self._expect(P.LRB)
+            self._expect(P.RRB)
+            return self._span(DestructorDecl(name, self._block()), first)
+        if token_type == P.ID and self._type(2) == P.LRB:
+            name = self._advance().text
+            params = self._params()
+            return self._span(ConstructorDecl(name, params, self._block()), first)
+
+        is_static = is_final = False
+        if token_type == P.STA:
+            self._advance()
+            is_static = True
+            if self._type() == P.FIN:
+                self._advance()
+                is_final = True
+        elif token_type == P.FIN:
+            self._advance()
+            is_final = True
+            if self._type() == P.STA:
+                self._advance()
+                is_static = True
+
+        if self._type() == P.VOID and not is_final:
+            return_type = self._at(PrimitiveType("void"), self._advance())
+            if self._type() == P.MAIN:
+                self._advance()
+                self._expect(P.LRB)
+                self._expect(P.RRB)
+                return self._span(MethodDecl(is_static, return_type, "main", [], self._block()), first)
+            name = self._expect(P.ID).text
+            params = self._params()
+            return self._span(MethodDecl(is_static, return_type, name, params, self._block()), first)
+
+        member_type = self._type_annotation()
+        name = self._expect(P.ID)
+        if self._type() == P.LRB and not is_final:
+            params = self._params()
+            return self._span(MethodDecl(is_static, member_type, name.text, params, self._block()), first)
+        attributes = self._declarators(name, Attribute, isinstance(member_type, ReferenceType))
+        self._expect(P.SEMI)
+        return self._span(AttributeDecl(is_static, is_final, member_type, attributes), first)
+
+    def _declarators(self, name, node_class, require_init: bool) -> list:
+        """The rest of `name (:= expr)? (COMMA name (:= expr)?)*`, after the first name token"""
+        declarators = []
+        while True:
+            if require_init or self._type() == P.ASSIGN:
+                self._expect(P.ASSIGN)
+                declarators.append(self._span(node_class(name.text, self._expr()), name))
+            else:
+                declarators.append(self._at(node_class(name.text), name))
+            if self._type() != P.COMMA:
+                return declarators
+            self._advance()
+            name = self._expect(P.ID)
+
+    def _params(self) -> list:
+        """LRB func_param_list RRB"""
+        self._expect(P.LRB)
+        params = []
+        if self._type() != P.RRB:
+            while True:
+                param_type = self._type_annotation()
+                name = self._expect(P.ID)
+                params.append(self._at(Parameter(param_type, name.text), name))
+                while self._type() == P.COMMA:
+                    self._advance()
+                    name = self._expect(P.ID)
+                    params.append(self._at(Parameter(param_type, name.text), name))
+                if self._type() != P.SEMI:
+                    break
+                self._advance()
+        self._expect(P.RRB)
+        return params
+
+    def _type_annotation(self):
+        """type | referencetype"""
+        first = self._advance()
+        if first.type in PRIMITIVE_TYPES:
+            result = self._at(PrimitiveType(PRIMITIVE_TYPES[first.type]), first)
+        elif first.type == P.ID:
+            result = self._at(ClassType(first.text), first)
+        else:
+            raise self._error(first)
+        if self._type() == P.LSB:
+            self._advance()
+            size = int(self._expect(P.INTLIT).text)
+            self._expect(P.RSB)
+            result = self._span(ArrayType(result, size), first)
+        if self._type() == P.REF:
+            self._advance()
+            result = self._span(ReferenceType(result), first)
+        return result
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def _block(self) -> BlockStatement:
+        """blockstm: LB var_decl_stm stmlist RB"""
+        first = self._expect(P.LB)
+        var_decls = []
+        while self._starts_var_decl():
+            var_decls.append(self._var_decl())
+        statements = []
+        while self._type() != P.RB:
+            statements.append(self._statement())
+        self._advance()
+        return self._span(BlockStatement(var_decls, statements), first)
+
+    def _starts_var_decl(self) -> bool:
+        token_type = self._type()
+        if token_type == P.FIN or token_type in PRIMITIVE_TYPES:
+            return True
+        if token_type != P.ID:
+            return False
+        token_type = self._type(2)
+        if token_type == P.ID or token_type == P.REF:
+            return True
+        # `A[3] x;` declares a variable, `a[3] := x;` assigns to an element
+        return (token_type == P.LSB and self._type(3) == P.INTLIT and self._type(4) == P.RSB
+                and self._type(5) in (P.ID, P.REF))
+
+    def _var_decl(self) -> VariableDecl:
+        """var_decl_no_stafin: FIN? (type var_decl_list | referencetype var_decl_list_ref) SEMI"""
+        first = self._peek()
+        is_final = first.type == P.FIN
+        if is_final:
+            self._advance()
+        var_type = self._type_annotation()
+        name = self._expect(P.ID)
+        variables = self._declarators(name, Variable, isinstance(var_type, ReferenceType))
+        self._expect(P.SEMI)
+        return self._span(VariableDecl(is_final, var_type, variables), first)
+
+    def _statement(self):
+        """stm: assingstm | ifstm | forstm | breakstm | continuestm | returnstm | invocationstm | blockstm"""
+        first = self._peek()
+        token_type = first.type
+        if token_type == P.IF:
+            self._advance()
+            condition = self._header_expr()
+            self._expect(P.THEN)
+            then_stmt = self._statement()
+            else_stmt = None
+            if self._type() == P.ELSE:
+                self._advance()
+                else_stmt = self._statement()
+            return self._span(IfStatement(condition, then_stmt, else_stmt), first)
+        if token_type == P.FOR:
+            self._advance()
+            variable = self._expect(P.ID).text
+            self._expect(P.ASSIGN)
+            start_expr = self._header_expr()
+            direction = self._advance()
+            if direction.type != P.TO and direction.type != P.DOWNTO:
+                raise self._error(direction)
+            end_expr = self._header_expr()
+            self._expect(P.DO)
+            body = self._statement()
+            return self._span(ForStatement(variable, start_expr, direction.text, end_expr, body), first)
+        if token_type == P.BREAK:
+            self._advance()
+            self._expect(P.SEMI)
+            return self._span(BreakStatement(), first)
+        if token_type == P.CON:
+            self._advance()
+            self._expect(P.SEMI)
+            return self._span(ContinueStatement(), first)
+        if token_type == P.RETURN:
+            self._advance()
+            value = self._expr()
+            self._expect(P.SEMI)
+            return self._span(ReturnStatement(value), first)
+        if token_type == P.LB:
+            return self._block()
+        if token_type == P.ID and self._type(2) == P.ASSIGN:
+            lhs = self._at(IdLHS(self._advance().text), first)
+            self._advance()
+            rhs = self._expr()
+            self._expect(P.SEMI)
+            return self._span(AssignmentStatement(lhs, rhs), first)
+
+        target = self._frame()
+        if self._type() == P.ASSIGN:
+            lhs = self._span(PostfixLHS(target), first)
+            self._advance()
+            rhs = self._expr()
+            self._expect(P.SEMI)
+            return self._span(AssignmentStatement(lhs, rhs), first)
+        self._expect(P.SEMI)
+        return self._span(MethodInvocationStatement(target), first)
+
+    def _frame(self) -> PostfixExpression:
+        """invocationstm_frame: NEW? primary (DOT (callfuncstm | ID) | LSB expr RSB)* dotting
+
+        Also covers the `ID LSB expr RSB` target of an assignment, which
+        nests the same way. `frame_expression` builds the same nesting as
+        the parse-tree visitor.
+        """
+        first = self._peek()
+        is_new = first.type == P.NEW
+        if is_new:
+            self._advance()
+        bare_id = not is_new and self._type() == P.ID and self._type(2) != P.LRB
+        expr = self._primary()
+        if is_new:
+            expr = self._span(_object_creation(expr), first)
+        ops = []
+        while True:
+            token_type = self._type()
+            if token_type == P.DOT:
+                self._advance()
+                ops.append(self._member_op())
+            elif token_type == P.LSB:
+                ops.append(self._index())
+            else:
+                break
+        if bare_id and len(ops) == 1 and type(ops[0]) is ArrayAccess and self._type() == P.ASSIGN:
+            return self._span(PostfixExpression(expr, ops), first)
+        target = frame_expression(expr, ops, first.line, first.column)
+        if target is None:
+            raise self._error(self._peek())
+        return self._span(target, first)
+
+    def _index(self) -> ArrayAccess:
+        """LSB expr RSB"""
+        first = self._expect(P.LSB)
+        index = self._expr()
+        self._expect(P.RSB)
+        return self._span(ArrayAccess(index), first)
+
+    def _member_op(self):
+        """callfuncstm | ID, after a DOT"""
+        name = self._expect(P.ID)
+        if self._type() == P.LRB:
+            return self._span(MethodCall(name.text, self._args()), name)
+        return self._at(MemberAccess(name.text), name)
+
+    def _args(self) -> list:
+        """LRB input_func_param_list RRB"""
+        self._expect(P.LRB)
+        args = []
+        if self._type() != P.RRB:
+            args.append(self._expr())
+            while self._type() == P.COMMA:
+                self._advance()
+                args.append(self._expr())
+        self._expect(P.RRB)
+        return args
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def _header_expr(self):
+        """An if/for header expr, dropping one pair of enclosing parentheses"""
+        expr = self._expr()
+        if isinstance(expr, ParenthesizedExpression):
+            return expr.expr
+        return expr
+
+    def _expr(self):
+        """expr: operand (eqop operand)? (relop operand (eqop operand)?)?"""
+        first = self._peek()
+        left = self._operand(0)
+        token = self._peek()
+        if token.type in EQUALITY_OPS:
+            self._advance()
+            left = self._span(BinaryOp(left, token.text, self._operand(0)), first)
+            token = self._peek()
+        if token.type in RELATIONAL_OPS:
+            self._advance()
+            right_first = self._peek()
+            right = self._operand(0)
+            eq = self._peek()
+            if eq.type in EQUALITY_OPS:
+                self._advance()
+                right = self._span(BinaryOp(right, eq.text, self._operand(0)), right_first)
+            left = self._span(BinaryOp(left, token.text, right), first)
+        return left
+
+    def _operand(self, min_precedence: int):
+        """operand: prefix operators, then postfix and binary operators binding at least `min_precedence`"""
+        first = self._peek()
+        if first.type == P.NEW:
+            self._advance()
+            left = self._span(_object_creation(self._operand(NEW_PRECEDENCE)), first)
+        elif first.type == P.ADD or first.type == P.SUB:
+            self._advance()
+            left = self._span(UnaryOp(first.text, self._operand(SIGN_PRECEDENCE)), first)
+        elif first.type == P.NOT:
+            self._advance()
+            left = self._span(UnaryOp(first.text, self._operand(NOT_PRECEDENCE)), first)
+        else:
+            left = self._primary()
+
+        while True:
+            token = self._peek()
+            precedence = INFIX_PRECEDENCE.get(token.type)
+            if precedence is None or precedence < min_precedence:
+                return left
+            if token.type == P.DOT:
+                self._advance()
+                left = PostfixExpression(left, [self._member_op()])
+            elif token.type == P.LSB:
+                left = PostfixExpression(left, [self._index()])
+            else:
+                self._advance()
+                # Left-associative: the right operand binds one level tighter
+                left = BinaryOp(left, token.text, self._operand(precedence + 1))
+            self._span(left, first)
+
+    def _primary(self):
+        """primary: literals, identifiers, calls, arrays, this, nil and (expr)"""
+        first = self._advance()
+        token_type = first.type
+        if token_type == P.ID:
+            if self._type() == P.LRB:
+                # Method call without receiver
+                call = self._span(MethodCall(first.text, self._args()), first)
+                return self._span(PostfixExpression(self._at(Identifier(first.text), first), [call]), first)
+            return self._at(Identifier(first.text), first)
+        if token_type == P.INTLIT:
+            node = IntLiteral(int(first.text))
+        elif token_type == P.FLOATLIT:
+            node = FloatLiteral(float(first.text))
+        elif token_type == P.STRINGLIT:
+            node = StringLiteral(first.text)
+        elif token_type == P.BOOLLIT:
+            node = BoolLiteral(first.text == "true")
+        elif token_type == P.THIS:
+            node = ThisExpression()
+        elif token_type == P.NIL:
+            node = NilLiteral()
+        elif token_type == P.LRB:
+            expr = self._expr()
+            self._expect(P.RRB)
+            return self._span(ParenthesizedExpression(expr), first)
+        elif token_type == P.LB:
+            elements = []
+            if self._type() != P.RB:
+                elements.append(self._expr())
+                while self._type() == P.COMMA:
+                    self._advance()
+                    elements.append(self._expr())
+            self._expect(P.RB)
+            return self._span(ArrayLiteral(elements), first)
+        else:
+            raise self._error(first)
+        return self._at(node, first)
+
+
+def _object_creation(expr):
+    """Turn the operand of NEW (a call or a bare class name) into an ObjectCreation"""
+    if isinstance(expr, PostfixExpression) and expr.postfix_ops:
+        if isinstance(expr.postfix_ops[0], MethodCall):
+            class_name = expr.primary.name if isinstance(expr.primary, Identifier) else ""
+            return ObjectCreation(class_name, expr.postfix_ops[0].args)
+    elif isinstance(expr, Identifier):
+        return ObjectCreation(expr.name, [])
+    raise Exception("Invalid object creation")
+
+
+def direct_source_to_ast(source, chunk_size: int = 1 << 16) -> Program:
+    """Parse `source` (text, a text file object or a `CharStream`) straight into an AST `Program`."""
+    return DirectParser(source, chunk_size).program()
@@ -0,0 +1,301 @@
+"""
+Hand-written lexer for OPLang programming language.
+`FastLexer` is a drop-in token source for `OPLangParser`: it produces the
+same token types, texts, positions and `lexererr` exceptions as the
+generated `OPLangLexer`, but matches each token with one regular
+expression instead of running the ANTLR lexer ATN per character.
+"""
+
+import re
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import CommonToken, Token
+
+from build.OPLangLexer import OPLangLexer
+from lexererr import ErrorToken, IllegalEscape, UncloseString
+
+
+KEYWORDS = {
+    "class": OPLangLexer.CLASS,
+    "extends": OPLangLexer.EXTEND,
+    "int": OPLangLexer.INT,
+    "float": OPLangLexer.FLOAT,
+    "string": OPLangLexer.STRING,
+    "boolean": OPLangLexer.BOOL,
+    "void": OPLangLexer.VOID,
+    "main": OPLangLexer.MAIN,
+    "this": OPLangLexer.THIS,
+    "static": OPLangLexer.STA,
+    "final": OPLangLexer.FIN,
+    "if": OPLangLexer.IF,
+    "then": OPLangLexer.THEN,
+    "else": OPLangLexer.ELSE,
+    "for": OPLangLexer.FOR,
+    "to": OPLangLexer.TO,
+    "do": OPLangLexer.DO,
+    "break": OPLangLexer.BREAK,
+    "continue": OPLangLexer.CON,
+    "downto": OPLangLexer.DOWNTO,
+    "return": OPLangLexer.RETURN,
+    "nil": OPLangLexer.NIL,
+    "new": OPLangLexer.NEW,
+    "true": OPLangLexer.BOOLLIT,
+    "false": OPLangLexer.BOOLLIT,
+}
+
+# Token types of keywords and operators; any other name is an ID
+TOKEN_TYPES = {
+    **KEYWORDS,
+    "~": OPLangLexer.T__0,  # implicit token of the destructor rule's '~' literal
+    ";": OPLangLexer.SEMI,
+    "{": OPLangLexer.LB,
+    "}": OPLangLexer.RB,
+    "&": OPLangLexer.REF,
+    "(": OPLangLexer.LRB,
+    ")": OPLangLexer.RRB,
+    "[": OPLangLexer.LSB,
+    "]": OPLangLexer.RSB,
+    ",": OPLangLexer.COMMA,
+    ".": OPLangLexer.DOT,
+    ":": OPLangLexer.COLON,
+    "+": OPLangLexer.ADD,
+    "-": OPLangLexer.SUB,
+    "*": OPLangLexer.MUL,
+    "\\": OPLangLexer.INTDIV,
+    "/": OPLangLexer.FLOATDIV,
+    "%": OPLangLexer.MOD,
+    "==": OPLangLexer.EQ,
+    "!=": OPLangLexer.NEQ,
+    "<": OPLangLexer.LESST,
+    "<=": OPLangLexer.LESSEQ,
+    ">": OPLangLexer.MORET,
+    ">=": OPLangLexer.MOREEQ,
+    "||": OPLangLexer.OR,
+    "&&": OPLangLexer.AND,
+    "!": OPLangLexer.NOT,
+    "^": OPLangLexer.CONCAT,
+    ":=": OPLangLexer.ASSIGN,
+}
+
+# Group numbers of TOKEN_PATTERN, in the order the alternatives are tried
+(_COMMENT, _NAME, _OPERATOR, _FLOATLIT, _INTLIT, _STRINGLIT, _ILLEGAL_ESCAPE,
+ _UNCLOSE_STRING, _ERROR_CHAR, _END) = range(1, 11)
+
+# Each match is the whitespace before a token plus the token itself. Every
+# alternative matches the longest token its grammar rule can produce, and
+# the first alternative that matches wins, as in the generated lexer. The
+# `.` and end-of-input alternatives make every position match, so
+# `finditer` covers the input without gaps. A backslash at the very end of
+# a string completes no string rule, which leaves its opening quote to
+# ERROR_CHAR.
+TOKEN_PATTERN = re.compile(r"""
+    [ \t\r\n]*+
+    (?: (/\*.*?(?:\*/|\Z)|\#[^\r\n]*(?:\n|\Z))
+      | ([A-Za-z_][A-Za-z0-9_]*)
+      | (==|!=|<=|>=|\|\||&&|:=|[~;{}&()\[\],.:+\-*\\/%<>!^])
+      | ([0-9]+(?:\.[0-9]+[eE][+-]?[0-9]+|\.[0-9]*|[eE][+-]?[0-9]+))
+      | ([0-9]+)
+      | ("(?:\\[bft"\\]|[^\\"\r\n])*+")
+      | ("(?:\\[bft"\\]|[^\\"\r\n])*+\\.)
+      | ("(?:\\[bft"\\]|[^\\"\r\n])*+(?:[\r\n]|\Z))
+      | (.)
+      | (\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+
+# Characters a match may need to see past its end to be final
+# (e.g. `12e+3` rather than `12` needs three)
+LOOKAHEAD = 3
+
+
+class FastLexer:
+    """Token source for `OPLangParser` that mirrors the generated `OPLangLexer`.
+
+    Tokens are produced lazily by a generator scanning the text, which
+    `nextToken` advances. A lexical error is raised from `nextToken` where
+    the generated lexer raises it; the next call resumes lexing after the
+    offending text.
+
+    Given a text file object, or a `CharStream` other than `InputStream`,
+    the lexer reads it in chunks of `chunk_size` characters and only keeps
+    the unfinished tail of the current chunk.
+    """
+
+    def __init__(self, input, chunk_size: int = 1 << 16):
+        """`input` is the source text, a text file object, or an ANTLR `CharStream`."""
+        self._input = None
+        self._reader = None
+        self._chunk_size = chunk_size
+        if isinstance(input, str):
+            self._buffer = input
+        elif hasattr(input, "read"):
+            self._buffer = ""
+            self._reader = input
+        elif hasattr(input, "strdata"):
+            self._buffer = input.strdata
+            self._input = input
+        else:
+            self._buffer = ""
+            self._reader = _CharStreamReader(input)
+            self._input = input
+        self._factory = CommonTokenFactory.DEFAULT
+        self._save(self._buffer, 0, 0, 1, 0, -1)
+
+    @property
+    def inputStream(self):
+        """The wrapped `CharStream`, or None when the lexer was given text or a file."""
+        return self._input
+
+    def getInputStream(self):
+        return self._input
+
+    def getSourceName(self):
+        if self._input is not None:
+            return self._input.name
+        return getattr(self._reader, "name", "<unknown>")
+
+    def nextToken(self):
+        """Return the next token."""
+        return next(self._tokens)
+
+    def _save(self, text, offset, pos, line, line_start, next_break):
+        """Store the scan state at buffer position `pos` and restart scanning from it.
+
+        `next_break` is the first line break not yet counted in `line`; -1
+        means every break before `pos` has been counted.
+        """
+        breaks = text.count("\n", next_break, pos) if 0 <= next_break < pos else 0
+        if breaks:
+            line += breaks
+            line_start = text.rindex("\n", next_break, pos) + 1
+        self._buffer, self._offset, self._pos = text, offset, pos
+        self._line, self._line_start = line, line_start
+        self._tokens = self._scan()
+
+    def _scan(self):
+        """Yield the tokens from the saved position on, then EOF forever."""
+        source = (self, self._input)
+        new_token = CommonToken.__new__
+        token_types = TOKEN_TYPES
+        ID, INTLIT, FLOATLIT = OPLangLexer.ID, OPLangLexer.INTLIT, OPLangLexer.FLOATLIT
+        text, offset, pos = self._buffer, self._offset, self._pos
+        line, line_start = self._line, self._line_start
+        # Line bookkeeping only runs when a token starts past the first line
+        # break not yet counted in `line`, or the end of the buffer if none
+        next_break = text.find("\n", pos)
+        if next_break < 0:
+            next_break = len(text)
+
+        while True:
+            # Until the whole input is buffered, a match ending too close to
+            # the end of the buffer might still grow and is read again later
+            size = len(text)
+            limit = size if self._reader is None else size - LOOKAHEAD
+
+            for match in TOKEN_PATTERN.finditer(text, pos):
+                kind = match.lastindex
+                lexeme = match.group(kind)
+                end = match.end()
+                if end > limit:
+                    pos = match.start()
+                    break
+                start = end - len(lexeme)
+                if start > next_break:
+                    line += text.count("\n", next_break, start)
+                    line_start = text.rindex("\n", next_break, start) + 1
+                    next_break = text.find("\n", start)
+                    if next_break < 0:
+                        next_break = size
+
+                if kind == _NAME or kind == _OPERATOR:
+                    token_type = token_types.get(lexeme, ID)
+                elif kind == _INTLIT:
+                    token_type = INTLIT
+                elif kind == _FLOATLIT:
+                    token_type = FLOATLIT
+                elif kind == _STRINGLIT:
+                    lexeme = lexeme[1:-1]
+                    token_type = OPLangLexer.STRINGLIT
+                elif kind == _COMMENT:
+                    continue
+                elif kind == _END:
+                    break
+                elif lexeme == '"' and self._reader is not None:
+                    # A quote is only an error character when a backslash ends the
+                    # input, and here that may just be the end of the buffer
+                    pos = match.start()
+                    break
+                else:
+                    self._save(text, offset, end, line, line_start, next_break)
+                    raise self._error(kind, lexeme)
+
+                token = new_token(CommonToken)
+                token.source = source
+                token.type = token_type
+                token.channel = 0
+                token.start = offset + start
+                token.stop = offset + end - 1
+                token.tokenIndex = -1
+                token.line = line
+                token.column = start - line_start
+                token._text = lexeme
+                yield token
+
+            if self._reader is None:
+                break
+            # Drop the consumed text and append the next chunk
+            if next_break < pos:
+                line += text.count("\n", next_break, pos)
+                line_start = text.rindex("\n", next_break, pos) + 1
+                next_break = text.find("\n", pos)
+                if next_break < 0:
+                    next_break = size
+            chunk = self._reader.read(self._chunk_size)
+            if not chunk:
+                self._reader = None
+            text = text[pos:] + chunk
+            offset += pos
+            line_start -= pos
+            next_break = next_break - pos if next_break < size else text.find("\n", size - pos)
+            if next_break < 0:
+                next_break = len(text)
+            pos = 0
+
+        if next_break < size:
+            line += text.count("\n", next_break)
+            line_start = text.rindex("\n") + 1
+        while True:
+            token = new_token(CommonToken)
+            token.source = source
+            token.type = Token.EOF
+            token.channel = 0
+            token.start = offset + size
+            token.stop = offset + size - 1
+            token.tokenIndex = -1
+            token.line = line
+            token.column = size - line_start
+            token._text = "<EOF>"
+            yield token
+
+    @staticmethod
+    def _error(kind, lexeme):
+        """The `lexererr` exception the generated lexer raises for an error token."""
+        if kind == _ILLEGAL_ESCAPE:
+            return IllegalEscape(lexeme[1:])
+        if kind == _UNCLOSE_STRING:
+            return UncloseString(lexeme[1:])
+        return ErrorToken(lexeme)
+
+
+class _CharStreamReader:
+    """Reads an ANTLR `CharStream` like a text file, through `getText`."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._pos = 0
+
+    def read(self, size: int) -> str:
+        text = self._stream.getText(self._pos, self._pos + size - 1)
+        self._pos += len(text)
+        return text
@@ -0,0 +1,86 @@
+"""
+Parser front end for OPLang programming language.
+This module wires the hand-written lexer and the generated parser together
+and runs the parser in two stages: a fast SLL pass that bails out on the
+first error, and a full LL pass that only runs when the SLL pass fails.
+Files are compiled through a memory-mapped character stream.
+"""
+
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.semantics.static_checker import StaticChecker
+
+from .fast_lexer import FastLexer
+from .mmap_stream import MmapCharStream
+
+
+def two_stage_parse(parser: OPLangParser):
+    """Parse a program SLL-first, falling back to full LL on failure.
+
+    SLL prediction either yields the same tree as LL or reports a syntax
+    error, so only inputs that fail the SLL pass pay for full-context
+    prediction. The second pass restores the parser's own error listeners
+    and error strategy, so syntax errors are reported exactly as before.
+    """
+    listeners = list(parser._listeners)
+    error_handler = parser._errHandler
+
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return parser.program()
+    except ParseCancellationException:
+        pass
+    finally:
+        for listener in listeners:
+            parser.addErrorListener(listener)
+        parser._errHandler = error_handler
+
+    parser.reset()
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.program()
+
+
+def ll_parse(parser: OPLangParser):
+    """Parse a program with full LL prediction only."""
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.program()
+
+
+def create_parser(source, error_listener=None) -> OPLangParser:
+    """Build a parser over `source` (text or a `CharStream`), optionally replacing its error listeners."""
+    lexer = FastLexer(source)
+    parser = OPLangParser(CommonTokenStream(lexer))
+    if error_listener is not None:
+        parser.removeErrorListeners()
+        parser.addErrorListener(error_listener)
+    return parser
+
+
+def parse_source(source, error_listener=None, two_stage: bool = True):
+    """Parse `source` and return the `program` parse tree."""
+    parser = create_parser(source, error_listener)
+    return two_stage_parse(parser) if two_stage else ll_parse(parser)
+
+
+def source_to_ast(source, error_listener=None, two_stage: bool = True):
+    """Parse `source` and convert the parse tree into an AST `Program`."""
+    return ASTGeneration().visit(parse_source(source, error_listener, two_stage))
+
+
+def compile_file(path: str, error_listener=None, two_stage: bool = True, require_main: bool = True):
+    """Parse and statically check the program in the file at `path`, returning its AST `Program`.
+
+    The file is memory-mapped rather than read into a string, and unmapped
+    once the AST has been built.
+    """
+    with MmapCharStream(path) as stream:
+        ast = source_to_ast(stream, error_listener, two_stage)
+    StaticChecker().check_program(ast, require_main)
+    return ast
@@ -0,0 +1,140 @@
+"""
+Memory-mapped character stream for OPLang programming language.
+This module exposes a UTF-8 source file as an ANTLR `CharStream` without
+reading it into a Python string: the file is mapped with `mmap`, and
+characters are read from the mapped bytes on demand.
+"""
+
+import mmap
+from array import array
+from bisect import bisect_right
+
+from antlr4 import Token
+
+
+# Bytes per block of the character index; blocks never split a character
+BLOCK_SIZE = 1 << 16
+
+
+class MmapCharStream:
+    """ANTLR `CharStream` over a memory-mapped UTF-8 file.
+
+    `InputStream` keeps the source as a string plus a list with one code
+    point per character. This stream keeps only the mapping and an index
+    holding the first character and byte offset of each block of
+    `BLOCK_SIZE` bytes. In a pure ASCII file, characters and bytes line up,
+    so characters are read straight from the mapping. Otherwise, a
+    character is found through the index and its block is decoded, and
+    the last decoded block is cached for sequential reads.
+    """
+
+    def __init__(self, path: str):
+        self.name = str(path)
+        self._index = 0
+        with open(path, "rb") as file:
+            try:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file cannot be mapped
+                self._data = b""
+        self._block_chars = array("q")   # character index at the start of each block
+        self._block_bytes = array("q")   # byte offset of the start of each block
+        self._size = self._index_blocks()
+        self._ascii = self._size == len(self._data)
+        self._cached_block = -1
+        self._cached_text = ""
+
+    def _index_blocks(self) -> int:
+        """Record where each block starts and return the number of characters."""
+        data = self._data
+        size = len(data)
+        chars, offset = 0, 0
+        while offset < size:
+            end = min(offset + BLOCK_SIZE, size)
+            while end < size and data[end] & 0xC0 == 0x80:
+                end -= 1  # back off to the start of a multi-byte character
+            self._block_chars.append(chars)
+            self._block_bytes.append(offset)
+            block = data[offset:end]
+            chars += len(block) if block.isascii() else len(block.decode("utf-8"))
+            offset = end
+        return chars
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def size(self):
+        return self._size
+
+    def reset(self):
+        self._index = 0
+
+    def consume(self):
+        if self._index >= self._size:
+            raise Exception("cannot consume EOF")
+        self._index += 1
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # LA(-1) is the character before the current one
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        if self._ascii:
+            return self._data[pos]
+        block = bisect_right(self._block_chars, pos) - 1
+        return ord(self._block_text(block)[pos - self._block_chars[block]])
+
+    def LT(self, offset: int):
+        return self.LA(offset)
+
+    # The whole file stays mapped, so there is nothing to mark or release
+    def mark(self):
+        return -1
+
+    def release(self, marker: int):
+        pass
+
+    def seek(self, index: int):
+        self._index = min(index, self._size)
+
+    def getText(self, start: int, stop: int):
+        """Text of the characters from `start` to `stop` inclusive."""
+        stop = min(stop, self._size - 1)
+        if start > stop:
+            return ""
+        if self._ascii:
+            return self._data[start:stop + 1].decode("ascii")
+        first = bisect_right(self._block_chars, start) - 1
+        last = bisect_right(self._block_chars, stop) - 1
+        parts = []
+        for block in range(first, last + 1):
+            begin = self._block_chars[block]
+            text = self._block_text(block)
+            parts.append(text[max(start - begin, 0):stop + 1 - begin])
+        return "".join(parts)
+
+    def _block_text(self, block: int) -> str:
+        if block != self._cached_block:
+            begin = self._block_bytes[block]
+            end = self._block_bytes[block + 1] if block + 1 < len(self._block_bytes) else len(self._data)
+            self._cached_text = self._data[begin:end].decode("utf-8")
+            self._cached_block = block
+        return self._cached_text
+
+    def close(self):
+        """Unmap the file; tokens already produced keep their text."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
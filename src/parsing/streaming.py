@@ -0,0 +1,173 @@
+"""
+Streaming front end for OPLang programming language.
+This module parses programs read from a file object without holding the
+whole program in memory: the lexer reads the file in chunks, the token
+stream keeps only the tokens the parser can still rewind to, and the
+program is parsed and converted to AST one class declaration at a time.
+"""
+
+from antlr4 import Token
+from antlr4.BufferedTokenStream import TokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.Errors import IllegalStateException
+
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.nodes import Program
+
+from .fast_lexer import FastLexer
+
+
+class StreamingTokenStream(TokenStream):
+    """Token stream that buffers only the tokens between the oldest mark and the lookahead.
+
+    The parser marks the stream while predicting and rewinds to the mark
+    afterwards; once no mark is held, consumed tokens are dropped. Seeking
+    before the buffered window is not possible, so two-stage parsing (which
+    rewinds to the first token) cannot run on this stream.
+    """
+
+    def __init__(self, tokenSource):
+        self.tokenSource = tokenSource
+        self._tokens = []        # buffered window of the token stream
+        self._start = 0          # stream index of _tokens[0]
+        self._p = 0              # position of the current token in _tokens
+        self._markers = 0
+        self._last = None        # last consumed token, for LT(-1)
+        self._before = None      # token consumed just before _tokens[0]
+
+    @property
+    def index(self):
+        return self._start + self._p
+
+    @property
+    def sourceName(self):
+        return self.tokenSource.getSourceName()
+
+    def getSourceName(self):
+        return self.tokenSource.getSourceName()
+
+    def getTokenSource(self):
+        return self.tokenSource
+
+    def LT(self, k: int):
+        if k == -1:
+            return self._last
+        if k < 1:
+            return None
+        i = self._p + k - 1
+        if i >= len(self._tokens):
+            self._fill(i + 1)
+            if i >= len(self._tokens):
+                return self._tokens[-1]  # EOF
+        return self._tokens[i]
+
+    def LA(self, k: int):
+        token = self.LT(k)
+        return token.type if token is not None else Token.INVALID_TYPE
+
+    def consume(self):
+        if self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        self._last = self._tokens[self._p]
+        self._p += 1
+        if self._markers == 0:
+            self._drop_consumed()
+
+    def mark(self):
+        if self._markers == 0:
+            self._drop_consumed()
+        self._markers += 1
+        return -self._markers
+
+    def release(self, marker: int):
+        if marker != -self._markers:
+            raise IllegalStateException("release() called with an invalid marker")
+        self._markers -= 1
+        if self._markers == 0:
+            self._drop_consumed()
+
+    def seek(self, index: int):
+        if index == self.index:
+            return
+        if index > self.index:
+            self._fill(index - self._start + 1)
+            index = min(index, self._start + len(self._tokens) - 1)
+        i = index - self._start
+        if i < 0:
+            raise IllegalStateException(f"cannot seek to token {index} before the buffered window")
+        self._p = i
+        self._last = self._tokens[i - 1] if i > 0 else self._before
+
+    def get(self, index: int):
+        i = index - self._start
+        if not 0 <= i < len(self._tokens):
+            raise IndexError(f"token {index} is outside the buffered window")
+        return self._tokens[i]
+
+    def getText(self, start=None, stop=None):
+        """Text of the buffered tokens between `start` and `stop` (indices or tokens)."""
+        if isinstance(start, Token):
+            start = start.tokenIndex
+        if isinstance(stop, Token):
+            stop = stop.tokenIndex
+        first = self._start if start is None else max(start, self._start)
+        last = self._start + len(self._tokens) - 1 if stop is None else stop
+        texts = []
+        for token in self._tokens[first - self._start:last - self._start + 1]:
+            if token.type == Token.EOF:
+                break
+            texts.append(token.text)
+        return "".join(texts)
+
+    def _fill(self, n: int):
+        """Buffer tokens until the window holds `n` tokens or ends with EOF."""
+        tokens = self._tokens
+        while len(tokens) < n and not (tokens and tokens[-1].type == Token.EOF):
+            token = self.tokenSource.nextToken()
+            token.tokenIndex = self._start + len(tokens)
+            tokens.append(token)
+
+    def _drop_consumed(self):
+        if self._p:
+            self._before = self._last
+            del self._tokens[:self._p]
+            self._start += self._p
+            self._p = 0
+
+
+def create_streaming_parser(file, error_listener=None, chunk_size: int = 1 << 16) -> OPLangParser:
+    """Build a full-LL parser reading OPLang source from the text file object `file`."""
+    parser = OPLangParser(StreamingTokenStream(FastLexer(file, chunk_size)))
+    parser._interp.predictionMode = PredictionMode.LL
+    if error_listener is not None:
+        parser.removeErrorListeners()
+        parser.addErrorListener(error_listener)
+    return parser
+
+
+def iter_class_decls(file, error_listener=None, chunk_size: int = 1 << 16):
+    """Parse the program in `file` one class at a time, yielding each `ClassDecl`.
+
+    Each class's parse tree and tokens are released once its AST has been
+    built, so memory stays bounded by the largest class rather than the
+    size of the program.
+    """
+    parser = create_streaming_parser(file, error_listener, chunk_size)
+    tokens = parser.getTokenStream()
+    if tokens.LA(1) == Token.EOF:
+        # A program needs at least one class: report it as `program` does
+        parser.program()
+        return
+    ast_generation = ASTGeneration()
+    while tokens.LA(1) != Token.EOF:
+        start = tokens.index
+        class_decl = ast_generation.visit(parser.class_decl())
+        if tokens.index == start:
+            break  # error recovery made no progress
+        yield class_decl
+
+
+def stream_to_ast(file, error_listener=None, chunk_size: int = 1 << 16) -> Program:
+    """Parse the program in `file` through the streaming front end into an AST `Program`."""
+    return Program(list(iter_class_decls(file, error_listener, chunk_size)))
@@ -7,9 +7,15 @@ programming language including type checking, scope management, and error detect
 
 from .static_error import *
 from .static_checker import StaticChecker
+from .symbol_table import ClassSymbol, FieldSymbol, LocalSymbol, MethodSymbol, SymbolTable
 
 __all__ = [
     'StaticChecker',
+    'ClassSymbol',
+    'FieldSymbol',
+    'MethodSymbol',
+    'LocalSymbol',
+    'SymbolTable',
     'StaticError',
     'Redeclared',
     'UndeclaredIdentifier', 
@@ -3,7 +3,7 @@ Static Semantic Checker for OPLang Programming Language
 """
 
 from typing import Dict, List, Optional, Any
-from ..utils.visitor import ASTVisitor
+from ..utils.visitor import ASTVisitor, traverse
 from ..utils.nodes import (
     ASTNode, Program, ClassDecl, AttributeDecl, Attribute, MethodDecl,
     ConstructorDecl, DestructorDecl, Parameter, VariableDecl, Variable,
@@ -22,6 +22,18 @@ from .static_error import (
     MustInLoop, IllegalConstantExpression, IllegalArrayLiteral,
     IllegalMemberAccess, NoEntryPoint
 )
+from .symbol_table import ClassSymbol, FieldSymbol, LocalSymbol, MethodSymbol, SymbolTable
+
+
+def _operator_operands(ast) -> tuple:
+    """Operands of a unary, binary or parenthesized expression; nothing for other nodes"""
+    if type(ast) is BinaryOp:
+        return ast.left, ast.right
+    if type(ast) is UnaryOp:
+        return (ast.operand,)
+    if type(ast) is ParenthesizedExpression:
+        return (ast.expr,)
+    return ()
 
 
 class ErrorType:
@@ -34,46 +46,88 @@ ERROR = ErrorType()
 class StaticChecker(ASTVisitor):
     
     def __init__(self):
-        self.class_table: Dict[str, Dict[str, Any]] = {}
-        self.scopes: List[Dict[str, Any]] = []
+        self.class_table: Dict[str, ClassSymbol] = {}
+        self.symbols = SymbolTable()
         self.current_class: Optional[str] = None
         self.current_method: Optional[str] = None
         self.current_method_return_type: Optional[Any] = None
         self.current_method_is_static: bool = False
         self.loop_depth: int = 0
         self.has_main: bool = False
+        # Names in the class table, every class after its parent
+        self.class_order: List[str] = []
         self.in_constructor: bool = False
         self.currently_initializing_attr: Optional[str] = None
+        # Static errors found so far while collecting them, or None to raise the first
+        self.errors: Optional[List[StaticError]] = None
 
     def check_program(self, ast: Program, require_main: bool = True):
         self._build_class_table(ast)
         self._add_io_class()
+        self._index_class_hierarchy()
         self.visitProgram(ast)
         if require_main and not self.has_main:
-            raise NoEntryPoint()
+            self._collect(NoEntryPoint())
+
+    def collect_errors(self, ast: Program, require_main: bool = True) -> List[StaticError]:
+        """Check `ast` and return every static error found, in order, instead of raising the first.
+
+        An error skips the rest of the class, member, statement or variable
+        it was found in, and checking goes on with the next one. Variables
+        and parameters whose type names an undeclared class get the ERROR
+        type, so their uses do not report further errors. The first error
+        returned is the one `check_program` raises.
+        """
+        errors = self.errors = []
+        try:
+            self.check_program(ast, require_main)
+        finally:
+            self.errors = None
+        return errors
+
+    def _collect(self, error: StaticError):
+        """Record `error` when collecting errors; otherwise raise it."""
+        if self.errors is None:
+            raise error
+        self.errors.append(error)
+
+    def _checked(self, check, node):
+        """Run `check(node)`. When collecting errors, a static error it raises
+        is recorded, and the scopes and checking context it left behind are
+        undone."""
+        if self.errors is None:
+            return check(node)
+        context = (len(self.symbols), self.current_class, self.current_method,
+                   self.current_method_return_type, self.current_method_is_static,
+                   self.loop_depth, self.in_constructor, self.currently_initializing_attr)
+        try:
+            return check(node)
+        except StaticError as error:
+            self.errors.append(error)
+            (depth, self.current_class, self.current_method,
+             self.current_method_return_type, self.current_method_is_static,
+             self.loop_depth, self.in_constructor, self.currently_initializing_attr) = context
+            self.symbols.truncate(depth)
+            return ERROR
 
     def _add_io_class(self):
         if "IO" not in self.class_table:
-            self.class_table["IO"] = {
-                "parent": None,
-                "attributes": {},
-                "methods": {
-                    "writeInt": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("int"), "x")], "isStatic": True},
-                    "writeFloat": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("float"), "x")], "isStatic": True},
-                    "writeString": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("string"), "x")], "isStatic": True},
-                    "writeBool": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("boolean"), "x")], "isStatic": True},
-                    "writeIntLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("int"), "x")], "isStatic": True},
-                    "writeFloatLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("float"), "x")], "isStatic": True},
-                    "writeStringLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("string"), "x")], "isStatic": True},
-                    "writeBoolLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("boolean"), "x")], "isStatic": True},
-                    "writeStrLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("string"), "x")], "isStatic": True},
-                    "readInt": {"returnType": PrimitiveType("int"), "params": [], "isStatic": True},
-                    "readFloat": {"returnType": PrimitiveType("float"), "params": [], "isStatic": True},
-                    "readString": {"returnType": PrimitiveType("void"), "params": [], "isStatic": True},
-                    "readBool": {"returnType": PrimitiveType("boolean"), "params": [], "isStatic": True},
-                },
-                "constructors": {},
-                "destructor": None
+            self.class_order.insert(0, "IO")
+            io = self.class_table["IO"] = ClassSymbol("IO", None, None)
+            io.methods = {
+                "writeInt": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("int"), "x")], True),
+                "writeFloat": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("float"), "x")], True),
+                "writeString": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("string"), "x")], True),
+                "writeBool": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("boolean"), "x")], True),
+                "writeIntLn": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("int"), "x")], True),
+                "writeFloatLn": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("float"), "x")], True),
+                "writeStringLn": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("string"), "x")], True),
+                "writeBoolLn": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("boolean"), "x")], True),
+                "writeStrLn": MethodSymbol(PrimitiveType("void"), [Parameter(PrimitiveType("string"), "x")], True),
+                "readInt": MethodSymbol(PrimitiveType("int"), [], True),
+                "readFloat": MethodSymbol(PrimitiveType("float"), [], True),
+                "readString": MethodSymbol(PrimitiveType("void"), [], True),
+                "readBool": MethodSymbol(PrimitiveType("boolean"), [], True),
             }
 
     def _get_constructor_signature(self, params):
@@ -93,31 +147,32 @@ class StaticChecker(ASTVisitor):
     def _build_class_table(self, ast: Program):
         self.class_table = {}
         self.has_main = False
-        class_list = ast.class_decls or []
+        class_list = []  # declarations that made it into the table
         
-        for c in class_list:
+        for c in ast.class_decls or []:
             if not isinstance(c, ClassDecl):
                 continue
             name = c.name
             if name in self.class_table:
-                raise Redeclared("Class", name)
+                self._collect(Redeclared("Class", name))
+                continue
+            class_list.append(c)
             parent = c.superclass
-            self.class_table[name] = {
-                "parent": parent, 
-                "attributes": {}, 
-                "methods": {},
-                "constructors": {},
-                "destructor": None
-            }
+            self.class_table[name] = ClassSymbol(name, c, parent)
 
+        # A class can only extend one declared before it. A link to a later
+        # class is cut here, so no inheritance cycle can form, and reported
+        # by `visitClassDecl` when the checker reaches the class
+        declared = set()
         for name, info in self.class_table.items():
-            parent = info["parent"]
-            if parent and parent not in self.class_table:
-                raise UndeclaredClass(parent)
+            parent = info.parent
+            if parent in self.class_table and parent not in declared:
+                info.parent = None
+            elif parent and parent not in self.class_table:
+                self._collect(UndeclaredClass(parent))
+            declared.add(name)
 
         for c in class_list:
-            if not isinstance(c, ClassDecl):
-                continue
             cname = c.name
             info = self.class_table[cname]
             
@@ -126,142 +181,162 @@ class StaticChecker(ASTVisitor):
             has_class_name_destructor = False
             
             for m in c.members or []:
-                if isinstance(m, AttributeDecl):
-                    for a in m.attributes or []:
-                        aname = a.name
-                        if aname in declared_names:
-                            if m.is_final:
-                                raise Redeclared("Constant", aname)
-                            else:
-                                raise Redeclared("Attribute", aname)
-                        if aname == cname and (has_class_name_constructor or has_class_name_destructor):
-                            if m.is_final:
-                                raise Redeclared("Constant", aname)
-                            else:
-                                raise Redeclared("Attribute", aname)
-                        declared_names.add(aname)
-                        info["attributes"][aname] = {
-                            "type": m.attr_type,
-                            "isFinal": m.is_final,
-                            "isStatic": m.is_static,
-                            "init": a.init_value,
-                        }
-                elif isinstance(m, MethodDecl):
-                    mname = m.name
-                    if mname in declared_names:
-                        raise Redeclared("Method", mname)
-                    if mname == cname and (has_class_name_constructor or has_class_name_destructor):
-                        raise Redeclared("Method", mname)
-                    declared_names.add(mname)
-                    info["methods"][mname] = {
-                        "returnType": m.return_type,
-                        "params": m.params or [],
-                        "isStatic": m.is_static,
-                    }
-                    if (mname == "main" and m.is_static and 
-                        isinstance(m.return_type, PrimitiveType) and
-                        m.return_type.type_name == "void" and 
-                        len(m.params or []) == 0):
-                        self.has_main = True
-                elif isinstance(m, ConstructorDecl):
-                    cons_name = m.name
-                    if cons_name in declared_names:
-                        raise Redeclared("Constructor", cons_name)
+                try:
+                    if isinstance(m, AttributeDecl):
+                        for a in m.attributes or []:
+                            aname = a.name
+                            if aname in declared_names:
+                                if m.is_final:
+                                    raise Redeclared("Constant", aname)
+                                else:
+                                    raise Redeclared("Attribute", aname)
+                            if aname == cname and (has_class_name_constructor or has_class_name_destructor):
+                                if m.is_final:
+                                    raise Redeclared("Constant", aname)
+                                else:
+                                    raise Redeclared("Attribute", aname)
+                            declared_names.add(aname)
+                            info.attributes[aname] = FieldSymbol(
+                                m.attr_type, m.is_final, m.is_static, a.init_value)
+                    elif isinstance(m, MethodDecl):
+                        mname = m.name
+                        if mname in declared_names:
+                            raise Redeclared("Method", mname)
+                        if mname == cname and (has_class_name_constructor or has_class_name_destructor):
+                            raise Redeclared("Method", mname)
+                        declared_names.add(mname)
+                        info.methods[mname] = MethodSymbol(m.return_type, m.params or [], m.is_static)
+                        if (mname == "main" and m.is_static and 
+                            isinstance(m.return_type, PrimitiveType) and
+                            m.return_type.type_name == "void" and 
+                            len(m.params or []) == 0):
+                            self.has_main = True
+                    elif isinstance(m, ConstructorDecl):
+                        cons_name = m.name
+                        if cons_name in declared_names:
+                            raise Redeclared("Constructor", cons_name)
                     
-                    sig = self._get_constructor_signature(m.params)
-                    if sig in info["constructors"]:
-                        raise Redeclared("Constructor", cname)
+                        sig = self._get_constructor_signature(m.params)
+                        if sig in info.constructors:
+                            raise Redeclared("Constructor", cname)
                     
-                    if cons_name != cname:
-                        declared_names.add(cons_name)
-                    else:
-                        has_class_name_constructor = True
+                        if cons_name != cname:
+                            declared_names.add(cons_name)
+                        else:
+                            has_class_name_constructor = True
                     
-                    info["constructors"][sig] = {
-                        "returnType": ClassType(cname),
-                        "params": m.params or [],
-                        "isStatic": False
-                    }
-                elif isinstance(m, DestructorDecl):
-                    dname = m.name
-                    if dname in declared_names:
-                        raise Redeclared("Destructor", dname)
+                        info.constructors[sig] = MethodSymbol(ClassType(cname), m.params or [], False)
+                    elif isinstance(m, DestructorDecl):
+                        dname = m.name
+                        if dname in declared_names:
+                            raise Redeclared("Destructor", dname)
                     
-                    if info["destructor"] is not None:
-                        raise Redeclared("Destructor", cname)
+                        if info.destructor is not None:
+                            raise Redeclared("Destructor", cname)
                     
-                    if dname != cname:
-                        declared_names.add(dname)
-                    else:
-                        has_class_name_destructor = True
+                        if dname != cname:
+                            declared_names.add(dname)
+                        else:
+                            has_class_name_destructor = True
                     
-                    info["destructor"] = {
-                        "returnType": None,
-                        "params": [],
-                        "isStatic": False
-                    }
+                        info.destructor = MethodSymbol(None, [], False)
+                except StaticError as error:
+                    self._collect(error)
+
+        # Every parent is declared before its subclasses
+        self.class_order = list(self.class_table)
+
+    def _index_class_hierarchy(self):
+        """Precompute, for every class in the table, what the lookups below
+        would otherwise find by walking the `parent` chain on each call:
+
+        - `ClassSymbol.enter`, `ClassSymbol.exit`: the class's interval in a
+          preorder numbering of the inheritance forest; a class is a
+          subclass of another exactly when its `enter` falls in the other's
+          interval
+        - `ClassSymbol.root_parent`: the undeclared class its root names as
+          parent, if any
+        - `ClassSymbol.all_attributes`, `ClassSymbol.all_methods`: the
+          members declared in the class or inherited, each name mapped to
+          its nearest declaration
+
+        Classes are indexed in `class_order`, so each one is built from
+        its parent's symbol.
+        """
+        table = self.class_table
+        roots, children = [], {name: [] for name in self.class_order}
+        for name in self.class_order:
+            info = table[name]
+            parent = table.get(info.parent)
+            if parent is not None:
+                children[info.parent].append(name)
+                info.root_parent = parent.root_parent
+                info.all_attributes = {**parent.all_attributes, **info.attributes}
+                info.all_methods = {**parent.all_methods, **info.methods}
+            else:
+                roots.append(name)
+                info.root_parent = info.parent
+                info.all_attributes = dict(info.attributes)
+                info.all_methods = dict(info.methods)
+        number = 0
+        stack = [(name, False) for name in reversed(roots)]
+        while stack:
+            name, done = stack.pop()
+            if done:
+                table[name].exit = number
+                continue
+            table[name].enter = number
+            number += 1
+            stack.append((name, True))
+            stack.extend((child, False) for child in reversed(children[name]))
+
+    def ancestors(self, class_name: str) -> List[str]:
+        """`class_name` and the classes it inherits from, nearest first."""
+        result = []
+        while class_name:
+            result.append(class_name)
+            clsinfo = self.class_table.get(class_name)
+            class_name = clsinfo.parent if clsinfo else None
+        return result
 
     def enter_scope(self):
-        self.scopes.append({})
+        self.symbols.enter_scope()
 
     def exit_scope(self):
-        if self.scopes:
-            self.scopes.pop()
+        self.symbols.exit_scope()
 
     def declare_local(self, name: str, typeNode: Any, isFinal: bool, initialized: bool = False):
-        if not self.scopes:
-            self.enter_scope()
-        cur = self.scopes[-1]
-        if name in cur:
+        if self.symbols.in_current_scope(name):
             if isFinal:
                 raise Redeclared("Constant", name)
             else:
                 raise Redeclared("Variable", name)
-        cur[name] = {"type": typeNode, "isFinal": isFinal, "initialized": initialized}
+        self.symbols.declare(name, LocalSymbol(typeNode, isFinal, initialized))
 
     def declare_param(self, name: str, typeNode: Any):
-        if not self.scopes:
-            self.enter_scope()
-        if name in self.scopes[-1]:
+        if self.symbols.in_current_scope(name):
             raise Redeclared("Parameter", name)
-        self.scopes[-1][name] = {"type": typeNode, "isFinal": False, "initialized": True}
+        self.symbols.declare(name, LocalSymbol(typeNode, False, True))
 
-    def lookup(self, name: str):
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
-        return None
+    def lookup(self, name: str) -> Optional[LocalSymbol]:
+        return self.symbols.lookup(name)
 
     def lookup_in_class_attrs(self, class_name: str, attr: str):
         if self.currently_initializing_attr == attr and class_name == self.current_class:
             return None
-        cur = class_name
-        visited = set()
-        while cur and cur not in visited:
-            visited.add(cur)
-            clsinfo = self.class_table.get(cur)
-            if clsinfo and attr in clsinfo["attributes"]:
-                return clsinfo["attributes"][attr]
-            cur = clsinfo["parent"] if clsinfo else None
-        return None
+        clsinfo = self.class_table.get(class_name)
+        return clsinfo.all_attributes.get(attr) if clsinfo else None
 
     def lookup_method(self, class_name: str, method_name: str):
-        cur = class_name
-        visited = set()
-        while cur and cur not in visited:
-            visited.add(cur)
-            clsinfo = self.class_table.get(cur)
-            if clsinfo and method_name in clsinfo["methods"]:
-                return clsinfo["methods"][method_name]
-            cur = clsinfo["parent"] if clsinfo else None
-        return None
+        clsinfo = self.class_table.get(class_name)
+        return clsinfo.all_methods.get(method_name) if clsinfo else None
     
     def lookup_constructor(self, class_name: str, arg_types: List):
         clsinfo = self.class_table.get(class_name)
         if not clsinfo:
             return None
         sig = tuple(self._get_type_signature(t) for t in arg_types)
-        return clsinfo["constructors"].get(sig)
+        return clsinfo.constructors.get(sig)
 
     def type_name(self, t: Any) -> str:
         if t is None:
@@ -294,6 +369,16 @@ class StaticChecker(ASTVisitor):
     def is_class_type(self, t: Any) -> bool:
         return isinstance(t, ClassType)
 
+    def _declared_type(self, type_node):
+        """`type_node` if the classes it names are defined; otherwise ERROR
+        when collecting errors, so the declaration's uses are not reported too."""
+        try:
+            self._require_class_defined(type_node)
+        except StaticError as error:
+            self._collect(error)
+            return ERROR
+        return type_node
+
     def _require_class_defined(self, type_node):
         if isinstance(type_node, ClassType):
             cname = type_node.class_name
@@ -311,31 +396,18 @@ class StaticChecker(ASTVisitor):
     def same_type(self, a: Any, b: Any) -> bool:
         if a is ERROR or b is ERROR:
             return False
-        if a is None and b is None:
-            return True
-        if type(a) != type(b):
-            return False
-        if isinstance(a, PrimitiveType):
-            return a.type_name.lower() == b.type_name.lower()
-        if isinstance(a, ClassType):
-            return a.class_name == b.class_name
-        if isinstance(a, ArrayType):
-            return self.same_type(a.element_type, b.element_type) and a.size == b.size
-        return str(a) == str(b)
+        # Type nodes are interned, so equal types are the same object
+        return a is b
 
     def is_subtype(self, sub: Any, sup: Any) -> bool:
         if isinstance(sub, ClassType) and isinstance(sup, ClassType):
-            sub_name = sub.class_name
-            sup_name = sup.class_name
-            cur = sub_name
-            visited = set()
-            while cur and cur not in visited:
-                if cur == sup_name:
-                    return True
-                visited.add(cur)
-                clsinfo = self.class_table.get(cur)
-                cur = clsinfo["parent"] if clsinfo else None
-            return False
+            clsinfo = self.class_table.get(sub.class_name)
+            if clsinfo is None:
+                return sub.class_name == sup.class_name
+            supinfo = self.class_table.get(sup.class_name)
+            if supinfo is None:
+                return sup.class_name == clsinfo.root_parent
+            return supinfo.enter <= clsinfo.enter < supinfo.exit
         return False
 
     def compatible(self, expected: Any, actual: Any) -> bool:
@@ -349,9 +421,6 @@ class StaticChecker(ASTVisitor):
             return True
         if self.is_class_type(actual) and self.is_class_type(expected):
             return self.is_subtype(actual, expected)
-        if self.is_array_type(expected) and self.is_array_type(actual):
-            return (self.same_type(expected.element_type, actual.element_type) and 
-                    expected.size == actual.size)
         return False
 
     def _is_constant_expr(self, expr) -> bool:
@@ -371,11 +440,11 @@ class StaticChecker(ASTVisitor):
             return self._is_constant_expr(expr.expr)
         if isinstance(expr, Identifier):
             info = self.lookup(expr.name)
-            if info and info.get("isFinal"):
+            if info and info.is_final:
                 return True
             if self.current_class:
                 attr = self.lookup_in_class_attrs(self.current_class, expr.name)
-                if attr and attr.get("isFinal"):
+                if attr and attr.is_final:
                     return True
             return False
         return False
@@ -399,40 +468,47 @@ class StaticChecker(ASTVisitor):
             return self._is_constant_expr_for_attr(expr.expr, expected_type)
         if isinstance(expr, Identifier):
             info = self.lookup(expr.name)
-            if info and info.get("isFinal"):
+            if info and info.is_final:
                 return True
             if self.current_class:
                 attr = self.lookup_in_class_attrs(self.current_class, expr.name)
-                if attr and attr.get("isFinal"):
+                if attr and attr.is_final:
                     return True
             return False
         return False
 
+    @classmethod
+    def dispatch_name(cls, node_class):
+        return f"visit{node_class.__name__}"
+
     def visit(self, node):
         if node is None:
             return None
-        method_name = f'visit{node.__class__.__name__}'
-        visitor = getattr(self, method_name, None)
+        visitor = self._dispatch.get(type(node))
         if visitor:
-            return visitor(node)
+            return visitor(self, node)
         return None
 
     def visitProgram(self, ast: Program):
         self.visited_classes = set()
         self.enter_scope()
-        self.scopes[-1]["io"] = {"type": ClassType("IO"), "isFinal": True, "initialized": True}
+        self.symbols.declare("io", LocalSymbol(ClassType("IO"), True, True))
         for cls in ast.class_decls or []:
-            if cls:
-                self.visitClassDecl(cls)
+            # Skip a redeclared class: the table holds the first one's members
+            if cls and self.class_table[cls.name].decl is cls:
+                self._checked(self.visitClassDecl, cls)
         self.exit_scope()
 
     def visitClassDecl(self, ast: ClassDecl):
+        if ast.superclass and self.class_table[ast.name].parent is None:
+            # `_build_class_table` cut the link to a class declared later
+            self._collect(UndeclaredClass(ast.superclass))
         self.current_class = ast.name
         self.enter_scope()
-        self.scopes[-1]["this"] = {"type": ClassType(ast.name), "isFinal": True}
+        self.symbols.declare("this", LocalSymbol(ClassType(ast.name), True))
         for mem in ast.members or []:
             if mem:
-                self.visit(mem)
+                self._checked(self.visit, mem)
         self.exit_scope()
         self.visited_classes.add(ast.name)
         self.current_class = None
@@ -471,8 +547,7 @@ class StaticChecker(ASTVisitor):
         self.enter_scope()
         
         for param in ast.params or []:
-            self._require_class_defined(param.param_type)
-            self.declare_param(param.name, param.param_type)
+            self.declare_param(param.name, self._declared_type(param.param_type))
         
         if ast.body:
             self._visitBlockStatementContent(ast.body)
@@ -492,8 +567,7 @@ class StaticChecker(ASTVisitor):
         self.enter_scope()
         
         for param in ast.params or []:
-            self._require_class_defined(param.param_type)
-            self.declare_param(param.name, param.param_type)
+            self.declare_param(param.name, self._declared_type(param.param_type))
         
         if ast.body:
             self._visitBlockStatementContent(ast.body)
@@ -518,10 +592,10 @@ class StaticChecker(ASTVisitor):
     def _visitBlockStatementContent(self, ast: BlockStatement):
         for vdecl in ast.var_decls or []:
             if vdecl:
-                self.visitVariableDecl(vdecl)
+                self._checked(self.visitVariableDecl, vdecl)
         for stmt in ast.statements or []:
             if stmt:
-                self.visit(stmt)
+                self._checked(self.visit, stmt)
 
     def visitBlockStatement(self, ast: BlockStatement):
         self.enter_scope()
@@ -529,25 +603,28 @@ class StaticChecker(ASTVisitor):
         self.exit_scope()
 
     def visitVariableDecl(self, ast: VariableDecl):
-        self._require_class_defined(ast.var_type)
+        var_type = self._declared_type(ast.var_type)
         for var in ast.variables or []:
-            if var.init_value:
-                if ast.is_final:
-                    if not self._is_constant_expr(var.init_value):
-                        raise IllegalConstantExpression(var.init_value)
-                    init_type = self.visit(var.init_value)
-                    if init_type is not ERROR and not self.compatible(ast.var_type, init_type):
-                        raise TypeMismatchInConstant(ast)
-                else:
-                    init_node = var.init_value
-                    init_type = self.visit(init_node)
-                    if init_type is not ERROR and not self.compatible(ast.var_type, init_type):
-                        if init_type is None or (isinstance(init_type, PrimitiveType) and init_type.type_name == "void"):
-                            raise TypeMismatchInExpression(init_node)
-                        raise TypeMismatchInStatement(ast)
-
-
-            self.declare_local(var.name, ast.var_type, ast.is_final, var.init_value is not None)
+            try:
+                if var.init_value:
+                    if ast.is_final:
+                        if not self._is_constant_expr(var.init_value):
+                            raise IllegalConstantExpression(var.init_value)
+                        init_type = self.visit(var.init_value)
+                        if init_type is not ERROR and not self.compatible(var_type, init_type):
+                            raise TypeMismatchInConstant(ast)
+                    else:
+                        init_node = var.init_value
+                        init_type = self.visit(init_node)
+                        if init_type is not ERROR and not self.compatible(var_type, init_type):
+                            if init_type is None or (isinstance(init_type, PrimitiveType) and init_type.type_name == "void"):
+                                raise TypeMismatchInExpression(init_node)
+                            raise TypeMismatchInStatement(ast)
+            except StaticError as error:
+                # The variable is still declared, so its uses are checked as usual
+                self._collect(error)
+
+            self.declare_local(var.name, var_type, ast.is_final, var.init_value is not None)
 
     def visitAssignmentStatement(self, ast: AssignmentStatement):
         if isinstance(ast.lhs, IdLHS):
@@ -556,9 +633,9 @@ class StaticChecker(ASTVisitor):
             if info is None:
                 raise UndeclaredIdentifier(name)
             else:
-                if info.get("isFinal"):
+                if info.is_final:
                     raise CannotAssignToConstant(ast)
-                lhs_type = info["type"]
+                lhs_type = info.type
         elif isinstance(ast.lhs, PostfixLHS):
             lhs_type = self._visit_postfix_lhs(ast.lhs, ast)
             if lhs_type is ERROR:
@@ -600,11 +677,11 @@ class StaticChecker(ASTVisitor):
                     attr_info = self.lookup_in_class_attrs(cls_name, op.member_name)
                     if attr_info is None:
                         raise UndeclaredAttribute(op.member_name)
-                    if not attr_info.get("isStatic", False):
+                    if not attr_info.is_static:
                         raise IllegalMemberAccess(pexpr)
-                    if is_last and attr_info.get("isFinal"):
+                    if is_last and attr_info.is_final:
                         raise CannotAssignToConstant(stmt)
-                    current_type = attr_info["type"]
+                    current_type = attr_info.type
                     is_class_name_access = False
                 else:
                     if not isinstance(current_type, ClassType):
@@ -613,11 +690,11 @@ class StaticChecker(ASTVisitor):
                     attr_info = self.lookup_in_class_attrs(cls_name, op.member_name)
                     if attr_info is None:
                         raise UndeclaredAttribute(op.member_name)
-                    if attr_info.get("isStatic", False):
+                    if attr_info.is_static:
                         raise IllegalMemberAccess(pexpr)
-                    if is_last and attr_info.get("isFinal"):
+                    if is_last and attr_info.is_final:
                         raise CannotAssignToConstant(stmt)
-                    current_type = attr_info["type"]
+                    current_type = attr_info.type
             elif isinstance(op, ArrayAccess):
                 idx_type = self.visit(op.index)
                 if not self.is_array_type(current_type):
@@ -647,9 +724,9 @@ class StaticChecker(ASTVisitor):
         if info is None:
             raise UndeclaredIdentifier(var_name)
         else:
-            if info.get("isFinal"):
+            if info.is_final:
                 raise CannotAssignToConstant(ast)
-            if not self.is_int_type(info["type"]):
+            if not self.is_int_type(info.type):
                 raise TypeMismatchInStatement(ast)
         
         start_type = self.visit(ast.start_expr)
@@ -703,8 +780,33 @@ class StaticChecker(ASTVisitor):
             raise TypeMismatchInStatement(ast)
 
     def visitBinaryOp(self, ast: BinaryOp):
-        left_t = self.visit(ast.left)
-        right_t = self.visit(ast.right)
+        return self._operator_expr_type(ast)
+
+    def visitUnaryOp(self, ast: UnaryOp):
+        return self._operator_expr_type(ast)
+
+    def visitParenthesizedExpression(self, ast: ParenthesizedExpression):
+        return self._operator_expr_type(ast)
+
+    def _operator_expr_type(self, ast):
+        """Type of a unary, binary or parenthesized expression.
+
+        Nested operator expressions are walked with an explicit stack, so a
+        long chain such as `a + b + ... + z` does not recurse once per term;
+        other expressions are operands, checked with `visit`.
+        """
+        return traverse(ast, post=self._combine_operand_types, children=_operator_operands)
+
+    def _combine_operand_types(self, ast, operand_types):
+        if type(ast) is BinaryOp:
+            return self._binary_op_type(ast, *operand_types)
+        if type(ast) is UnaryOp:
+            return self._unary_op_type(ast, *operand_types)
+        if type(ast) is ParenthesizedExpression:
+            return operand_types[0]
+        return self.visit(ast)
+
+    def _binary_op_type(self, ast: BinaryOp, left_t, right_t):
         op = ast.operator
         if left_t is ERROR or right_t is ERROR:
             return ERROR
@@ -752,9 +854,8 @@ class StaticChecker(ASTVisitor):
         
         raise TypeMismatchInExpression(ast)
 
-    def visitUnaryOp(self, ast: UnaryOp):
+    def _unary_op_type(self, ast: UnaryOp, operand_t):
         op = ast.operator
-        operand_t = self.visit(ast.operand)
         if operand_t is ERROR:
             return ERROR
         if op in ['+', '-']:
@@ -794,9 +895,9 @@ class StaticChecker(ASTVisitor):
                     attr_info = self.lookup_in_class_attrs(accessed_class_name, member_name)
                     if attr_info is None:
                         raise UndeclaredAttribute(member_name)
-                    if not is_io_access and not attr_info.get("isStatic", False):
+                    if not is_io_access and not attr_info.is_static:
                         raise IllegalMemberAccess(ast)
-                    current_type = attr_info["type"]
+                    current_type = attr_info.type
                     is_class_name_access = False
                     is_io_access = False
                 else:
@@ -806,9 +907,9 @@ class StaticChecker(ASTVisitor):
                     attr_info = self.lookup_in_class_attrs(cls_name, member_name)
                     if attr_info is None:
                         raise UndeclaredAttribute(member_name)
-                    if attr_info.get("isStatic", False) and not is_this_access:
+                    if attr_info.is_static and not is_this_access:
                         raise IllegalMemberAccess(ast)
-                    current_type = attr_info["type"]
+                    current_type = attr_info.type
                     is_this_access = False
             elif isinstance(op, ArrayAccess):
                 idx_type = self.visit(op.index)
@@ -825,15 +926,15 @@ class StaticChecker(ASTVisitor):
                     method_info = self.lookup_method(accessed_class_name, method_name)
                     if method_info is None:
                         raise UndeclaredMethod(method_name)
-                    if not is_io_access and not method_info.get("isStatic", False):
+                    if not is_io_access and not method_info.is_static:
                         raise IllegalMemberAccess(ast)
-                    params = method_info.get("params", [])
+                    params = method_info.params
                     if len(params) != len(arg_types):
                         raise TypeMismatchInExpression(ast)
                     for p, a in zip(params, arg_types):
                         if a is not ERROR and not self.compatible(p.param_type, a):
                             raise TypeMismatchInExpression(ast)
-                    current_type = method_info["returnType"]
+                    current_type = method_info.return_type
                     is_class_name_access = False
                     is_io_access = False
                 else:
@@ -843,15 +944,15 @@ class StaticChecker(ASTVisitor):
                     method_info = self.lookup_method(cls_name, method_name)
                     if method_info is None:
                         raise UndeclaredMethod(method_name)
-                    if method_info.get("isStatic", False) and not is_this_access:
+                    if method_info.is_static and not is_this_access:
                         raise IllegalMemberAccess(ast)
-                    params = method_info.get("params", [])
+                    params = method_info.params
                     if len(params) != len(arg_types):
                         raise TypeMismatchInExpression(ast)
                     for p, a in zip(params, arg_types):
                         if a is not ERROR and not self.compatible(p.param_type, a):
                             raise TypeMismatchInExpression(ast)
-                    current_type = method_info["returnType"]
+                    current_type = method_info.return_type
                     is_this_access = False
 
         return current_type
@@ -862,13 +963,13 @@ class StaticChecker(ASTVisitor):
             return ClassType(name)
         info = self.lookup(name)
         if info:
-            return info["type"]
+            return info.type
         if self.current_class:
             attr = self.lookup_in_class_attrs(self.current_class, name)
             if attr:
-                if attr.get("isStatic") and not self.current_method_is_static:
+                if attr.is_static and not self.current_method_is_static:
                     pass
-                return attr["type"]
+                return attr.type
         raise UndeclaredIdentifier(name)
 
     def visitThisExpression(self, ast: ThisExpression):
@@ -882,7 +983,7 @@ class StaticChecker(ASTVisitor):
             raise UndeclaredClass(class_name)
         arg_types = [self.visit(arg) for arg in (ast.args or [])]
         clsinfo = self.class_table.get(class_name)
-        constructors = clsinfo.get("constructors", {})
+        constructors = clsinfo.constructors
         
         if len(arg_types) == 0:
             pass
@@ -891,7 +992,7 @@ class StaticChecker(ASTVisitor):
             if sig not in constructors:
                 found = False
                 for cons_sig, cons_info in constructors.items():
-                    params = cons_info.get("params", [])
+                    params = cons_info.params
                     if len(params) == len(arg_types):
                         match = True
                         for p, a in zip(params, arg_types):
@@ -905,9 +1006,6 @@ class StaticChecker(ASTVisitor):
                     raise TypeMismatchInExpression(ast)
         return ClassType(class_name)
 
-    def visitParenthesizedExpression(self, ast: ParenthesizedExpression):
-        return self.visit(ast.expr)
-
     def visitIntLiteral(self, ast: IntLiteral):
         return PrimitiveType("int")
 
@@ -0,0 +1,126 @@
+"""
+Symbol table for OPLang static checking.
+This module defines the symbols the static checker records for classes,
+their members and local names, and the table of nested local scopes.
+Symbols are slotted objects with typed attributes rather than dicts.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ..utils.nodes import ClassDecl, Parameter
+
+
+class FieldSymbol:
+    """An attribute or constant declared in a class."""
+
+    __slots__ = ("type", "is_final", "is_static", "init")
+
+    def __init__(self, type: Any, is_final: bool, is_static: bool, init: Any = None):
+        self.type = type
+        self.is_final = is_final
+        self.is_static = is_static
+        self.init = init
+
+
+class MethodSymbol:
+    """A method, constructor or destructor; a destructor's return type is None."""
+
+    __slots__ = ("return_type", "params", "is_static")
+
+    def __init__(self, return_type: Any, params: List[Parameter], is_static: bool):
+        self.return_type = return_type
+        self.params = params
+        self.is_static = is_static
+
+
+class LocalSymbol:
+    """A variable, constant or parameter, or `this` or `io`, in a local scope."""
+
+    __slots__ = ("type", "is_final", "initialized")
+
+    def __init__(self, type: Any, is_final: bool, initialized: bool = False):
+        self.type = type
+        self.is_final = is_final
+        self.initialized = initialized
+
+
+class ClassSymbol:
+    """A class: its own members, and what `StaticChecker._index_class_hierarchy` derives.
+
+    `constructors` maps the tuple of parameter type signatures to each
+    constructor. `decl` is None for the built-in IO class.
+    """
+
+    __slots__ = (
+        "name", "decl", "parent", "attributes", "methods", "constructors", "destructor",
+        "enter", "exit", "root_parent", "all_attributes", "all_methods",
+    )
+
+    def __init__(self, name: str, decl: Optional[ClassDecl], parent: Optional[str]):
+        self.name = name
+        self.decl = decl
+        self.parent = parent
+        self.attributes: Dict[str, FieldSymbol] = {}
+        self.methods: Dict[str, MethodSymbol] = {}
+        self.constructors: Dict[tuple, MethodSymbol] = {}
+        self.destructor: Optional[MethodSymbol] = None
+        # Set by the hierarchy index
+        self.enter = self.exit = 0
+        self.root_parent: Optional[str] = None
+        self.all_attributes: Dict[str, FieldSymbol] = {}
+        self.all_methods: Dict[str, MethodSymbol] = {}
+
+
+class SymbolTable:
+    """Nested scopes of local symbols, innermost last.
+
+    `bindings` maps each name in scope to its innermost symbol, so `lookup`
+    is one dict access however deep the scopes are nested. Each scope maps
+    the names it declares to the symbol they shadow (None if there is
+    none): the scopes hold every name's stack of shadowed symbols, and
+    closing a scope pops the top of each stack it holds back into
+    `bindings`.
+    """
+
+    __slots__ = ("scopes", "bindings")
+
+    def __init__(self):
+        self.scopes: List[Dict[str, Optional[LocalSymbol]]] = []
+        self.bindings: Dict[str, LocalSymbol] = {}
+
+    def __len__(self) -> int:
+        """Number of open scopes."""
+        return len(self.scopes)
+
+    def enter_scope(self):
+        self.scopes.append({})
+
+    def exit_scope(self):
+        if self.scopes:
+            bindings = self.bindings
+            for name, shadowed in self.scopes.pop().items():
+                if shadowed is None:
+                    del bindings[name]
+                else:
+                    bindings[name] = shadowed
+
+    def truncate(self, depth: int):
+        """Close the scopes opened after the first `depth`."""
+        while len(self.scopes) > depth:
+            self.exit_scope()
+
+    def in_current_scope(self, name: str) -> bool:
+        return bool(self.scopes) and name in self.scopes[-1]
+
+    def declare(self, name: str, symbol: LocalSymbol):
+        """Bind `name` in the innermost scope, opening one if there is none."""
+        if not self.scopes:
+            self.enter_scope()
+        scope = self.scopes[-1]
+        if name not in scope:
+            scope[name] = self.bindings.get(name)
+        self.bindings[name] = symbol
+
+    def lookup(self, name: str) -> Optional[LocalSymbol]:
+        """The symbol `name` is bound to in the innermost scope binding it, or None."""
+        return self.bindings.get(name)
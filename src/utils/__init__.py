@@ -5,7 +5,10 @@ visitor patterns, and other common functionality.
 """
 
 from .nodes import *
-from .visitor import ASTVisitor
+from .visitor import ASTTransformer, ASTVisitor, node_classes
+from .flat import FlatAST
+from .ast_file import MappedAST, load_ast, save_ast
+from .ast_index import ASTIndex
 
 __all__ = [
     # Base classes
@@ -70,4 +73,13 @@ __all__ = [
     "NilLiteral",
     # Visitor
     "ASTVisitor",
+    "ASTTransformer",
+    "node_classes",
+    # Flat representation and AST files
+    "FlatAST",
+    "MappedAST",
+    "load_ast",
+    "save_ast",
+    # Node index
+    "ASTIndex",
 ]
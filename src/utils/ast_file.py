@@ -0,0 +1,152 @@
+"""
+Binary AST files for OPLang programming language.
+This module saves a parsed program in a compact binary format and loads it
+back by memory-mapping the file: the node table is used in place, and node
+objects are only built for the subtrees that are asked for.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Union
+
+from .flat import KINDS, FlatAST
+from .nodes import ASTNode
+
+
+# File layout, all little-endian:
+#   header:  magic, format version, number of sections
+#   table:   offset and byte length of each section, in SECTIONS order
+#   then the sections, each starting on an 8-byte boundary
+MAGIC = b"OPLAST\r\n"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+SECTION = struct.Struct("<QQ")
+ALIGNMENT = 8
+
+# The node table: the FlatAST arrays, stored as-is
+ARRAYS = ("kinds", "sizes", "lines", "columns", "ends", "first", "slots", "lists")
+TYPECODES = {name: getattr(FlatAST(), name).typecode for name in ARRAYS}
+SECTIONS = ("kind_names", "name_offsets", "name_data", "constants") + ARRAYS
+
+
+def _little_endian(data: array) -> bytes:
+    if sys.byteorder == "big":
+        data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def save_ast(root: Union[ASTNode, FlatAST], path: str) -> int:
+    """Write the tree under `root` (or an already flat AST) to `path`; returns the file size."""
+    flat = root if isinstance(root, FlatAST) else FlatAST.from_tree(root)
+    # The string table: the UTF-8 names back to back, and where each one starts
+    encoded = [name.encode("utf-8") for name in flat.names]
+    name_offsets = array("I", [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+    # Kind names let the loader reject a file written for other node classes
+    sections = [
+        "\n".join(cls.__name__ for cls in KINDS).encode("ascii"),
+        _little_endian(name_offsets),
+        b"".join(encoded),
+        "\n".join(("f" if isinstance(value, float) else "i") + repr(value)
+                  for value in flat.constants).encode("ascii"),
+    ]
+    sections.extend(_little_endian(getattr(flat, name)) for name in ARRAYS)
+
+    table, offset = [], HEADER.size + SECTION.size * len(sections)
+    for data in sections:
+        offset += -offset % ALIGNMENT
+        table.append(SECTION.pack(offset, len(data)))
+        offset += len(data)
+    with open(path, "wb") as file:
+        position = file.write(HEADER.pack(MAGIC, VERSION, len(sections)) + b"".join(table))
+        for data in sections:
+            position += file.write(b"\0" * (-position % ALIGNMENT))
+            position += file.write(data)
+    return position
+
+
+def load_ast(path: str) -> "MappedAST":
+    """Memory-map an AST file written by `save_ast`."""
+    return MappedAST(path)
+
+
+class MappedAST(FlatAST):
+    """A `FlatAST` whose arrays are views of a memory-mapped AST file.
+
+    Loading reads the header and the string table. The node table is
+    read in place through memoryviews, so scans such as `find` and
+    `nodes_of` touch only the pages they read. `to_tree(i)` builds node
+    objects for the subtree of node `i` only. Close the file (or use the
+    object as a context manager) once the views are no longer needed;
+    trees already built stay valid.
+    """
+
+    __slots__ = ("_mmap", "_views")
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = [memoryview(self._mmap)]
+        try:
+            self._load(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self, path: str):
+        data = self._views[0]
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path}: not an OPLang AST file")
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not an OPLang AST file")
+        if version != VERSION or count != len(SECTIONS):
+            raise ValueError(f"{path}: unsupported AST file version {version}")
+        sections = {}
+        for i, name in enumerate(SECTIONS):
+            offset, length = SECTION.unpack_from(data, HEADER.size + i * SECTION.size)
+            if offset + length > len(data):
+                raise ValueError(f"{path}: truncated AST file")
+            sections[name] = data[offset:offset + length]
+            self._views.append(sections[name])
+
+        kind_names = bytes(sections["kind_names"]).decode("ascii").split("\n")
+        if kind_names != [cls.__name__ for cls in KINDS]:
+            raise ValueError(f"{path}: written for different AST node classes")
+
+        for name in ARRAYS:
+            if sys.byteorder == "big":
+                values = array(TYPECODES[name], bytes(sections[name]))
+                values.byteswap()
+            else:
+                values = sections[name].cast(TYPECODES[name])
+                self._views.append(values)
+            setattr(self, name, values)
+
+        offsets = array("I", bytes(sections["name_offsets"]))
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        name_data = bytes(sections["name_data"])
+        self.names = [name_data[offsets[i]:offsets[i + 1]].decode("utf-8")
+                      for i in range(len(offsets) - 1)]
+        self._name_ids = {name: i for i, name in enumerate(self.names)}
+        constants = bytes(sections["constants"]).decode("ascii")
+        self.constants = [float(text[1:]) if text[0] == "f" else int(text[1:])
+                          for text in constants.split("\n")] if constants else []
+
+    def close(self):
+        """Release the views and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
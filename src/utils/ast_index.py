@@ -0,0 +1,122 @@
+"""
+Node index for OPLang ASTs.
+This module numbers the nodes of a tree and records, for each node, its
+parent and its enclosing class and method, so tools can go from any node
+to its context without walking the tree again.
+"""
+
+from array import array
+from typing import List, Optional
+
+from .nodes import (
+    ASTNode,
+    ClassDecl,
+    ConstructorDecl,
+    DestructorDecl,
+    MethodDecl,
+)
+
+
+METHOD_CLASSES = (MethodDecl, ConstructorDecl, DestructorDecl)
+
+
+class ASTIndex:
+    """Dense ids, parents and enclosing declarations of the nodes of a tree.
+
+    Nodes are numbered 0, 1, ... in preorder from the root. For node id
+    `i`, `parents[i]`, `classes[i]` and `methods[i]` hold the ids of its
+    parent, of the `ClassDecl` containing it and of the method,
+    constructor or destructor containing it (the node itself if it is
+    one), or -1 if there is none. Every lookup is an array access.
+
+    Going from a node to its id goes through an open-addressing hash
+    table of node addresses held in two arrays, which takes a fraction of
+    the memory of a dict with one int object per key and value. A node
+    object that occurs more than once in the tree, like an interned type,
+    gets an id per occurrence; `id_of` returns the first. The index
+    describes the tree as it was built: rebuild it after the tree changes.
+    """
+
+    __slots__ = ("nodes", "parents", "classes", "methods", "_keys", "_values", "_mask")
+
+    def __init__(self, root: ASTNode):
+        self.nodes: List[ASTNode] = []
+        self.parents = array("i")
+        self.classes = array("i")
+        self.methods = array("i")
+        nodes, parents, classes, methods = self.nodes, self.parents, self.classes, self.methods
+        # Entries are (node, parent id, enclosing class id, enclosing method id)
+        stack = [(root, -1, -1, -1)]
+        while stack:
+            node, parent, class_id, method_id = stack.pop()
+            index = len(nodes)
+            if type(node) is ClassDecl:
+                class_id = index
+            elif isinstance(node, METHOD_CLASSES):
+                method_id = index
+            nodes.append(node)
+            parents.append(parent)
+            classes.append(class_id)
+            methods.append(method_id)
+            children = []
+            for name in node._fields:
+                value = getattr(node, name)
+                if type(value) is list:
+                    children.extend(value)
+                elif hasattr(value, "_fields"):  # only nodes have `_fields`
+                    children.append(value)
+            stack.extend((child, index, class_id, method_id) for child in reversed(children))
+        self._build_table()
+
+    def _build_table(self):
+        # At most half the slots are used, so probe sequences stay short.
+        # A key is the node's address (never 0, which marks an empty slot)
+        size = 1 << max(len(self.nodes) * 2 - 1, 1).bit_length()
+        keys = self._keys = array("Q", bytes(8 * size))
+        values = self._values = array("i", bytes(4 * size))
+        mask = self._mask = size - 1
+        for index, node in enumerate(self.nodes):
+            key = id(node)
+            slot = (key >> 4) & mask  # objects are 16-byte aligned
+            while keys[slot] and keys[slot] != key:
+                slot = (slot + 1) & mask
+            if not keys[slot]:
+                keys[slot] = key
+                values[slot] = index
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def id_of(self, node: ASTNode) -> int:
+        """Id of `node`; KeyError if it is not in the indexed tree."""
+        key, keys, mask = id(node), self._keys, self._mask
+        slot = (key >> 4) & mask
+        while keys[slot]:
+            if keys[slot] == key:
+                return self._values[slot]
+            slot = (slot + 1) & mask
+        raise KeyError(node)
+
+    def _node(self, index: int) -> Optional[ASTNode]:
+        return self.nodes[index] if index >= 0 else None
+
+    def parent(self, node: ASTNode) -> Optional[ASTNode]:
+        """The node directly containing `node`, or None for the root."""
+        return self._node(self.parents[self.id_of(node)])
+
+    def enclosing_class(self, node: ASTNode) -> Optional[ClassDecl]:
+        """The class declaration containing `node`, or None outside any class."""
+        return self._node(self.classes[self.id_of(node)])
+
+    def enclosing_method(self, node: ASTNode) -> Optional[ASTNode]:
+        """The method, constructor or destructor containing `node`, or None outside them."""
+        return self._node(self.methods[self.id_of(node)])
+
+    def ancestors(self, node: ASTNode) -> List[ASTNode]:
+        """The nodes containing `node`, innermost first."""
+        result = []
+        index = self.parents[self.id_of(node)]
+        while index >= 0:
+            result.append(self.nodes[index])
+            index = self.parents[index]
+        return result
@@ -0,0 +1,266 @@
+"""
+Flat, array-backed representation of OPLang ASTs.
+This module encodes a tree of `nodes.py` objects as a handful of parallel
+arrays (struct-of-arrays), so that whole-program analyses can scan node
+kinds and fields without chasing pointers through Python objects.
+"""
+
+import gc
+import re
+from array import array
+from typing import Any, Iterator, List, Optional, Type as TypingType
+
+from .nodes import (
+    ASTNode,
+    END_BITS,
+    END_MASK,
+    COLUMN_MASK,
+    LINE_SHIFT,
+    Type,
+)
+from .visitor import node_classes
+
+
+# A node's kind is its index in KINDS, the concrete node classes
+KINDS = tuple(cls for cls in node_classes() if not getattr(cls, "__abstractmethods__", None))
+KIND_CODES = {cls: code for code, cls in enumerate(KINDS)}
+# Per kind: the class, its fields and whether its nodes are interned types
+_SHAPES = tuple((cls, cls._fields, issubclass(cls, Type)) for cls in KINDS)
+
+# A field value is one int: a tag in the low TAG_BITS bits and a payload above
+TAG_BITS = 3
+TAG_MASK = (1 << TAG_BITS) - 1
+TAG_NONE = 0    # None
+TAG_NODE = 1    # payload: index of the child node
+TAG_LIST = 2    # payload: offset of the list's length in `lists`, followed by its node indices
+TAG_NAME = 3    # payload: index in the `names` pool
+TAG_INT = 4     # payload: the int itself
+TAG_BOOL = 5    # payload: 0 or 1
+TAG_CONST = 6   # payload: index in the `constants` pool (floats, ints too wide for a slot)
+
+INT_LIMIT = 1 << (63 - TAG_BITS)
+
+
+class FlatAST:
+    """An AST stored as parallel arrays indexed by node number.
+
+    Nodes are numbered in preorder, so the subtree of node `i` is the
+    contiguous range `i .. i + sizes[i] - 1` and every child has a larger
+    number than its parent. Per node:
+
+    - `kinds[i]`: index of the node's class in `KINDS`
+    - `sizes[i]`: number of nodes in its subtree, itself included
+    - `lines[i]`, `columns[i]`, `ends[i]`: its source position (line 0 if unset)
+    - `first[i]`: offset of its fields in `slots`, one slot per name in `_fields`
+
+    Identifiers, operators and string values are interned in `names`;
+    floats and very large ints go to `constants`. Use `from_tree` and
+    `to_tree` to convert from and to `nodes.py` objects.
+    """
+
+    __slots__ = ("kinds", "sizes", "lines", "columns", "ends", "first", "slots",
+                 "lists", "names", "constants", "_name_ids")
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.sizes = array("I")
+        self.lines = array("I")
+        self.columns = array("I")
+        self.ends = array("Q")
+        self.first = array("I")
+        self.slots = array("q")
+        self.lists = array("I")
+        self.names: List[str] = []
+        self.constants: List[Any] = []
+        self._name_ids = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_tree(cls, root: ASTNode) -> "FlatAST":
+        """Encode the tree under `root`; `root` becomes node 0."""
+        flat = cls()
+        kinds, sizes, slots, lists = flat.kinds, flat.sizes, flat.slots, flat.lists
+        encode = flat._encode
+        # Entries are (node, array, offset) to store the node's index at once
+        # numbered, or (None, None, index) to close that node's subtree
+        stack = [(root, None, 0)]
+        while stack:
+            node, target, offset = stack.pop()
+            if node is None:
+                sizes[offset] = len(kinds) - offset
+                continue
+            index = len(kinds)
+            if target is slots:
+                slots[offset] = (index << TAG_BITS) | TAG_NODE
+            elif target is lists:
+                lists[offset] = index
+            kinds.append(KIND_CODES[type(node)])
+            sizes.append(0)
+            position = node._position
+            flat.lines.append(position >> LINE_SHIFT)
+            flat.columns.append((position >> END_BITS) & COLUMN_MASK)
+            flat.ends.append(position & END_MASK)
+            flat.first.append(len(slots))
+            stack.append((None, None, index))
+            children = []
+            for name in node._fields:
+                value = getattr(node, name)
+                if isinstance(value, ASTNode):
+                    children.append((value, slots, len(slots)))
+                    slots.append(TAG_NODE)
+                elif isinstance(value, list):
+                    slots.append((len(lists) << TAG_BITS) | TAG_LIST)
+                    lists.append(len(value))
+                    for item in value:
+                        children.append((item, lists, len(lists)))
+                        lists.append(0)
+                else:
+                    slots.append(encode(value))
+            stack.extend(reversed(children))
+        return flat
+
+    def to_tree(self, index: int = 0) -> ASTNode:
+        """Rebuild the subtree of node `index` as `nodes.py` objects."""
+        stop = index + self.sizes[index]
+        built: List[Optional[ASTNode]] = [None] * (stop - index)
+        # The new nodes form no cycles, so collecting while they are
+        # allocated only costs time
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            self._build(built, index, stop)
+        finally:
+            if collecting:
+                gc.enable()
+        return built[0]
+
+    def _build(self, built: list, index: int, stop: int):
+        kinds, first, slots, lists = self.kinds, self.first, self.slots, self.lists
+        lines, columns, ends = self.lines, self.columns, self.ends
+        decode = self._decode
+        # Children are numbered after their parent, so building backwards
+        # finds every child already built
+        for i in range(stop - 1, index - 1, -1):
+            cls, fields, interned = _SHAPES[kinds[i]]
+            values = []
+            offset = first[i]
+            for slot in slots[offset:offset + len(fields)]:
+                tag = slot & TAG_MASK
+                if tag == TAG_NODE:
+                    values.append(built[(slot >> TAG_BITS) - index])
+                elif tag == TAG_LIST:
+                    start = (slot >> TAG_BITS) + 1
+                    values.append([built[j - index] for j in lists[start:start + lists[start - 1]]])
+                else:
+                    values.append(decode(slot))
+            if interned:
+                # Through the constructor, so the type is interned
+                built[i - index] = cls(*values)
+                continue
+            node = cls.__new__(cls)
+            for name, value in zip(fields, values):
+                setattr(node, name, value)
+            node._position = (lines[i] << LINE_SHIFT) | (columns[i] << END_BITS) | ends[i]
+            built[i - index] = node
+
+    def _encode(self, value: Any) -> int:
+        if value is None:
+            return TAG_NONE
+        if isinstance(value, bool):
+            return (int(value) << TAG_BITS) | TAG_BOOL
+        if isinstance(value, str):
+            name_id = self._name_ids.get(value)
+            if name_id is None:
+                name_id = self._name_ids[value] = len(self.names)
+                self.names.append(value)
+            return (name_id << TAG_BITS) | TAG_NAME
+        if isinstance(value, int) and -INT_LIMIT <= value < INT_LIMIT:
+            return (value << TAG_BITS) | TAG_INT
+        self.constants.append(value)
+        return ((len(self.constants) - 1) << TAG_BITS) | TAG_CONST
+
+    def _decode(self, slot: int) -> Any:
+        tag, payload = slot & TAG_MASK, slot >> TAG_BITS
+        if tag == TAG_NAME:
+            return self.names[payload]
+        if tag == TAG_INT:
+            return payload
+        if tag == TAG_BOOL:
+            return bool(payload)
+        if tag == TAG_CONST:
+            return self.constants[payload]
+        if tag == TAG_NONE:
+            return None
+        raise ValueError(f"slot {slot} does not hold a scalar")
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+
+    def kind(self, index: int) -> TypingType[ASTNode]:
+        """Class of node `index`."""
+        return KINDS[self.kinds[index]]
+
+    def field(self, index: int, name: str) -> Any:
+        """Field `name` of node `index`: a node number for a child, a list of
+        node numbers for a list, or the plain value."""
+        cls = KINDS[self.kinds[index]]
+        slot = self.slots[self.first[index] + cls._fields.index(name)]
+        tag = slot & TAG_MASK
+        if tag == TAG_NODE:
+            return slot >> TAG_BITS
+        if tag == TAG_LIST:
+            start = (slot >> TAG_BITS) + 1
+            return self.lists[start:start + self.lists[start - 1]].tolist()
+        return self._decode(slot)
+
+    def children(self, index: int) -> List[int]:
+        """Numbers of the direct children of node `index`, in field order."""
+        children = []
+        start = self.first[index]
+        for slot in self.slots[start:start + len(KINDS[self.kinds[index]]._fields)]:
+            tag = slot & TAG_MASK
+            if tag == TAG_NODE:
+                children.append(slot >> TAG_BITS)
+            elif tag == TAG_LIST:
+                offset = (slot >> TAG_BITS) + 1
+                children.extend(self.lists[offset:offset + self.lists[offset - 1]])
+        return children
+
+    def subtree(self, index: int = 0) -> range:
+        """Numbers of every node under node `index`, itself first, in preorder."""
+        return range(index, index + self.sizes[index])
+
+    def nodes_of(self, *classes: TypingType[ASTNode], within: int = 0) -> Iterator[int]:
+        """Numbers of the nodes under node `within` whose class is one of
+        `classes` or a subclass of one, in preorder."""
+        codes = bytes(code for code, cls in enumerate(KINDS) if issubclass(cls, classes))
+        if not codes:
+            return iter(())
+        # One C-level scan over the kind bytes finds every candidate
+        pattern = re.compile(b"[" + re.escape(codes) + b"]")
+        kinds = memoryview(self.kinds).cast("B")
+        return (match.start() for match in
+                pattern.finditer(kinds, within, within + self.sizes[within]))
+
+    def find(self, cls: TypingType[ASTNode], name: str, value: Any, within: int = 0) -> List[int]:
+        """Numbers of the `cls` nodes under node `within` whose field `name`
+        holds `value`, for example every `MethodCall` to a given method."""
+        if isinstance(value, str):
+            if value not in self._name_ids:
+                return []
+        elif isinstance(value, float) or (isinstance(value, int) and not -INT_LIMIT <= value < INT_LIMIT):
+            return [i for i in self.nodes_of(cls, within=within) if self.field(i, name) == value]
+        encoded = self._encode(value)
+        slots, first = self.slots, self.first
+        offsets = {code: kind._fields.index(name) for code, kind in enumerate(KINDS)
+                   if issubclass(kind, cls)}
+        kinds = self.kinds
+        return [i for i in self.nodes_of(cls, within=within)
+                if slots[first[i] + offsets[kinds[i]]] == encoded]
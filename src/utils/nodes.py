@@ -4,19 +4,134 @@ This module defines all the AST node types used to represent
 the abstract syntax tree for OPLang programs.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
+from weakref import ref
 from typing import Any, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .visitor import ASTVisitor
 
 
+# A node's source position is one packed int: the end offset (one past its
+# last character) in the low bits, then the start column, then the start line.
+# The widths keep the int within two 30-bit digits (32 bytes) for sources of
+# up to 16 MB and a million lines. More lines only cost more bytes; wider
+# columns and offsets are clamped, see `set_position`
+END_BITS = 24
+COLUMN_BITS = 16
+LINE_SHIFT = END_BITS + COLUMN_BITS
+END_MASK = (1 << END_BITS) - 1
+COLUMN_MASK = (1 << COLUMN_BITS) - 1
+
+
+def _joined(items: list, separator: str = ", ") -> list:
+    """`items` with `separator` between each pair, for `_parts`."""
+    parts = [separator] * (2 * len(items) - 1)
+    parts[::2] = items
+    return parts
+
+
 class ASTNode(ABC):
-    """Base class for all AST nodes."""
+    """Base class for all AST nodes.
+
+    Nodes are slotted: each class lists the attributes it adds in
+    `__slots__`, and `_fields` holds every attribute of the class (except
+    the position) in constructor order, like the standard `ast` module.
+
+    Nodes hash and compare by structure: two nodes are equal when they
+    have the same class and equal fields, wherever they occur in the
+    source. Like a tuple's, the hash is computed from the fields on every
+    call and is never cached, so it always matches what the node holds
+    now; a node must still not be changed while it is a set element or a
+    dict key.
+    """
+
+    __slots__ = ("_position",)
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__base__._fields + tuple(
+            name for name in cls.__dict__.get("__slots__", ()) if name != "__weakref__")
 
     def __init__(self):
-        self.line = None
-        self.column = None
+        self._position = 0  # packed source position, see `set_position`
+
+    def set_position(self, line: int, column: int, end: int) -> "ASTNode":
+        """Record the start line and column and the end offset of the node's source text.
+
+        Columns and offsets too wide for their fields are clamped to the largest value.
+        """
+        if column > COLUMN_MASK or end > END_MASK:
+            column, end = min(column, COLUMN_MASK), min(end, END_MASK)
+        self._position = (line << LINE_SHIFT) | (column << END_BITS) | end
+        return self
+
+    @property
+    def line(self) -> Optional[int]:
+        """Line of the node's first token, or None if no position was recorded."""
+        return self._position >> LINE_SHIFT or None
+
+    @property
+    def column(self) -> Optional[int]:
+        """Column of the node's first token, or None if no position was recorded."""
+        if not self._position:
+            return None
+        return (self._position >> END_BITS) & COLUMN_MASK
+
+    @property
+    def end(self) -> Optional[int]:
+        """Offset just past the node's last character, or None if no position was recorded."""
+        if not self._position:
+            return None
+        return self._position & END_MASK
+
+    def __hash__(self):
+        # Hash children first without recursing, so that deep expression
+        # chains do not hit the recursion limit, and each node of a shared
+        # subtree once. Only nodes have `_fields`, and testing for it is
+        # cheaper than an isinstance check against the abstract base
+        hashes = {}
+        stack = [(self, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                hashes[id(node)] = hash((type(node),) + tuple(
+                    tuple(hashes[id(item)] if hasattr(item, "_fields") else item for item in value)
+                    if type(value) is list else
+                    hashes[id(value)] if hasattr(value, "_fields") else value
+                    for value in (getattr(node, name) for name in node._fields)))
+            elif id(node) not in hashes:
+                stack.append((node, True))
+                for name in node._fields:
+                    value = getattr(node, name)
+                    if type(value) is list:
+                        stack.extend((item, False) for item in value if hasattr(item, "_fields"))
+                    elif hasattr(value, "_fields"):
+                        stack.append((value, False))
+        return hashes[id(self)]
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, ASTNode):
+            return NotImplemented
+        stack = [(self, other)]
+        while stack:
+            a, b = stack.pop()
+            if a is b:
+                continue
+            if type(a) is not type(b):
+                return False
+            if type(a) is list:
+                if len(a) != len(b):
+                    return False
+                stack.extend(zip(a, b))
+            elif hasattr(a, "_fields"):
+                stack.extend((getattr(a, name), getattr(b, name)) for name in a._fields)
+            elif a != b:
+                return False
+        return True
 
     @abstractmethod
     def accept(self, visitor: "ASTVisitor", o: Any = None):
@@ -24,8 +139,40 @@ class ASTNode(ABC):
         pass
 
     def __str__(self):
-        """Default string representation."""
-        return f"{self.__class__.__name__}()"
+        chunks = []
+        self._print(chunks.append)
+        return "".join(chunks)
+
+    def write(self, out) -> None:
+        """Write the node's text, the same as `str(node)`, to the text stream `out`."""
+        self._print(out.write)
+
+    def _print(self, write) -> None:
+        # Each class lists its text as strings and child nodes in
+        # `_parts`; the children are expanded from a stack rather than by
+        # recursive `str` calls, so the text is built in one pass and deep
+        # trees do not hit the recursion limit. Any other value is written
+        # with `str`, as an f-string would
+        stack = [self]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            part = pop()
+            if type(part) is str:
+                write(part)
+                continue
+            try:
+                parts = part._parts()
+            except AttributeError:  # only nodes have `_parts`
+                if hasattr(part, "_parts"):
+                    raise
+                write(str(part))
+                continue
+            parts.reverse()
+            extend(parts)
+
+    def _parts(self) -> list:
+        """Text and child nodes making up the node's text, in order."""
+        return [f"{self.__class__.__name__}()"]
 
 
 # ============================================================================
@@ -36,6 +183,8 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire OPLang program."""
 
+    __slots__ = ("class_decls",)
+
     def __init__(self, class_decls: List["ClassDecl"]):
         super().__init__()
         self.class_decls = class_decls
@@ -43,17 +192,15 @@ class Program(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_program(self, o)
 
-    def __str__(self):
-        classes_str = (
-            ", ".join(str(c) for c in self.class_decls) if self.class_decls else ""
-        )
-        classes_part = f"[{classes_str}]" if classes_str else "[]"
-        return f"Program({classes_part})"
+    def _parts(self):
+        return ["Program([", *_joined(self.class_decls), "])"]
 
 
 class ClassDecl(ASTNode):
     """Class declaration node."""
 
+    __slots__ = ("name", "superclass", "members")
+
     def __init__(
         self, name: str, superclass: Optional[str], members: List["ClassMember"]
     ):
@@ -65,17 +212,15 @@ class ClassDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_class_decl(self, o)
 
-    def __str__(self):
+    def _parts(self):
         super_str = f", extends {self.superclass}" if self.superclass else ""
-        members_str = ", ".join(str(m) for m in self.members) if self.members else ""
-        members_part = f"[{members_str}]" if members_str else "[]"
-        return f"ClassDecl({self.name}{super_str}, {members_part})"
+        return [f"ClassDecl({self.name}{super_str}, [", *_joined(self.members), "])"]
 
 
 class ClassMember(ASTNode):
     """Base class for class members (attributes, methods, constructors, destructors)."""
 
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -86,6 +231,8 @@ class ClassMember(ASTNode):
 class AttributeDecl(ClassMember):
     """Attribute declaration node."""
 
+    __slots__ = ("is_static", "is_final", "attr_type", "attributes")
+
     def __init__(
         self,
         is_static: bool,
@@ -102,16 +249,18 @@ class AttributeDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_attribute_decl(self, o)
 
-    def __str__(self):
+    def _parts(self):
         static_str = "static " if self.is_static else ""
         final_str = "final " if self.is_final else ""
-        attrs_str = ", ".join(str(a) for a in self.attributes)
-        return f"AttributeDecl({static_str}{final_str}{self.attr_type}, [{attrs_str}])"
+        return [f"AttributeDecl({static_str}{final_str}", self.attr_type, ", [",
+                *_joined(self.attributes), "])"]
 
 
 class Attribute(ASTNode):
     """Individual attribute node."""
 
+    __slots__ = ("name", "init_value")
+
     def __init__(self, name: str, init_value: Optional["Expr"] = None):
         super().__init__()
         self.name = name
@@ -120,9 +269,10 @@ class Attribute(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_attribute(self, o)
 
-    def __str__(self):
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"Attribute({self.name}{init_str})"
+    def _parts(self):
+        if self.init_value:
+            return [f"Attribute({self.name} = ", self.init_value, ")"]
+        return [f"Attribute({self.name})"]
 
 
 # ============================================================================
@@ -133,6 +283,8 @@ class Attribute(ASTNode):
 class MethodDecl(ClassMember):
     """Method declaration node."""
 
+    __slots__ = ("is_static", "return_type", "name", "params", "body")
+
     def __init__(
         self,
         is_static: bool,
@@ -151,16 +303,17 @@ class MethodDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_method_decl(self, o)
 
-    def __str__(self):
+    def _parts(self):
         static_str = "static " if self.is_static else ""
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        params_part = f"[{params_str}]" if params_str else "[]"
-        return f"MethodDecl({static_str}{self.return_type} {self.name}({params_part}), {self.body})"
+        return [f"MethodDecl({static_str}", self.return_type, f" {self.name}([",
+                *_joined(self.params), "]), ", self.body, ")"]
 
 
 class ConstructorDecl(ClassMember):
     """Constructor declaration node."""
 
+    __slots__ = ("name", "params", "body")
+
     def __init__(self, name: str, params: List["Parameter"], body: "BlockStatement"):
         super().__init__()
         self.name = name
@@ -170,15 +323,15 @@ class ConstructorDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_constructor_decl(self, o)
 
-    def __str__(self):
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        params_part = f"[{params_str}]" if params_str else "[]"
-        return f"ConstructorDecl({self.name}({params_part}), {self.body})"
+    def _parts(self):
+        return [f"ConstructorDecl({self.name}([", *_joined(self.params), "]), ", self.body, ")"]
 
 
 class DestructorDecl(ClassMember):
     """Destructor declaration node."""
 
+    __slots__ = ("name", "body")
+
     def __init__(self, name: str, body: "BlockStatement"):
         super().__init__()
         self.name = name
@@ -187,13 +340,15 @@ class DestructorDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_destructor_decl(self, o)
 
-    def __str__(self):
-        return f"DestructorDecl(~{self.name}(), {self.body})"
+    def _parts(self):
+        return [f"DestructorDecl(~{self.name}(), ", self.body, ")"]
 
 
 class Parameter(ASTNode):
     """Method/Constructor parameter node."""
 
+    __slots__ = ("param_type", "name")
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
@@ -202,8 +357,8 @@ class Parameter(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_parameter(self, o)
 
-    def __str__(self):
-        return f"Parameter({self.param_type} {self.name})"
+    def _parts(self):
+        return ["Parameter(", self.param_type, f" {self.name})"]
 
 
 # ============================================================================
@@ -211,15 +366,73 @@ class Parameter(ASTNode):
 # ============================================================================
 
 
-class Type(ASTNode):
-    """Base class for type annotations."""
+class InternedMeta(ABCMeta):
+    """Metaclass of interned node classes.
+
+    Constructing a node with the same arguments as an earlier one that is
+    still alive returns that earlier node, so each distinct value exists
+    once. Keyword arguments are matched to `_fields`, so `ClassType("A")`
+    and `ClassType(class_name="A")` are the same node. The table holds its
+    nodes weakly and forgets a node once nothing else refers to it.
+    """
+
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        cls._instances = {}  # arguments -> weak reference to the node
 
-    pass
+    def __call__(cls, *args, **kwargs):
+        if kwargs:
+            names = cls._fields[len(args):]
+            if len(kwargs) != len(names) or not all(name in kwargs for name in names):
+                # Let the constructor report the missing or unexpected argument
+                return super().__call__(*args, **kwargs)
+            args += tuple(kwargs[name] for name in names)
+        node_ref = cls._instances.get(args)
+        node = node_ref() if node_ref is not None else None
+        if node is None:
+            node = super().__call__(*args)
+            cls._instances[args] = ref(node, cls._forget(args))
+        return node
+
+    def _forget(cls, args):
+        """Weak reference callback dropping the entry for `args` once its node is gone."""
+        instances = cls._instances
+
+        def forget(node_ref):
+            if instances.get(args) is node_ref:
+                del instances[args]
+        return forget
+
+
+class Type(ASTNode, metaclass=InternedMeta):
+    """Base class for type annotations.
+
+    Types are interned: every mention of a type shares one node, so equal
+    types are the same object and a type node carries no source position.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def set_position(self, line: int, column: int, end: int) -> "Type":
+        """Interned types are shared between mentions and keep no position."""
+        return self
+
+    def __reduce__(self):
+        # Rebuild through the constructor, so copies and unpickled types are interned too
+        return self.__class__, tuple(getattr(self, name) for name in self._fields)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
 
 class PrimitiveType(Type):
     """Primitive type node."""
 
+    __slots__ = ("type_name",)
+
     def __init__(self, type_name: str):
         super().__init__()
         self.type_name = type_name  # "int", "float", "boolean", "string", "void"
@@ -227,13 +440,15 @@ class PrimitiveType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_primitive_type(self, o)
 
-    def __str__(self):
-        return f"PrimitiveType({self.type_name})"
+    def _parts(self):
+        return [f"PrimitiveType({self.type_name})"]
 
 
 class ArrayType(Type):
     """Array type node."""
 
+    __slots__ = ("element_type", "size")
+
     def __init__(self, element_type: Type, size: int):
         super().__init__()
         self.element_type = element_type
@@ -242,13 +457,15 @@ class ArrayType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_array_type(self, o)
 
-    def __str__(self):
-        return f"ArrayType({self.element_type}[{self.size}])"
+    def _parts(self):
+        return ["ArrayType(", self.element_type, f"[{self.size}])"]
 
 
 class ClassType(Type):
     """Class type node."""
 
+    __slots__ = ("class_name",)
+
     def __init__(self, class_name: str):
         super().__init__()
         self.class_name = class_name
@@ -256,13 +473,15 @@ class ClassType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_class_type(self, o)
 
-    def __str__(self):
-        return f"ClassType({self.class_name})"
+    def _parts(self):
+        return [f"ClassType({self.class_name})"]
 
 
 class ReferenceType(Type):
     """Reference type node."""
 
+    __slots__ = ("referenced_type",)
+
     def __init__(self, referenced_type: Type):
         super().__init__()
         self.referenced_type = referenced_type
@@ -270,8 +489,8 @@ class ReferenceType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_reference_type(self, o)
 
-    def __str__(self):
-        return f"ReferenceType({self.referenced_type} &)"
+    def _parts(self):
+        return ["ReferenceType(", self.referenced_type, " &)"]
 
 
 # ============================================================================
@@ -282,12 +501,14 @@ class ReferenceType(Type):
 class Statement(ASTNode):
     """Base class for all statement nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BlockStatement(Statement):
     """Block statement containing variable declarations and statements."""
 
+    __slots__ = ("var_decls", "statements")
+
     def __init__(self, var_decls: List["VariableDecl"], statements: List[Statement]):
         super().__init__()
         self.var_decls = var_decls
@@ -296,19 +517,19 @@ class BlockStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_block_statement(self, o)
 
-    def __str__(self):
-        vars_str = ", ".join(str(v) for v in self.var_decls) if self.var_decls else ""
-        vars_part = f"vars=[{vars_str}], " if vars_str else ""
-        stmts_str = (
-            ", ".join(str(s) for s in self.statements) if self.statements else ""
-        )
-        stmts_part = f"stmts=[{stmts_str}]" if stmts_str else "stmts=[]"
-        return f"BlockStatement({vars_part}{stmts_part})"
+    def _parts(self):
+        parts = ["BlockStatement("]
+        if self.var_decls:
+            parts += ["vars=[", *_joined(self.var_decls), "], "]
+        parts += ["stmts=[", *_joined(self.statements), "])"]
+        return parts
 
 
 class VariableDecl(ASTNode):
     """Variable declaration node."""
 
+    __slots__ = ("is_final", "var_type", "variables")
+
     def __init__(self, is_final: bool, var_type: Type, variables: List["Variable"]):
         super().__init__()
         self.is_final = is_final
@@ -318,15 +539,16 @@ class VariableDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_variable_decl(self, o)
 
-    def __str__(self):
+    def _parts(self):
         final_str = "final " if self.is_final else ""
-        vars_str = ", ".join(str(v) for v in self.variables)
-        return f"VariableDecl({final_str}{self.var_type}, [{vars_str}])"
+        return [f"VariableDecl({final_str}", self.var_type, ", [", *_joined(self.variables), "])"]
 
 
 class Variable(ASTNode):
     """Individual variable node."""
 
+    __slots__ = ("name", "init_value")
+
     def __init__(self, name: str, init_value: Optional["Expr"] = None):
         super().__init__()
         self.name = name
@@ -335,14 +557,17 @@ class Variable(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_variable(self, o)
 
-    def __str__(self):
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"Variable({self.name}{init_str})"
+    def _parts(self):
+        if self.init_value:
+            return [f"Variable({self.name} = ", self.init_value, ")"]
+        return [f"Variable({self.name})"]
 
 
 class AssignmentStatement(Statement):
     """Assignment statement."""
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs: "LHS", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs
@@ -351,13 +576,15 @@ class AssignmentStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_assignment_statement(self, o)
 
-    def __str__(self):
-        return f"AssignmentStatement({self.lhs} := {self.rhs})"
+    def _parts(self):
+        return ["AssignmentStatement(", self.lhs, " := ", self.rhs, ")"]
 
 
 class IfStatement(Statement):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+
     def __init__(
         self,
         condition: "Expr",
@@ -372,14 +599,19 @@ class IfStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_if_statement(self, o)
 
-    def __str__(self):
-        else_str = f", else {self.else_stmt}" if self.else_stmt else ""
-        return f"IfStatement(if {self.condition} then {self.then_stmt}{else_str})"
+    def _parts(self):
+        parts = ["IfStatement(if ", self.condition, " then ", self.then_stmt]
+        if self.else_stmt:
+            parts += [", else ", self.else_stmt]
+        parts.append(")")
+        return parts
 
 
 class ForStatement(Statement):
     """For statement."""
 
+    __slots__ = ("variable", "start_expr", "direction", "end_expr", "body")
+
     def __init__(
         self,
         variable: str,
@@ -398,39 +630,46 @@ class ForStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_for_statement(self, o)
 
-    def __str__(self):
-        return f"ForStatement(for {self.variable} := {self.start_expr} {self.direction} {self.end_expr} do {self.body})"
+    def _parts(self):
+        return [f"ForStatement(for {self.variable} := ", self.start_expr, f" {self.direction} ",
+                self.end_expr, " do ", self.body, ")"]
 
 
 class BreakStatement(Statement):
     """Break statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_break_statement(self, o)
 
-    def __str__(self):
-        return "BreakStatement()"
+    def _parts(self):
+        return ["BreakStatement()"]
 
 
 class ContinueStatement(Statement):
     """Continue statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_continue_statement(self, o)
 
-    def __str__(self):
-        return "ContinueStatement()"
+    def _parts(self):
+        return ["ContinueStatement()"]
 
 
 class ReturnStatement(Statement):
     """Return statement."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: "Expr"):
         super().__init__()
         self.value = value
@@ -438,13 +677,15 @@ class ReturnStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_return_statement(self, o)
 
-    def __str__(self):
-        return f"ReturnStatement(return {self.value})"
+    def _parts(self):
+        return ["ReturnStatement(return ", self.value, ")"]
 
 
 class MethodInvocationStatement(Statement):
     """Method invocation statement."""
 
+    __slots__ = ("method_call",)
+
     def __init__(self, method_call: "PostfixExpression"):
         super().__init__()
         self.method_call = method_call
@@ -452,8 +693,8 @@ class MethodInvocationStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_method_invocation_statement(self, o)
 
-    def __str__(self):
-        return f"MethodInvocationStatement({self.method_call})"
+    def _parts(self):
+        return ["MethodInvocationStatement(", self.method_call, ")"]
 
 
 # ============================================================================
@@ -464,12 +705,14 @@ class MethodInvocationStatement(Statement):
 class LHS(ASTNode):
     """Base class for left-hand side expressions in assignment."""
 
-    pass
+    __slots__ = ()
 
 
 class IdLHS(LHS):
     """Identifier left-hand side."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -477,13 +720,15 @@ class IdLHS(LHS):
     def accept(self, visitor, o=None):
         return visitor.visit_id_lhs(self, o)
 
-    def __str__(self):
-        return f"IdLHS({self.name})"
+    def _parts(self):
+        return [f"IdLHS({self.name})"]
 
 
 class PostfixLHS(LHS):
     """Postfix expression left-hand side (for member access, array access)."""
 
+    __slots__ = ("postfix_expr",)
+
     def __init__(self, postfix_expr: "PostfixExpression"):
         super().__init__()
         self.postfix_expr = postfix_expr
@@ -491,8 +736,8 @@ class PostfixLHS(LHS):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_lhs(self, o)
 
-    def __str__(self):
-        return f"PostfixLHS({self.postfix_expr})"
+    def _parts(self):
+        return ["PostfixLHS(", self.postfix_expr, ")"]
 
 
 # ============================================================================
@@ -503,12 +748,14 @@ class PostfixLHS(LHS):
 class Expr(ASTNode):
     """Base class for all expression nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -518,13 +765,15 @@ class BinaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_binary_op(self, o)
 
-    def __str__(self):
-        return f"BinaryOp({self.left}, {self.operator}, {self.right})"
+    def _parts(self):
+        return ["BinaryOp(", self.left, f", {self.operator}, ", self.right, ")"]
 
 
 class UnaryOp(Expr):
     """Unary operation expression."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '+', '-', '!'
@@ -533,13 +782,15 @@ class UnaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_unary_op(self, o)
 
-    def __str__(self):
-        return f"UnaryOp({self.operator}, {self.operand})"
+    def _parts(self):
+        return [f"UnaryOp({self.operator}, ", self.operand, ")"]
 
 
 class PostfixExpression(Expr):
     """Postfix expression for method calls, member access, array access."""
 
+    __slots__ = ("primary", "postfix_ops")
+
     def __init__(self, primary: Expr, postfix_ops: List["PostfixOp"]):
         super().__init__()
         self.primary = primary
@@ -548,20 +799,21 @@ class PostfixExpression(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_expression(self, o)
 
-    def __str__(self):
-        ops_str = "".join(str(op) for op in self.postfix_ops)
-        return f"PostfixExpression({self.primary}{ops_str})"
+    def _parts(self):
+        return ["PostfixExpression(", self.primary, *self.postfix_ops, ")"]
 
 
 class PostfixOp(ASTNode):
     """Base class for postfix operations."""
 
-    pass
+    __slots__ = ()
 
 
 class MethodCall(PostfixOp):
     """Method invocation postfix operation."""
 
+    __slots__ = ("method_name", "args")
+
     def __init__(self, method_name: str, args: List[Expr]):
         super().__init__()
         self.method_name = method_name
@@ -570,14 +822,15 @@ class MethodCall(PostfixOp):
     def accept(self, visitor, o=None):
         return visitor.visit_method_call(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f".{self.method_name}({args_str})"
+    def _parts(self):
+        return [f".{self.method_name}(", *_joined(self.args), ")"]
 
 
 class MemberAccess(PostfixOp):
     """Member access postfix operation."""
 
+    __slots__ = ("member_name",)
+
     def __init__(self, member_name: str):
         super().__init__()
         self.member_name = member_name
@@ -585,13 +838,15 @@ class MemberAccess(PostfixOp):
     def accept(self, visitor, o=None):
         return visitor.visit_member_access(self, o)
 
-    def __str__(self):
-        return f".{self.member_name}"
+    def _parts(self):
+        return [f".{self.member_name}"]
 
 
 class ArrayAccess(PostfixOp):
     """Array access postfix operation."""
 
+    __slots__ = ("index",)
+
     def __init__(self, index: Expr):
         super().__init__()
         self.index = index
@@ -599,13 +854,15 @@ class ArrayAccess(PostfixOp):
     def accept(self, visitor, o=None):
         return visitor.visit_array_access(self, o)
 
-    def __str__(self):
-        return f"[{self.index}]"
+    def _parts(self):
+        return ["[", self.index, "]"]
 
 
 class ObjectCreation(Expr):
     """Object creation expression."""
 
+    __slots__ = ("class_name", "args")
+
     def __init__(self, class_name: str, args: List[Expr]):
         super().__init__()
         self.class_name = class_name
@@ -614,14 +871,15 @@ class ObjectCreation(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_object_creation(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f"ObjectCreation(new {self.class_name}({args_str}))"
+    def _parts(self):
+        return [f"ObjectCreation(new {self.class_name}(", *_joined(self.args), "))"]
 
 
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -629,26 +887,30 @@ class Identifier(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_identifier(self, o)
 
-    def __str__(self):
-        return f"Identifier({self.name})"
+    def _parts(self):
+        return [f"Identifier({self.name})"]
 
 
 class ThisExpression(Expr):
     """This expression."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_this_expression(self, o)
 
-    def __str__(self):
-        return "ThisExpression(this)"
+    def _parts(self):
+        return ["ThisExpression(this)"]
 
 
 class ParenthesizedExpression(Expr):
     """Parenthesized expression."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Expr):
         super().__init__()
         self.expr = expr
@@ -656,8 +918,8 @@ class ParenthesizedExpression(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_parenthesized_expression(self, o)
 
-    def __str__(self):
-        return f"ParenthesizedExpression(({self.expr}))"
+    def _parts(self):
+        return ["ParenthesizedExpression((", self.expr, "))"]
 
 
 # ============================================================================
@@ -668,6 +930,8 @@ class ParenthesizedExpression(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -676,78 +940,89 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_literal(self, o)
 
-    def __str__(self):
-        return f"IntLiteral({self.value})"
+    def _parts(self):
+        return [f"IntLiteral({self.value})"]
 
 
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_literal(self, o)
 
-    def __str__(self):
-        return f"FloatLiteral({self.value})"
+    def _parts(self):
+        return [f"FloatLiteral({self.value})"]
 
 
 class BoolLiteral(Literal):
     """Boolean literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: bool):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_bool_literal(self, o)
 
-    def __str__(self):
+    def _parts(self):
         val_str = "True" if self.value else "False"
-        return f"BoolLiteral({val_str})"
+        return [f"BoolLiteral({val_str})"]
 
 
 class StringLiteral(Literal):
     """String literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_literal(self, o)
 
-    def __str__(self):
-        return f"StringLiteral({self.value!r})"
+    def _parts(self):
+        return [f"StringLiteral({self.value!r})"]
 
 
 class ArrayLiteral(Literal):
     """Array literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, elements: List[Expr]):
         super().__init__(elements)
 
     def accept(self, visitor, o=None):
         return visitor.visit_array_literal(self, o)
 
-    def __str__(self):
-        elements_str = ", ".join(str(elem) for elem in self.value) if self.value else ""
-        return f"ArrayLiteral({{{elements_str}}})"
+    def _parts(self):
+        return ["ArrayLiteral({", *_joined(self.value), "})"]
 
 
 class NilLiteral(Literal):
     """Nil literal expression."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(None)
 
     def accept(self, visitor, o=None):
         return visitor.visit_nil_literal(self, o)
 
-    def __str__(self):
-        return "NilLiteral(nil)"
+    def _parts(self):
+        return ["NilLiteral(nil)"]
\ No newline at end of file
@@ -4,19 +4,119 @@ This module defines the abstract visitor pattern interface for traversing
 and processing AST nodes.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Type as TypingType
+
+from .nodes import ASTNode, Type
 
 if TYPE_CHECKING:
     from .nodes import *
 
 
+def node_classes() -> list:
+    """Every node class, abstract ones included, depth first through the class hierarchy."""
+    classes, stack = [], [ASTNode]
+    while stack:
+        cls = stack.pop()
+        classes.append(cls)
+        stack.extend(reversed(cls.__subclasses__()))
+    return classes
+
+
+def _dispatch_table(cls) -> dict:
+    """Node class -> function named `cls.dispatch_name(node_class)`, for the classes `cls` has one for"""
+    table = {}
+    for node_class in node_classes():
+        method = getattr(cls, cls.dispatch_name(node_class), None)
+        if method is not None:
+            table[node_class] = method
+    return table
+
+
+def snake_case(name: str) -> str:
+    """`BinaryOp` -> `binary_op`, `IdLHS` -> `id_lhs`"""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).lower()
+
+
+def child_nodes(node: "ASTNode") -> list:
+    """The nodes directly under `node`, in field order."""
+    children = []
+    for name in node._fields:
+        value = getattr(node, name)
+        if type(value) is list:
+            children.extend(value)
+        elif hasattr(value, "_fields"):  # only nodes have `_fields`
+            children.append(value)
+    return children
+
+
+# Marks, on the traversal stack, that the node below it has been walked
+_LEAVE = object()
+
+
+def traverse(
+    root: "ASTNode",
+    pre: Optional[Callable[["ASTNode"], Any]] = None,
+    post: Optional[Callable[["ASTNode", list], Any]] = None,
+    children: Callable[["ASTNode"], Sequence["ASTNode"]] = child_nodes,
+):
+    """Walk the tree under `root` depth first with an explicit stack instead of recursion.
+
+    `pre(node)` runs before the node's children are walked; if it returns
+    False they are skipped. `post(node, results)` runs after them, with the
+    list of their results in order, and what it returns is the node's
+    result, passed on to its parent. `children(node)` picks the nodes to
+    walk into. Returns the result of `root`.
+    """
+    results = [[]]  # one list per open node, collecting its children's results
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is _LEAVE:
+            node = stack.pop()
+            child_results = results.pop()
+            results[-1].append(post(node, child_results) if post is not None else None)
+            continue
+        below = children(node) if pre is None or pre(node) is not False else ()
+        if not below:
+            results[-1].append(post(node, []) if post is not None else None)
+            continue
+        # `node` is finished when the marker above it is popped, after its children
+        stack.append(node)
+        stack.append(_LEAVE)
+        results.append([])
+        stack.extend(reversed(below))
+    return results[0][0]
+
+
 class ASTVisitor(ABC):
-    """Abstract base class for AST visitors."""
+    """Abstract base class for AST visitors.
+
+    Each visitor class gets a dispatch table, built once when the class is
+    created, that maps every node class to the function visiting it, so
+    `visit` costs one dict lookup instead of `accept` plus a method lookup.
+    The function for a node class is the method named by `dispatch_name`;
+    methods assigned on an instance are not seen by `visit`.
+    """
+
+    _dispatch: Dict[TypingType["ASTNode"], Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = _dispatch_table(cls)
+
+    @classmethod
+    def dispatch_name(cls, node_class: TypingType["ASTNode"]) -> str:
+        """Name of the method visiting nodes of `node_class`: `visit_binary_op` for `BinaryOp`."""
+        return "visit_" + snake_case(node_class.__name__)
 
     def visit(self, node: "ASTNode", o: Any = None):
         """Visit a node using the visitor pattern."""
-        return node.accept(self, o)
+        method = self._dispatch.get(type(node))
+        if method is None:
+            return node.accept(self, o)
+        return method(self, node, o)
 
     # Program and class declarations
     @abstractmethod
@@ -297,7 +397,7 @@ class BaseVisitor(ASTVisitor):
     def visit_method_invocation_statement(
         self, node: "MethodInvocationStatement", o: Any = None
     ):
-        self.visit(node.method_invocation, o)
+        self.visit(node.method_call, o)
 
     def visit_id_lhs(self, node: "IdLHS", o: Any = None):
         pass
@@ -372,3 +472,62 @@ class BaseVisitor(ASTVisitor):
 
     def visit_nil_literal(self, node: "NilLiteral", o: Any = None):
         pass
+
+
+class ASTTransformer:
+    """Base class for passes that rewrite an AST without changing it.
+
+    `transform` rebuilds the tree bottom up with an explicit stack. A
+    subclass defines `transform_<node class in snake_case>(node)` for the
+    nodes it rewrites: the method gets the node with its children already
+    transformed and returns its replacement, the node itself to keep it,
+    or None to drop it (from a list) or clear the field.
+
+    Updates are copy-on-write: a node is copied, keeping its position,
+    only when one of its children was replaced, so a pass that rewrites a
+    few nodes rebuilds just their ancestors and shares every untouched
+    subtree with the original tree.
+    """
+
+    _dispatch: Dict[TypingType["ASTNode"], Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = _dispatch_table(cls)
+
+    @classmethod
+    def dispatch_name(cls, node_class: TypingType["ASTNode"]) -> str:
+        """Name of the method rewriting nodes of `node_class`: `transform_binary_op` for `BinaryOp`."""
+        return "transform_" + snake_case(node_class.__name__)
+
+    def transform(self, node: "ASTNode") -> Optional["ASTNode"]:
+        """The rewritten tree under `node`; `node` itself if nothing changed."""
+        return traverse(node, post=self._rewrite)
+
+    def _rewrite(self, node: "ASTNode", children: list) -> Optional["ASTNode"]:
+        # `children` holds the transformed children, in `child_nodes` order
+        if children and any(new is not old for new, old in zip(children, child_nodes(node))):
+            values, i = [], 0
+            for name in node._fields:
+                value = getattr(node, name)
+                if type(value) is list:
+                    start, i = i, i + len(value)
+                    value = [item for item in children[start:i] if item is not None]
+                elif hasattr(value, "_fields"):
+                    value = children[i]
+                    i += 1
+                values.append(value)
+            node = self._copy(node, values)
+        method = self._dispatch.get(type(node))
+        return method(self, node) if method is not None else node
+
+    @staticmethod
+    def _copy(node: "ASTNode", values: list) -> "ASTNode":
+        cls = type(node)
+        if isinstance(node, Type):
+            return cls(*values)  # interned: equal types stay one node
+        copy = cls.__new__(cls)
+        for name, value in zip(cls._fields, values):
+            setattr(copy, name, value)
+        copy._position = node._position
+        return copy
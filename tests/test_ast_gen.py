@@ -1,4 +1,16 @@
-from tests.utils import ASTGenerator
+import gc
+
+import pytest
+
+from tests.utils import ASTGenerator, ASTGeneration
+from src.parsing import direct_source_to_ast, parse_source
+from src.utils.error_listener import SyntaxException
+from src.utils.ast_file import load_ast, save_ast
+from src.utils.flat import FlatAST
+from src.utils.nodes import (
+    COLUMN_MASK, END_MASK, ASTNode, ArrayType, BinaryOp, ClassType, IntLiteral, MethodCall, MethodDecl,
+    PrimitiveType,
+)
 
 
 def test_001():
@@ -126,3 +138,423 @@ def test_011():
     }"""
     expected = "Program([ClassDecl(TestClass, [DestructorDecl(~TestClass(), BlockStatement(vars=[VariableDecl(PrimitiveType(int), [Variable(x = IntLiteral(0))])], stmts=[]))])])"
     assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_012():
+    """Test long statement lists do not recurse per statement"""
+    body = "x := 1;\n" * 1500
+    source = "class TestClass { void main() { int x;\n" + body + "} }"
+    ast = ASTGenerator(source).generate()
+    statements = ast.class_decls[0].members[0].body.statements
+    assert len(statements) == 1500
+    assert str(statements[-1]) == "AssignmentStatement(IdLHS(x) := IntLiteral(1))"
+
+
+def test_013():
+    """Test many class members and declarators are flattened in order"""
+    members = "".join(f"int a{i}, b{i} := {i};\n" for i in range(600))
+    source = "class TestClass {\n" + members + "void f(int p; float q, r) {} }"
+    ast = ASTGenerator(source).generate()
+    class_members = ast.class_decls[0].members
+    assert len(class_members) == 601
+    assert str(class_members[599]) == "AttributeDecl(PrimitiveType(int), [Attribute(a599), Attribute(b599 = IntLiteral(599))])"
+    assert str(class_members[600]) == "MethodDecl(PrimitiveType(void) f([Parameter(PrimitiveType(int) p), Parameter(PrimitiveType(float) q), Parameter(PrimitiveType(float) r)]), BlockStatement(stmts=[]))"
+
+
+def _generation_list_elements(source):
+    """The AST of `source` and the total length of the lists ASTGeneration's `visit` calls returned.
+
+    A rule that rebuilds its list at every element, like `[first] + self.visit(rest)`,
+    returns every suffix of the list, so the total grows quadratically.
+    """
+    elements = 0
+
+    class CountingGeneration(ASTGeneration):
+        def visit(self, tree):
+            nonlocal elements
+            result = super().visit(tree)
+            if type(result) is list:
+                elements += len(result)
+            return result
+
+    ast = CountingGeneration().visit(ASTGenerator(source).parser.program())
+    return ast, elements
+
+
+def test_014():
+    """Test AST generation copies each list element a constant number of times"""
+    def source(n):
+        attributes = "".join(f"int a{i} := {i}, b{i};\n" for i in range(n))
+        params = ", ".join(f"p{i}" for i in range(n))
+        variables = ", ".join(f"v{i}" for i in range(n))
+        return f"class A {{\n{attributes}void g(int {params}) {{ int {variables};\n{'x := 0;' * n} }}\n}}"
+
+    elements = {}
+    for n in (1000, 2000, 10000):
+        ast, elements[n] = _generation_list_elements(source(n))
+        members = ast.class_decls[0].members
+        assert [a.name for decl in members[:-1] for a in decl.attributes] == \
+            [name for i in range(n) for name in (f"a{i}", f"b{i}")]
+        assert str(members[n - 1].attributes[0].init_value) == f"IntLiteral({n - 1})"
+        method = members[-1]
+        assert [p.name for p in method.params] == [f"p{i}" for i in range(n)]
+        assert [v.name for v in method.body.var_decls[0].variables] == [f"v{i}" for i in range(n)]
+        assert len(method.body.statements) == n
+    # Each added element adds the same number of list entries. Timings are in
+    # benchmarks/bench_deep_lists.py
+    assert elements[10000] - elements[2000] == 8 * (elements[2000] - elements[1000])
+
+
+def test_015():
+    """Test the direct parser builds the same AST as the parse-tree visitor"""
+    source = """class Base { int v; }
+    class TestClass extends Base {
+        static final int[3] SIZES := {1, 2, 3};
+        final static float PI := 3.14, E;
+        int & ref := v;
+        TestClass() {}
+        TestClass(TestClass other) { this.v := other.v; }
+        ~TestClass() {}
+        int & get(int a, b; Base[2] & c) { return a; }
+        static void main() {
+            final int x := 1 + 2 * 3 - -4 \\ 5 % 6;
+            Base[2] bs;
+            TestClass & t := new TestClass();
+            int[3] arr;
+            arr[0] := x;
+            bs[1].v := 2;
+            this.a.b[1].c := 3;
+            this.items[2] := 4;
+            new TestClass().get(1, 2, bs);
+            (t).get(1, 2, bs);
+            io.writeStrLn("s" ^ "t" ^ "u");
+            if (x < 2 == true) && !done || a.b[1] >= 3 then break; else if x == 1 then continue;
+            for i := (x) downto 0 do { x := -a.b.c(1)[2]; }
+            return nil;
+        }
+    }"""
+    expected = str(ASTGenerator(source).generate())
+    assert str(direct_source_to_ast(source)) == expected
+
+
+def test_016():
+    """Test the direct parser reports syntax errors like NewErrorListener"""
+    with pytest.raises(SyntaxException, match="Error on line 1 col 33: ;"):
+        direct_source_to_ast("class A { void main() { a.b[1][2]; } }")
+    with pytest.raises(SyntaxException, match="Error on line 1 col 14: main"):
+        direct_source_to_ast("class A { int main() {} }")
+
+
+def _positions(node, out):
+    """Class name, line, column and end offset of every node under `node`, depth first"""
+    if isinstance(node, ASTNode):
+        out.append((type(node).__name__, node.line, node.column, node.end))
+        for name in node._fields:
+            _positions(getattr(node, name), out)
+    elif isinstance(node, list):
+        for item in node:
+            _positions(item, out)
+    return out
+
+
+def test_017():
+    """Test every non-type AST node carries the start line/column and end offset of its source text"""
+    source = """class A {
+    int[2] xs := {1, 2};
+    void f(int a) {
+        this.xs[0] := a + 1;
+        if (a > 0) then io.writeInt(a);
+    }
+}"""
+    ast = ASTGenerator(source).generate()
+    positions = _positions(ast, [])
+    assert all(line is not None for name, line, _, _ in positions if not name.endswith("Type"))
+    method = ast.class_decls[0].members[1]
+    assert (method.line, method.column, source[:method.end].endswith("    }")) == (3, 4, True)
+    assignment = method.body.statements[0]
+    assert source[assignment.end - len("this.xs[0] := a + 1;"):assignment.end] == "this.xs[0] := a + 1;"
+    binary = assignment.rhs
+    assert (binary.line, binary.column, source[binary.end - 5:binary.end]) == (4, 22, "a + 1")
+    condition = method.body.statements[1].condition
+    assert (condition.line, condition.column) == (5, 12)
+    assert _positions(direct_source_to_ast(source), []) == positions
+    # Positions past the field widths clamp instead of spilling into the line
+    far = IntLiteral(1).set_position(2_000_000, COLUMN_MASK + 5, END_MASK + 5)
+    assert (far.line, far.column, far.end) == (2_000_000, COLUMN_MASK, END_MASK)
+
+
+def test_018():
+    """Test type nodes are interned and shared between ASTs, copies and pickles"""
+    import copy
+    import pickle
+
+    source = """class A { int[3] xs; A a; }
+class B { int[3] ys; A f(int n) { return nil; } }"""
+    ast = ASTGenerator(source).generate()
+    first, second = ast.class_decls
+    array = ArrayType(PrimitiveType("int"), 3)
+    assert first.members[0].attr_type is array
+    assert second.members[0].attr_type is array
+    assert first.members[1].attr_type is second.members[1].return_type is ClassType("A")
+    assert second.members[1].params[0].param_type is PrimitiveType("int")
+    assert direct_source_to_ast(source).class_decls[1].members[0].attr_type is array
+    assert copy.deepcopy(array) is array
+    assert pickle.loads(pickle.dumps(array)) is array
+    assert array.line is None and ArrayType(PrimitiveType("int"), 4) is not array
+
+
+def test_019():
+    """Test the flat AST converts back losslessly and answers kind and field scans"""
+    source = """class A {
+    float w := 1.5;
+    int f(int n) { return this.g(n, "s"); }
+    int g(int n; string s) { io.writeInt(this.f(n - 1)); return 99999999999999999999; }
+}"""
+    ast = ASTGenerator(source).generate()
+    flat = FlatAST.from_tree(ast)
+    assert str(flat.to_tree()) == str(ast)
+    assert _positions(flat.to_tree(), []) == _positions(ast, [])
+    assert len(flat) == len(flat.subtree(0)) == len(_positions(ast, []))
+    calls = flat.find(MethodCall, "method_name", "f")
+    assert [str(flat.to_tree(i)) for i in calls] == [".f(BinaryOp(Identifier(n), -, IntLiteral(1)))"]
+    g = list(flat.nodes_of(MethodDecl))[1]
+    assert flat.field(g, "name") == "g" and calls[0] in flat.subtree(g)
+    assert flat.find(MethodCall, "method_name", "g", within=g) == []
+    assert flat.find(MethodCall, "method_name", "missing") == []
+    assert [flat.kind(i).__name__ for i in flat.children(g)] == ["PrimitiveType", "Parameter", "Parameter", "BlockStatement"]
+
+
+def test_020(tmp_path):
+    """Test an AST saved to a binary file loads back lazily and unchanged"""
+    source = """class A {
+    float w := 2.5e3;
+    string s := "na\u00efve";
+    int f(int n) { return this.f(n - 1); }
+}"""
+    ast = ASTGenerator(source).generate()
+    path = tmp_path / "a.ast"
+    assert save_ast(ast, path) == path.stat().st_size
+    with load_ast(path) as loaded:
+        assert str(loaded.to_tree()) == str(ast)
+        assert _positions(loaded.to_tree(), []) == _positions(ast, [])
+        (call,) = loaded.find(MethodCall, "method_name", "f")
+        assert str(loaded.to_tree(call)) == ".f(BinaryOp(Identifier(n), -, IntLiteral(1)))"
+    path.write_bytes(b"not an AST")
+    with pytest.raises(ValueError):
+        load_ast(path)
+
+
+def test_021():
+    """Test structural hashing and equality, and hash-consing of pure expressions"""
+    source = """class A {
+    int f(int x) {
+        x := (x + 1) * (x + 1);
+        io.writeInt(x + 1);
+        return this.f(x + 1) + this.f(x + 1);
+    }
+}"""
+    tree = parse_source(source)
+    plain = ASTGeneration().visit(tree)
+    consed = ASTGeneration(hash_cons=True).visit(tree)
+    assert plain == consed and hash(plain) == hash(consed) and str(plain) == str(consed)
+    assert plain != ASTGenerator(source.replace("x + 1);\n        return", "x + 2);\n        return")).generate()
+
+    body = consed.class_decls[0].members[0].body.statements
+    product = body[0].rhs
+    assert product.left is product.right
+    assert body[1].method_call.postfix_ops[0].args[0] is product.left.expr
+    # Method calls have side effects and are never shared
+    calls = body[2].value
+    assert calls.left == calls.right and calls.left is not calls.right
+    assert calls.left.postfix_ops[0].args[0] is product.left.expr
+
+    plain_body = plain.class_decls[0].members[0].body.statements
+    assert plain_body[0].rhs.left is not plain_body[0].rhs.right
+
+
+def test_022():
+    """Test visitors dispatch through a per-class table built from their methods"""
+    from src.utils.visitor import BaseVisitor
+
+    class Names(BaseVisitor):
+        def visit_identifier(self, node, o=None):
+            o.append(node.name)
+
+    class Calls(Names):
+        def visit_method_call(self, node, o=None):
+            o.append(node.method_name)
+            super().visit_method_call(node, o)
+
+    ast = direct_source_to_ast("class A { void f(int a) { io.writeInt(a + b); a := c; } }")
+    assert Names._dispatch[MethodCall] is BaseVisitor.visit_method_call
+    assert Calls._dispatch[MethodCall] is Calls.visit_method_call
+    names, calls = [], []
+    Names().visit(ast, names)
+    Calls().visit(ast, calls)
+    assert names == ["io", "a", "b", "c"]
+    assert calls == ["io", "writeInt", "a", "b", "c"]
+
+
+def test_023():
+    """Test the explicit-stack traversal passes child results up and honours skipped subtrees"""
+    from src.utils.visitor import traverse
+
+    ast = direct_source_to_ast("class A { int f() { return 1 + (2 * 3) + this.g(4); } }")
+    expr = ast.class_decls[0].members[0].body.statements[0].value
+    entered = []
+
+    def pre(node):
+        entered.append(type(node).__name__)
+        return type(node).__name__ != "PostfixExpression"
+
+    def post(node, results):
+        return 1 + sum(results)
+
+    assert traverse(expr, pre, post) == 8  # the call's subtree counts as one node
+    assert entered == ["BinaryOp", "BinaryOp", "IntLiteral", "ParenthesizedExpression",
+                       "BinaryOp", "IntLiteral", "IntLiteral", "PostfixExpression"]
+    assert traverse(ast, post=post) == len(_positions(ast, []))
+
+
+def test_024():
+    """Test transformers rebuild only the spine above rewritten nodes and leave the input unchanged"""
+    from src.utils.nodes import IntLiteral, ReturnStatement
+    from src.utils.visitor import ASTTransformer
+
+    class FoldProducts(ASTTransformer):
+        def transform_binary_op(self, node):
+            if node.operator == "*" and type(node.left) is type(node.right) is IntLiteral:
+                return IntLiteral(node.left.value * node.right.value)
+            return node
+
+    class DropReturns(ASTTransformer):
+        def transform_return_statement(self, node):
+            return None
+
+    source = """class A {
+    int f(int a) { io.writeInt(a + 2 * 3); return 2 * 3; }
+    int g() { return 1; }
+}"""
+    ast = direct_source_to_ast(source)
+    before = str(ast)
+    folded = FoldProducts().transform(ast)
+    assert str(ast) == before
+    assert "IntLiteral(6)" in str(folded) and "BinaryOp(IntLiteral(2)" not in str(folded)
+    f, g = ast.class_decls[0].members
+    new_f, new_g = folded.class_decls[0].members
+    assert new_f is not f and new_g is g
+    assert new_f.return_type is f.return_type and new_f.params[0] is f.params[0]
+    assert (new_f.line, new_f.column, new_f.end) == (f.line, f.column, f.end)
+    assert DropReturns().transform(new_g).body.statements == []
+    assert type(new_g.body.statements[0]) is ReturnStatement
+    assert ASTTransformer().transform(ast) is ast
+
+    class DropCallsAndFold(FoldProducts):
+        def transform_method_invocation_statement(self, node):
+            return None
+
+    statements = DropCallsAndFold().transform(f).body.statements
+    assert [str(statement) for statement in statements] == ["ReturnStatement(return IntLiteral(6))"]
+
+
+def test_025():
+    """Test the node index gives parents and enclosing class and method of any node"""
+    from src.utils.ast_index import ASTIndex
+
+    source = """class A {
+    int x := 1;
+    A() { this.x := 2; }
+    int f(int a) { if a > 0 then return a; return io.readInt(); }
+}
+class B extends A { }"""
+    ast = direct_source_to_ast(source)
+    index = ASTIndex(ast)
+    assert len(index) == len(_positions(ast, []))
+    a, b = ast.class_decls
+    attribute, constructor, method = a.members
+    if_stmt = method.body.statements[0]
+    condition = if_stmt.condition
+    assert index.id_of(ast) == 0 and index.parent(ast) is None
+    assert index.parent(condition) is if_stmt
+    assert index.enclosing_method(condition) is method
+    assert index.enclosing_class(condition) is a
+    assert index.enclosing_method(method) is method
+    assert index.enclosing_method(constructor.body.statements[0]) is constructor
+    assert index.enclosing_method(attribute.attributes[0]) is None
+    assert index.enclosing_class(b) is b and index.enclosing_class(ast) is None
+    assert index.ancestors(condition) == [if_stmt, method.body, method, a, ast]
+    assert index.nodes[index.id_of(condition)] is condition
+
+
+def test_026():
+    """Test printing a deep expression chain and writing it to a stream"""
+    import io
+
+    terms = " + ".join(["1", "-2", "(3 * 4)", "x"] * 25000)
+    ast = direct_source_to_ast("class Main { static void main() { x := " + terms + "; } }")
+    text = str(ast)
+    assert text.startswith(
+        "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), "
+        "BlockStatement(stmts=[AssignmentStatement(IdLHS(x) := BinaryOp(BinaryOp(")
+    assert text.endswith(", +, Identifier(x)))]))])])")
+    assert text.count("ParenthesizedExpression((BinaryOp(IntLiteral(3), *, IntLiteral(4))))") == 25000
+    out = io.StringIO()
+    ast.write(out)
+    assert out.getvalue() == text
+
+
+def test_027():
+    """Test hashing and equality follow a node that changes after it was hashed"""
+    node = BinaryOp(IntLiteral(1), "+", IntLiteral(2))
+    outer = BinaryOp(node, "*", IntLiteral(4))
+    hash(outer)
+    node.right = IntLiteral(3)
+    assert node == BinaryOp(IntLiteral(1), "+", IntLiteral(3))
+    assert hash(node) == hash(BinaryOp(IntLiteral(1), "+", IntLiteral(3)))
+    assert outer == BinaryOp(BinaryOp(IntLiteral(1), "+", IntLiteral(3)), "*", IntLiteral(4))
+    assert hash(outer) == hash(BinaryOp(BinaryOp(IntLiteral(1), "+", IntLiteral(3)), "*", IntLiteral(4)))
+    assert BinaryOp(IntLiteral(1), "+", IntLiteral(3)) in {node, outer}
+    assert BinaryOp(IntLiteral(1), "+", IntLiteral(2)) not in {node, outer}
+    # A shared subtree is hashed once per hash, not once per mention
+    shared = IntLiteral(0)
+    for _ in range(200):
+        shared = BinaryOp(shared, "+", shared)
+    assert hash(shared) == hash(shared)
+
+
+def test_028():
+    """Test interned types accept keyword arguments and are dropped once unused"""
+    element = PrimitiveType(type_name="float")
+    array = ArrayType(size=7, element_type=element)
+    assert element is PrimitiveType("float") and array is ArrayType(element, 7)
+    assert ClassType(class_name="Unused") is ClassType("Unused")
+    with pytest.raises(TypeError):
+        ClassType(name="A")
+    assert ("Unused",) not in ClassType._instances
+    del array
+    gc.collect()
+    assert (element, 7) not in ArrayType._instances
+
+
+def test_029():
+    """Test chained statement targets nest as before and both front ends agree"""
+    cases = {
+        "a[1].b.foo();": "MethodInvocationStatement(PostfixExpression(PostfixExpression("
+                         "Identifier(a)[IntLiteral(1)]).b.foo()))",
+        "a.b[1].c.foo();": "MethodInvocationStatement(PostfixExpression(PostfixExpression("
+                           "PostfixExpression(Identifier(a).b).c).foo()))",
+        "a[1].b.c := 1;": "AssignmentStatement(PostfixLHS(PostfixExpression(PostfixExpression("
+                          "Identifier(a)[IntLiteral(1)]).b.c)) := IntLiteral(1))",
+        "this.items[i].next.value := 1;": "AssignmentStatement(PostfixLHS(PostfixExpression("
+                                          "PostfixExpression(PostfixExpression(ThisExpression(this).items).next)"
+                                          ".value)) := IntLiteral(1))",
+        "this.x.y[1][2].z := 3;": "AssignmentStatement(PostfixLHS(PostfixExpression(PostfixExpression("
+                                  "PostfixExpression(PostfixExpression(PostfixExpression(ThisExpression(this).x).y)"
+                                  "[IntLiteral(1)])[IntLiteral(2)]).z)) := IntLiteral(3))",
+    }
+    for statement, expected in cases.items():
+        source = "class A { void g() { %s } }" % statement
+        ast = ASTGenerator(source).generate()
+        assert str(ast.class_decls[0].members[0].body.statements[0]) == expected
+        direct = direct_source_to_ast(source)
+        assert str(direct) == str(ast) and _positions(direct, []) == _positions(ast, [])
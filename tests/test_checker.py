@@ -1,5 +1,8 @@
 
 from utils import Checker
+from src.parsing import direct_source_to_ast
+from src.semantics.static_checker import StaticChecker
+from src.semantics.symbol_table import ClassSymbol, FieldSymbol, LocalSymbol, MethodSymbol, SymbolTable
 
 def test_001():
     """Test a valid program that should pass all checks"""
@@ -7383,3 +7386,152 @@ def test_vinh():
     expected = "IllegalMemberAccess(ThisExpression(this))"
     assert Checker(source).check_from_source() == expected
 
+
+def test_deep_expression():
+    """Test checking a 100k-term expression chain does not hit the recursion limit"""
+    terms = " + ".join(["1", "-2", "(3 * 4)", "x"] * 25000)
+    source = "class Main { static void main() { int x := 0; x := " + terms + "; io.writeInt(x); } }"
+    assert Checker(ast=direct_source_to_ast(source)).check_from_ast() == "Static checking passed"
+
+
+def test_deep_expression_error():
+    """Test reporting an error in a 100k-term expression chain prints the whole chain"""
+    terms = " + ".join(["1", "-2", "(3 * 4)", "x"] * 25000)
+    source = "class Main { static void main() { int x := 0; x := " + terms + " + \"a\"; } }"
+    result = Checker(ast=direct_source_to_ast(source)).check_from_ast()
+    assert result.startswith("TypeMismatchInExpression(BinaryOp(BinaryOp(BinaryOp(")
+    assert result.count("+, UnaryOp(-, IntLiteral(2))") == 25000
+    assert result.endswith(", +, Identifier(x)), +, StringLiteral('a')))")
+
+
+def test_collect_errors():
+    """Test collecting every static error, with undeclared types not cascading"""
+    source = """class A {
+    int x;
+    int x;
+    void f(Missing m; int k) {
+        int a := "one";
+        Missing b := nil;
+        m.run();
+        a := k + "two";
+        break;
+        b.value := 1;
+    }
+}"""
+    ast = direct_source_to_ast(source)
+    errors = [str(e) for e in StaticChecker().collect_errors(ast)]
+    assert errors == [
+        "Redeclared(Attribute, x)",
+        "UndeclaredClass(Missing)",
+        "TypeMismatchInStatement(VariableDecl(PrimitiveType(int), [Variable(a = StringLiteral('one'))]))",
+        "UndeclaredClass(Missing)",
+        "TypeMismatchInExpression(BinaryOp(Identifier(k), +, StringLiteral('two')))",
+        "MustInLoop(BreakStatement())",
+        "No Entry Point",
+    ]
+    assert Checker(ast=ast).check_from_ast() == errors[0]
+
+
+def test_deep_class_hierarchy():
+    """Test members and subtypes resolve through a 300-class inheritance chain"""
+    classes = ["class C0 { int a; int m() { return 0; } }"]
+    classes += ["class C%d extends C%d { float a%d; }" % (d, d - 1, d) for d in range(1, 300)]
+    classes.append("""class C300 extends C299 {
+    int m() { return this.a + 1; }
+    void f() {
+        C0 root := this;
+        C150 middle := new C300();
+        int x := root.m() + this.a;
+        float y := this.a150;
+        middle := root;
+    }
+}""")
+    ast = direct_source_to_ast("\n".join(classes))
+    errors = [str(e) for e in StaticChecker().collect_errors(ast, require_main=False)]
+    assert errors == ["TypeMismatchInStatement(AssignmentStatement(IdLHS(middle) := Identifier(root)))"]
+
+
+def test_inheritance_cycle():
+    """Test an inheritance cycle is reported at the class that extends a later one"""
+    source = """class A extends C { }
+class B extends A { }
+class C extends B { }
+class D extends D { }
+class E extends B { void f() { A a := new E(); } }"""
+    ast = direct_source_to_ast(source)
+    assert Checker(ast=ast).check_from_ast() == "UndeclaredClass(C)"
+    checker = StaticChecker()
+    errors = [str(e) for e in checker.collect_errors(ast, require_main=False)]
+    assert errors == ["UndeclaredClass(C)", "UndeclaredClass(D)"]
+    assert checker.ancestors("E") == ["E", "B", "A"]
+    order = checker.class_order
+    assert all(order.index(checker.class_table[name].parent) < order.index(name) for name in "BCE")
+
+
+def test_class_symbols():
+    """Test the class table holds typed symbols with inherited members indexed"""
+    source = """class A { final int x := 1; static float f(int n) { return 1.0; } A(int n) { } }
+class B extends A { int y; ~B() { } }"""
+    checker = StaticChecker()
+    assert checker.collect_errors(direct_source_to_ast(source), require_main=False) == []
+    a, b = checker.class_table["A"], checker.class_table["B"]
+    assert isinstance(b, ClassSymbol) and b.parent == "A"
+    x = b.all_attributes["x"]
+    assert isinstance(x, FieldSymbol) and x.is_final and not x.is_static and x is a.attributes["x"]
+    f = b.all_methods["f"]
+    assert isinstance(f, MethodSymbol) and f.is_static and f.return_type.type_name == "float"
+    assert [p.name for p in f.params] == ["n"]
+    assert len(a.constructors) == 1 and b.destructor.return_type is None
+
+
+def test_symbol_table_scopes():
+    """Test inner scopes shadow outer ones until they are closed"""
+    table = SymbolTable()
+    outer, inner = LocalSymbol("int", False), LocalSymbol("float", True)
+    table.declare("x", outer)
+    table.enter_scope()
+    assert table.lookup("x") is outer and not table.in_current_scope("x")
+    table.declare("x", inner)
+    assert table.lookup("x") is inner and len(table) == 2
+    table.truncate(1)
+    assert table.lookup("x") is outer and table.lookup("y") is None
+    table.exit_scope()
+    assert table.lookup("x") is None
+
+
+def test_symbol_table_shadowing():
+    """Test closing several scopes at once restores each name's outer binding"""
+    table = SymbolTable()
+    symbols = [LocalSymbol("int", False) for _ in range(4)]
+    for symbol in symbols:
+        table.enter_scope()
+        table.declare("x", symbol)
+        table.declare(f"y{len(table)}", symbol)
+    table.declare("x", symbols[0])
+    assert table.lookup("x") is symbols[0]
+    table.truncate(2)
+    assert table.lookup("x") is symbols[1] and table.lookup("y2") is symbols[1]
+    assert table.lookup("y3") is None
+    table.truncate(0)
+    assert table.lookup("x") is None and table.bindings == {}
+
+
+def test_deeply_nested_blocks():
+    """Test names resolve through many nested blocks and go out of scope after them"""
+    depth = 150
+    body = "".join(f"{{ int v{i} := {i};" for i in range(depth))
+    body += "v0 := v0 + v149;" + "}" * depth
+    source = f"class Main {{ static void main() {{ {body} }} }}"
+    assert Checker(ast=direct_source_to_ast(source)).check_from_ast() == "Static checking passed"
+    source = f"class Main {{ static void main() {{ {body} v0 := 1; }} }}"
+    assert Checker(ast=direct_source_to_ast(source)).check_from_ast() == "UndeclaredIdentifier(v0)"
+
+
+def test_inheritance_cycle_after_members():
+    """Test member redeclarations are reported before an inheritance cycle"""
+    source = """class A extends B { int x; int x; }
+class B extends A { }"""
+    ast = direct_source_to_ast(source)
+    assert Checker(ast=ast).check_from_ast() == "Redeclared(Attribute, x)"
+    errors = [str(e) for e in StaticChecker().collect_errors(ast, require_main=False)]
+    assert errors == ["Redeclared(Attribute, x)", "UndeclaredClass(B)"]
@@ -1,4 +1,8 @@
-from utils import Tokenizer
+import pytest
+
+from utils import Tokenizer, OPLangLexer, InputStream, Token
+from src.parsing import FastLexer
+from lexererr import ErrorToken
 
 
 def test_001():
@@ -82,4 +86,45 @@ def test_010():
     """Test operators and separators"""
     source = "+ - * / \\ % == != < <= > >= && || ! := ^ new . ( ) [ ] { } , ; :"
     expected = "+,-,*,/,\\,%,==,!=,<,<=,>,>=,&&,||,!,:=,^,new,.,(,),[,],{,},,,;,:,EOF"
-    assert Tokenizer(source).get_tokens_as_string() == expected
\ No newline at end of file
+    assert Tokenizer(source).get_tokens_as_string() == expected
+
+def test_011():
+    """Test FastLexer on operators, separators and the destructor '~'"""
+    source = "+ - * / \\ % == != < <= > >= && || ! := ^ new . ( ) [ ] { } , ; : ~"
+    expected = "+,-,*,/,\\,%,==,!=,<,<=,>,>=,&&,||,!,:=,^,new,.,(,),[,],{,},,,;,:,~,EOF"
+    assert Tokenizer(source, FastLexer).get_tokens_as_string() == expected
+
+
+def test_012():
+    """Test FastLexer on literals, comments and maximal munch"""
+    source = '12e 1.e3 1.5e+3 classes class /* a\n b */ x # c\n "a\\tb" 0.33E-3'
+    expected = "12,e,1.,e3,1.5e+3,classes,class,x,a\\tb,0.33E-3,EOF"
+    assert Tokenizer(source, FastLexer).get_tokens_as_string() == expected
+
+
+def test_013():
+    """Test FastLexer raises the same lexer errors as the generated lexer"""
+    for source in ['"Hello World', '"Hello\nWorld"', '"Hello \\x World"', '"a\\n"', "int x := 5; @ invalid", "a | b", '"\\']:
+        expected = Tokenizer(source).get_tokens_as_string()
+        assert Tokenizer(source, FastLexer).get_tokens_as_string() == expected
+
+
+def test_014():
+    """Test FastLexer token types and positions match the generated lexer"""
+    source = 'class A {\n\tfloat f := 1.5;  # note\n  /* multi\nline */ string s := "x";\n}\n'
+    generated, fast = OPLangLexer(InputStream(source)), FastLexer(source)
+    while True:
+        expected, token = generated.nextToken(), fast.nextToken()
+        assert (token.type, token.text, token.line, token.column, token.start, token.stop) == \
+            (expected.type, expected.text, expected.line, expected.column, expected.start, expected.stop)
+        if token.type == Token.EOF:
+            break
+
+
+def test_015():
+    """Test FastLexer.nextToken works called through the class and resumes after an error"""
+    lexer = FastLexer("a @ b")
+    assert FastLexer.nextToken(lexer).text == "a"
+    with pytest.raises(ErrorToken):
+        lexer.nextToken()
+    assert [FastLexer.nextToken(lexer).type for _ in range(2)] == [OPLangLexer.ID, Token.EOF]
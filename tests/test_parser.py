@@ -1,4 +1,21 @@
+import io
+import os
+import tempfile
+
+from antlr4 import InputStream, Token
+
 from utils import Parser
+from src.parsing import (
+    MmapCharStream,
+    compile_file,
+    create_parser,
+    create_streaming_parser,
+    direct_source_to_ast,
+    ll_parse,
+    source_to_ast,
+    stream_to_ast,
+    two_stage_parse,
+)
 
 
 def test_001():
@@ -112,3 +129,99 @@ def test_011():
     source = """class Test { int x := 1; """  # Thiếu dấu }
     expected = "Error on line 1 col 25: <EOF>"
     assert Parser(source).parse() == expected
+
+
+def test_012():
+    """Test two-stage (SLL then LL) parsing yields the same tree as full LL"""
+    source = """class Shape { float area() { return 0.0; } }
+    class Rect extends Shape {
+        float w, h;
+        Rect(float w; float h) { this.w := w; this.h := h; }
+        float area() { return this.w * this.h; }
+        static void main() {
+            Rect r := new Rect(2.0, 3.0);
+            if r.area() > 5.0 then io.writeFloatLn(r.area()); else io.writeStrLn("small");
+        }
+    }"""
+    sll_parser = create_parser(source)
+    ll_parser = create_parser(source)
+    sll_tree = two_stage_parse(sll_parser)
+    ll_tree = ll_parse(ll_parser)
+    assert sll_tree.toStringTree(recog=sll_parser) == ll_tree.toStringTree(recog=ll_parser)
+
+
+def test_013():
+    """Test the streaming front end builds the same AST as parsing the whole text"""
+    source = """class Shape { float area() { return 0.0; } }
+    class Rect extends Shape {
+        float w, h; # a comment
+        Rect(float w; float h) { this.w := w; this.h := h; }
+        /* a block
+           comment */
+        float area() { return this.w * this.h; }
+        static void main() {
+            Rect r := new Rect(2.0e+1, 3.0);
+            string s := "tab\\t" ^ "quote\\"";
+            if r.area() >= 5.0 then io.writeFloatLn(r.area()); else io.writeStrLn(s);
+        }
+    }"""
+    expected = str(source_to_ast(source))
+    for chunk_size in (1, 2, 3, 7, 1 << 16):
+        assert str(stream_to_ast(io.StringIO(source), chunk_size=chunk_size)) == expected
+
+
+def test_014():
+    """Test the streaming token stream only buffers the tokens the parser can rewind to"""
+    source = "".join(f"class C{i} {{ int x{i} := {i}; void f() {{ this.x{i} := x{i} + 1; }} }}\n" for i in range(200))
+    parser = create_streaming_parser(io.StringIO(source), chunk_size=64)
+    tokens = parser.getTokenStream()
+    window = 0
+    for _ in range(200):
+        parser.class_decl()
+        window = max(window, len(tokens._tokens))
+    assert tokens.LA(1) == Token.EOF
+    assert window < 50
+
+
+def test_015():
+    """Test the memory-mapped stream matches InputStream across UTF-8 block boundaries"""
+    import src.parsing.mmap_stream as mmap_stream
+
+    source = """class Main {
+        static void main() {
+            string s := "héllo wörld ✓"; # chú thích
+            io.writeStrLn(s);
+        }
+    }
+    """
+    expected = InputStream(source)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".op", delete=False) as file:
+        file.write(source)
+    try:
+        block_size = mmap_stream.BLOCK_SIZE
+        mmap_stream.BLOCK_SIZE = 5
+        try:
+            stream = MmapCharStream(file.name)
+        finally:
+            mmap_stream.BLOCK_SIZE = block_size
+        with stream:
+            assert stream.size == expected.size
+            for start in range(0, stream.size, 3):
+                stream.seek(start)
+                expected.seek(start)
+                assert stream.LA(1) == expected.LA(1)
+                assert stream.getText(start, start + 11) == expected.getText(start, start + 11)
+        assert str(compile_file(file.name)) == str(source_to_ast(source))
+    finally:
+        os.unlink(file.name)
+
+
+def test_016():
+    """Test member chains continue after an index in statements"""
+    for statement in ["a[1].b.foo();", "a.b[1].c.foo();", "a[1].b.c := 1;",
+                      "this.items[i].next.value := 1;", "a[1][2].b.c[3].d();", "a.f()[1].g()[2].h := 1;"]:
+        source = "class A { void g() { %s } }" % statement
+        assert Parser(source).parse() == "success", statement
+        assert str(direct_source_to_ast(source)) == str(source_to_ast(source)), statement
+    for statement in ["a[1][2] := 1;", "a.f()[1];", "a.b[1][2] := 1;"]:
+        assert Parser("class A { void g() { %s } }" % statement).parse() != "success", statement
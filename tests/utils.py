@@ -13,13 +13,14 @@ from build.OPLangParser import OPLangParser
 from src.utils.error_listener import NewErrorListener
 from src.astgen.ast_generation import ASTGeneration
 from src.semantics.static_checker import StaticChecker
+from src.parsing import two_stage_parse
 from src.utils.nodes import *
 
 
 class Tokenizer:
-    def __init__(self, input_string):
+    def __init__(self, input_string, lexer_class=OPLangLexer):
         self.input_stream = InputStream(input_string)
-        self.lexer = OPLangLexer(self.input_stream)
+        self.lexer = lexer_class(self.input_stream)
 
     def get_tokens(self):
         tokens = []
@@ -61,7 +62,7 @@ class Parser:
 
     def parse(self):
         try:
-            self.parser.program()  # Assuming 'program' is the entry point of your grammar
+            two_stage_parse(self.parser)
             return "success"
         except Exception as e:
             return str(e)
@@ -82,7 +83,7 @@ class ASTGenerator:
         """Generate AST from the input string."""
         try:
             # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            parse_tree = two_stage_parse(self.parser)
 
             # Generate AST using the visitor
             ast = self.ast_generator.visit(parse_tree)